@@ -0,0 +1,23 @@
+"""CrewAI hooks that stop agents of a cancelled research run.
+
+Registered globally on import; they only act inside a `cancel_scope()`
+whose event is set, so other crews are unaffected. A blocked LLM call
+fails the agent's task, which the crew turns into `ResearchCancelledError`.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from crewai.hooks import register_before_llm_call_hook, register_before_tool_call_hook
+
+from ...core.cancellation import is_cancelled
+
+
+def block_if_cancelled(context: Any) -> bool | None:
+    """Before-LLM / before-tool hook: False (block the call) once the run is cancelled."""
+    return False if is_cancelled() else None
+
+
+register_before_llm_call_hook(block_if_cancelled)
+register_before_tool_call_hook(block_if_cancelled)
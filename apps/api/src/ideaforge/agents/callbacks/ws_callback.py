@@ -1,23 +1,151 @@
-"""CrewAI callback that broadcasts events via WebSocket."""
+"""CrewAI callback that times each agent and broadcasts its lifecycle via WebSocket."""
 
 from __future__ import annotations
 
-from typing import Any
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
 
 import structlog
 
+from ...api.ws.events import agent_completed, agent_failed, agent_started
+
 logger = structlog.get_logger()
 
 
+@dataclass
+class AgentMetrics:
+    """Timing and usage of one agent within a research run."""
+
+    agent_name: str
+    status: str = "pending"
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    duration_seconds: float | None = None
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    steps: int = 0
+    tool_calls: int = 0
+    tool_seconds: float = 0.0
+    summary: str | None = None
+    error: str | None = None
+    _start: float = 0.0
+    _end: float | None = None
+
+    def usage(self) -> dict[str, Any]:
+        """Counters sent with the completion event and stored in `AgentRun.result_data`."""
+        return {
+            "duration_seconds": self.duration_seconds,
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "steps": self.steps,
+            "tool_calls": self.tool_calls,
+            "tool_seconds": round(self.tool_seconds, 3),
+        }
+
+
 class WebSocketCallback:
-    """Callback handler for CrewAI that forwards events to WebSocket."""
+    """Callback handler for CrewAI that forwards agent events to WebSocket.
+
+    The crew reports when each agent actually starts and finishes; CrewAI's
+    step and task callbacks (see `step_callback` / `task_callback`) count
+    reasoning steps and stamp the moment an agent's task is done. Events go
+    to `on_event` as WS payloads, and `metrics()` returns the per-agent
+    records for persistence.
+    """
 
-    def __init__(self, run_id: str, on_event: Any = None):
+    def __init__(self, run_id: str, on_event: Callable[[dict[str, Any]], None] | None = None):
         self.run_id = run_id
         self.on_event = on_event
+        self._agents: dict[str, AgentMetrics] = {}
+        self._lock = threading.Lock()
+
+    def agent_started(self, name: str) -> None:
+        with self._lock:
+            metrics = self._agent(name)
+            metrics.status = "running"
+            metrics.started_at = datetime.now(timezone.utc)
+            metrics._start = time.perf_counter()
+        logger.info("Agent started", run_id=self.run_id, agent=name)
+        self._emit(agent_started(self.run_id, name, started_at=metrics.started_at.isoformat()))
+
+    def agent_completed(self, name: str, summary: str = "Completed") -> None:
+        with self._lock:
+            metrics = self._finish(name, "completed")
+            metrics.summary = summary
+            usage = metrics.usage()
+        logger.info("Agent completed", run_id=self.run_id, agent=name, **usage)
+        self._emit(agent_completed(self.run_id, name, summary, metrics=usage))
+
+    def agent_failed(self, name: str, error: str) -> None:
+        with self._lock:
+            metrics = self._finish(name, "failed")
+            metrics.error = error
+            usage = metrics.usage()
+        logger.warning("Agent failed", run_id=self.run_id, agent=name, error=error, **usage)
+        self._emit(agent_failed(self.run_id, name, error, metrics=usage))
+
+    def record_usage(self, name: str, usage: Any) -> None:
+        """Add an agent's LLM usage (CrewAI `UsageMetrics` of its crew)."""
+        if usage is None:
+            return
+        with self._lock:
+            metrics = self._agent(name)
+            metrics.llm_calls += getattr(usage, "successful_requests", 0) or 0
+            metrics.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+            metrics.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+            metrics.total_tokens += getattr(usage, "total_tokens", 0) or 0
+
+    def tool_finished(self, name: str, seconds: float) -> None:
+        with self._lock:
+            metrics = self._agent(name)
+            metrics.tool_calls += 1
+            metrics.tool_seconds += seconds
+
+    def step_callback(self, name: str) -> Callable[[Any], None]:
+        """`Agent(step_callback=...)` for the named agent: counts ReAct steps."""
+        def on_step(step: Any) -> None:
+            with self._lock:
+                self._agent(name).steps += 1
+        return on_step
+
+    def task_callback(self, name: str) -> Callable[[Any], None]:
+        """`Task(callback=...)` for the named agent: marks when its task finished."""
+        def on_task_end(output: Any) -> None:
+            with self._lock:
+                self._agent(name)._end = time.perf_counter()
+            logger.debug("Task completed", run_id=self.run_id, agent=name, output=str(output)[:200])
+        return on_task_end
+
+    def metrics(self) -> list[AgentMetrics]:
+        with self._lock:
+            return list(self._agents.values())
+
+    def _agent(self, name: str) -> AgentMetrics:
+        metrics = self._agents.get(name)
+        if metrics is None:
+            metrics = self._agents[name] = AgentMetrics(agent_name=name)
+        return metrics
 
-    def on_task_start(self, task: Any):
-        logger.info("Task started", run_id=self.run_id, task=str(task)[:100])
+    def _finish(self, name: str, status: str) -> AgentMetrics:
+        metrics = self._agent(name)
+        end = metrics._end if metrics._end is not None else time.perf_counter()
+        metrics.status = status
+        metrics.completed_at = datetime.now(timezone.utc)
+        if metrics.started_at is not None:
+            metrics.duration_seconds = round(end - metrics._start, 3)
+        return metrics
 
-    def on_task_end(self, task: Any, output: Any):
-        logger.info("Task completed", run_id=self.run_id, output=str(output)[:200])
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event)
+        except Exception as e:
+            logger.debug("Event callback error", run_id=self.run_id, error=str(e))
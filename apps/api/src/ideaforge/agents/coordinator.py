@@ -4,21 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from concurrent.futures import Executor
+from functools import partial
 from typing import Any
 
 import structlog
 
 from ..api.ws.events import (
-    agent_completed,
-    agent_failed,
-    agent_started,
     research_completed,
     research_failed,
     research_started,
 )
 from ..api.ws.manager import ws_manager
 from ..config import AGENT_REGISTRY, LLM_PROVIDERS
-from ..core.token_tracker import TokenTracker
+from ..core.token_tracker import TokenTracker, usage_registry
+from ..services.agent_run_service import save_agent_runs
+from .callbacks.ws_callback import WebSocketCallback
 
 logger = structlog.get_logger()
 
@@ -43,10 +44,15 @@ class Coordinator:
         query: str,
         sources: list[str],
         llm_provider: str,
+        mode: str = "agents",
         cancel_event: threading.Event | None = None,
+        executor: Executor | None = None,
     ) -> list[dict[str, Any]]:
-        """Run a research pipeline with selected sources."""
-        logger.info("Starting research", run_id=run_id, query=query, sources=sources)
+        """Run a research pipeline with selected sources.
+
+        The crew runs in a thread of `executor` (the default executor if None).
+        """
+        logger.info("Starting research", run_id=run_id, query=query, sources=sources, mode=mode)
 
         # Broadcast start event
         await ws_manager.broadcast(
@@ -54,20 +60,17 @@ class Coordinator:
             research_started(run_id, query, sources),
         )
 
-        try:
-            from .crews.research_crew import ResearchCrew
-
-            # Capture current event loop for thread-safe callbacks
-            loop = asyncio.get_running_loop()
+        # Capture current event loop for thread-safe callbacks
+        loop = asyncio.get_running_loop()
 
-            async def on_start(name):
-                await ws_manager.broadcast("research", agent_started(run_id, name))
+        async def on_agent_event(event: dict):
+            await ws_manager.broadcast("research", event)
 
-            async def on_complete(name, summary):
-                await ws_manager.broadcast("research", agent_completed(run_id, name, summary))
+        # Per-agent lifecycle events and timings, saved as AgentRun rows at the end
+        agent_callback = WebSocketCallback(run_id, on_event=_make_callback(loop, on_agent_event))
 
-            async def on_error(name, error):
-                await ws_manager.broadcast("research", agent_failed(run_id, name, error))
+        try:
+            from .crews.research_crew import ResearchCrew
 
             async def on_token_update(snapshot: dict):
                 await ws_manager.broadcast("research", snapshot)
@@ -84,20 +87,20 @@ class Coordinator:
                 tpm_limit=tpm_limit,
                 on_update=_make_callback(loop, on_token_update),
             )
+            usage_registry.register(tracker)
 
             crew = ResearchCrew()
-            results = await asyncio.to_thread(
+            results = await loop.run_in_executor(executor, partial(
                 crew.run,
                 query=query,
                 selected_sources=sources,
                 llm_provider=llm_provider,
+                mode=mode,
                 run_id=run_id,
-                on_agent_start=_make_callback(loop, on_start),
-                on_agent_complete=_make_callback(loop, on_complete),
-                on_agent_error=_make_callback(loop, on_error),
+                callback=agent_callback,
                 token_tracker=tracker,
                 cancel_event=cancel_event,
-            )
+            ))
 
             # Broadcast final token usage + completion
             await ws_manager.broadcast("research", tracker.snapshot())
@@ -116,6 +119,10 @@ class Coordinator:
             )
             raise
 
+        finally:
+            usage_registry.unregister(run_id)
+            await save_agent_runs(run_id, llm_provider, agent_callback.metrics())
+
     def get_available_agents(self) -> list[dict]:
         """Return all registered agents with their metadata."""
         return [
@@ -0,0 +1,170 @@
+"""Compiled crew blueprints — agent/task templates parsed once from YAML.
+
+`agents.yaml` and `tasks.yaml` are parsed into pre-split prompt templates
+the first time they are needed and re-parsed only when a file's mtime
+changes, so editing the YAML takes effect without a restart. Tool
+instances are stateless and shared between runs.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+from typing import Any
+
+import structlog
+import yaml
+from crewai.tools import BaseTool
+
+from ..tools import ANALYSIS_TOOLS, TOOL_REGISTRY
+
+logger = structlog.get_logger()
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+BLUEPRINT_FILES = ("agents.yaml", "tasks.yaml")
+
+
+class PromptTemplate:
+    """Text with `{placeholders}`, split once so rendering is a join.
+
+    Placeholders without a value are left as-is instead of raising.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._parts: list[tuple[str, str | None]] = [
+            (literal, field) for literal, field, _, _ in Formatter().parse(text)
+        ]
+
+    def render(self, **values: Any) -> str:
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(values[field]) if field in values else f"{{{field}}}")
+        return "".join(out)
+
+
+@dataclass(frozen=True)
+class AgentBlueprint:
+    role: PromptTemplate
+    goal: PromptTemplate
+    backstory: PromptTemplate
+    verbose: bool = True
+
+    def render(self, **values: Any) -> dict[str, Any]:
+        """Keyword arguments for `crewai.Agent` (without tools and llm)."""
+        return {
+            "role": self.role.render(**values),
+            "goal": self.goal.render(**values),
+            "backstory": self.backstory.render(**values),
+            "verbose": self.verbose,
+        }
+
+
+@dataclass(frozen=True)
+class TaskBlueprint:
+    description: PromptTemplate
+    expected_output: PromptTemplate
+
+    def render(self, **values: Any) -> dict[str, Any]:
+        """Keyword arguments for `crewai.Task` (without agent and context)."""
+        return {
+            "description": self.description.render(**values),
+            "expected_output": self.expected_output.render(**values),
+        }
+
+
+class CrewBlueprint:
+    """Compiled agent and task templates from one version of the YAML files."""
+
+    def __init__(self, agents_config: dict[str, Any], tasks_config: dict[str, Any]):
+        self._agents_config = agents_config or {}
+        self._tasks_config = tasks_config or {}
+        self._agents: dict[str, AgentBlueprint] = {}
+        self._tasks: dict[str, TaskBlueprint] = {}
+        self._lock = threading.Lock()
+
+    def agent(self, key: str, role: str, goal: str, backstory: str) -> AgentBlueprint:
+        """Agent template for `key`, with defaults for fields missing in the YAML."""
+        with self._lock:
+            blueprint = self._agents.get(key)
+            if blueprint is None:
+                cfg = self._agents_config.get(key) or {}
+                blueprint = self._agents[key] = AgentBlueprint(
+                    role=PromptTemplate(cfg.get("role", role)),
+                    goal=PromptTemplate(cfg.get("goal", goal)),
+                    backstory=PromptTemplate(cfg.get("backstory", backstory)),
+                    verbose=cfg.get("verbose", True),
+                )
+            return blueprint
+
+    def researcher(self, source_id: str) -> AgentBlueprint:
+        """`<source>_researcher` template, or a generic researcher for the source."""
+        return self.agent(
+            f"{source_id}_researcher",
+            role=f"{source_id.replace('_', ' ').title()} Researcher",
+            goal=f"Research {source_id} for data about {{query}}",
+            backstory=f"You are an expert at using {source_id} to find business opportunities.",
+        )
+
+    def task(self, key: str, description: str, expected_output: str) -> TaskBlueprint:
+        with self._lock:
+            blueprint = self._tasks.get(key)
+            if blueprint is None:
+                cfg = self._tasks_config.get(key) or {}
+                blueprint = self._tasks[key] = TaskBlueprint(
+                    description=PromptTemplate(cfg.get("description", description)),
+                    expected_output=PromptTemplate(cfg.get("expected_output", expected_output)),
+                )
+            return blueprint
+
+
+class BlueprintCache:
+    """Current `CrewBlueprint` (reloaded on YAML change) and shared tool instances."""
+
+    def __init__(self, config_dir: Path):
+        self.config_dir = config_dir
+        self._blueprint: CrewBlueprint | None = None
+        self._mtimes: tuple[int, ...] = ()
+        self._tools: dict[str, BaseTool] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> CrewBlueprint:
+        mtimes = self._stat()
+        if self._blueprint is None or mtimes != self._mtimes:
+            with self._lock:
+                if self._blueprint is None or mtimes != self._mtimes:
+                    configs = [self._load(name) for name in BLUEPRINT_FILES]
+                    self._blueprint = CrewBlueprint(*configs)
+                    if self._mtimes:
+                        logger.info("Reloaded crew blueprint", config_dir=str(self.config_dir))
+                    self._mtimes = mtimes
+        return self._blueprint
+
+    def tool(self, source_id: str) -> BaseTool | None:
+        """Shared tool instance for a source (or analysis tool) ID."""
+        tool = self._tools.get(source_id)
+        if tool is None:
+            tool_class = TOOL_REGISTRY.get(source_id) or ANALYSIS_TOOLS.get(source_id)
+            if tool_class is None:
+                return None
+            with self._lock:
+                tool = self._tools.setdefault(source_id, tool_class())
+        return tool
+
+    def _stat(self) -> tuple[int, ...]:
+        return tuple(
+            os.stat(self.config_dir / name).st_mtime_ns for name in BLUEPRINT_FILES
+        )
+
+    def _load(self, filename: str) -> dict[str, Any]:
+        with open(self.config_dir / filename, "r") as f:
+            return yaml.safe_load(f) or {}
+
+
+# Global blueprint cache instance
+blueprint_cache = BlueprintCache(CONFIG_DIR)
@@ -4,21 +4,31 @@ from __future__ import annotations
 
 import json
 import threading
-from pathlib import Path
-from typing import Any, Callable
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
-import yaml
 import structlog
 from pydantic import BaseModel
 from crewai import Agent, Crew, Task, Process
-
-from ...core.llm_registry import get_llm
+from crewai.crews.crew_output import CrewOutput
+
+from ...config import AGENT_REGISTRY, LLM_PROVIDERS, settings
+from ...core.cancellation import (
+    ResearchCancelledError,
+    call_cancellable,
+    cancel_scope,
+    is_cancelled,
+    iter_completed,
+)
+from ...core.llm_registry import fork_llm
+from ...core.llm_router import get_routed_llm
 from ...core.token_tracker import TokenTracker
-from ..tools import TOOL_REGISTRY, SentimentAnalysisTool
-
-
-class ResearchCancelledError(Exception):
-    """Raised when research is cancelled by user."""
+from ..callbacks import cancel_hooks  # noqa: F401  (registers the cancellation hooks)
+from ..callbacks.ws_callback import WebSocketCallback
+from ..tools import ObservedTool
+from .blueprint import blueprint_cache
+from .sentiment_stage import format_context, score_sources
 
 
 class BusinessIdeaItem(BaseModel):
@@ -32,12 +42,41 @@ class BusinessIdeaItem(BaseModel):
 
 logger = structlog.get_logger()
 
-CONFIG_DIR = Path(__file__).parent.parent / "config"
+DIRECT_MODE = "direct"
+
+# Raw output of a source passed to the synthesizer in direct mode (characters)
+DIRECT_FINDINGS_CHARS = 4_000
+
+# Rough LLM load of one source agent while it researches (a few ReAct steps a minute)
+SOURCE_AGENT_RPM = 6
+SOURCE_AGENT_TPM = 6_000
+
+
+def source_fan_out(llm_provider: str, num_sources: int) -> int:
+    """How many source tasks may run at once for a provider.
 
+    Bounded by RESEARCH_PARALLELISM and by how many researching agents the
+    provider's rpm / tpm limits can sustain (1 = sequential).
+    """
+    limit = max(1, min(settings.research_parallelism, num_sources))
+    rate_limits = LLM_PROVIDERS.get(llm_provider, {}).get("rate_limits") or {}
+    if rate_limits.get("rpm"):
+        limit = min(limit, max(1, rate_limits["rpm"] // SOURCE_AGENT_RPM))
+    if rate_limits.get("tpm"):
+        limit = min(limit, max(1, rate_limits["tpm"] // SOURCE_AGENT_TPM))
+    return limit
 
-def _load_yaml(filename: str) -> dict:
-    with open(CONFIG_DIR / filename, "r") as f:
-        return yaml.safe_load(f)
+
+def _format_findings(findings: list[tuple[str, str]]) -> str:
+    """Raw source outputs as one block for the synthesizer (direct mode)."""
+    if not findings:
+        return ""
+    blocks = []
+    for source_id, output in findings:
+        name = AGENT_REGISTRY.get(source_id, {}).get("name", source_id)
+        text = output if len(output) <= DIRECT_FINDINGS_CHARS else output[:DIRECT_FINDINGS_CHARS] + "\n[...]"
+        blocks.append(f"=== {name} ({source_id}) ===\n{text}")
+    return "Research findings (raw data from each source):\n\n" + "\n\n".join(blocks)
 
 
 class ResearchCrew:
@@ -48,10 +87,9 @@ class ResearchCrew:
         query: str,
         selected_sources: list[str],
         llm_provider: str = "groq",
+        mode: str = "agents",
         run_id: str = "",
-        on_agent_start: Callable | None = None,
-        on_agent_complete: Callable | None = None,
-        on_agent_error: Callable | None = None,
+        callback: WebSocketCallback | None = None,
         token_tracker: TokenTracker | None = None,
         cancel_event: threading.Event | None = None,
     ) -> list[dict[str, Any]]:
@@ -60,140 +98,294 @@ class ResearchCrew:
         Args:
             query: The research query from the user.
             selected_sources: List of source IDs to include.
-            llm_provider: Which LLM provider to use.
+            llm_provider: The run's LLM provider; calls may fail over to others.
+            mode: "agents" (one LLM agent per source) or "direct" (tools are
+                called without an LLM and only the synthesizer uses one).
             run_id: Unique run identifier.
-            on_agent_start: Callback when an agent starts.
-            on_agent_complete: Callback when an agent finishes.
-            on_agent_error: Callback when an agent fails.
+            callback: Receives each agent's start, finish and usage.
             token_tracker: Optional token usage tracker.
             cancel_event: Optional threading event to signal cancellation.
 
         Returns:
             List of business ideas as dicts.
         """
-        agents_config = _load_yaml("agents.yaml")
-        tasks_config = _load_yaml("tasks.yaml")
-        llm = get_llm(llm_provider, token_tracker=token_tracker)
-
-        agents: list[Agent] = []
-        tasks: list[Task] = []
+        callback = callback or WebSocketCallback(run_id)
+        blueprint = blueprint_cache.get()
+        llm = get_routed_llm(llm_provider, token_tracker=token_tracker)
+        # Fail fast instead of failing every agent's first LLM call
+        llm.check_available()
+
+        # (source_id, tool) per selected source, and in agents mode (source_id, task);
+        # each task runs in its own single-agent crew
+        source_tools: list[tuple[str, ObservedTool]] = []
+        source_tasks: list[tuple[str, Task]] = []
+
+        # Raw tool outputs and published items per source, scored locally before synthesis
+        tool_outputs: dict[str, list[str]] = defaultdict(list)
+        tool_items: dict[str, list[str]] = defaultdict(list)
+        outputs_lock = threading.Lock()
+
+        def record_output(source_id: str, output: str) -> None:
+            with outputs_lock:
+                tool_outputs[source_id].append(output)
+
+        def record_items(source_id: str, texts: list[str]) -> None:
+            with outputs_lock:
+                tool_items[source_id].extend(texts)
 
         # Create research agents for each selected source
+        source_task = blueprint.task(
+            "research_source_task",
+            description="Research {query}",
+            expected_output="Research findings",
+        ).render(query=query)
         for source_id in selected_sources:
-            tool_class = TOOL_REGISTRY.get(source_id)
-            if not tool_class:
+            tool = blueprint_cache.tool(source_id)
+            if tool is None:
                 logger.warning("Unknown source", source_id=source_id)
                 continue
 
-            # Find matching agent config
-            agent_key = f"{source_id}_researcher"
-            agent_cfg = agents_config.get(agent_key)
-            if not agent_cfg:
-                # Fallback: use a generic researcher config
-                agent_cfg = {
-                    "role": f"{source_id.replace('_', ' ').title()} Researcher",
-                    "goal": f"Research {source_id} for data about {{query}}",
-                    "backstory": f"You are an expert at using {source_id} to find business opportunities.",
-                    "verbose": True,
-                }
+            tool_instance = ObservedTool.wrap(
+                tool, source_id,
+                on_result=record_output,
+                on_items=record_items,
+                on_call=callback.tool_finished,
+            )
+            source_tools.append((source_id, tool_instance))
+            if mode == DIRECT_MODE:
+                continue
 
-            tool_instance = tool_class()
             agent = Agent(
-                role=agent_cfg["role"],
-                goal=agent_cfg["goal"].format(query=query),
-                backstory=agent_cfg["backstory"],
+                **blueprint.researcher(source_id).render(query=query),
                 tools=[tool_instance],
-                llm=llm,
-                verbose=agent_cfg.get("verbose", True),
-            )
-            agents.append(agent)
-
-            task_cfg = tasks_config.get("research_source_task", {})
-            task = Task(
-                description=task_cfg.get("description", "Research {query}").format(query=query),
-                expected_output=task_cfg.get("expected_output", "Research findings"),
-                agent=agent,
+                llm=fork_llm(llm),
+                step_callback=callback.step_callback(source_id),
             )
-            tasks.append(task)
+            task = Task(**source_task, agent=agent, callback=callback.task_callback(source_id))
+            source_tasks.append((source_id, task))
 
-        if not agents:
+        if not source_tools:
             logger.error("No agents created", selected_sources=selected_sources)
             return []
 
-        # Add sentiment analyst
-        sentiment_cfg = agents_config.get("sentiment_analyst", {})
-        sentiment_agent = Agent(
-            role=sentiment_cfg.get("role", "Sentiment Analyst"),
-            goal=sentiment_cfg.get("goal", "Analyze sentiment").format(query=query),
-            backstory=sentiment_cfg.get("backstory", "You analyze text sentiment."),
-            tools=[SentimentAnalysisTool()],
-            llm=llm,
-            verbose=True,
-        )
-        agents.append(sentiment_agent)
-        tasks.append(Task(
-            description=f"Analyze the sentiment of all research findings about '{query}'.",
-            expected_output="Sentiment analysis summary with scores.",
-            agent=sentiment_agent,
-        ))
-
-        # Add synthesizer as final agent
-        synth_cfg = agents_config.get("research_synthesizer", {})
-        synthesizer = Agent(
-            role=synth_cfg.get("role", "Research Synthesizer"),
-            goal=synth_cfg.get("goal", "Synthesize findings").format(query=query),
-            backstory=synth_cfg.get("backstory", "You synthesize research into business ideas."),
-            llm=llm,
-            verbose=True,
+        logger.info(
+            "Running research crew",
+            run_id=run_id,
+            mode=mode,
+            num_agents=len(source_tasks) + 1,
+            sources=selected_sources,
         )
-        agents.append(synthesizer)
 
-        synth_task_cfg = tasks_config.get("synthesize_task", {})
-        synth_task = Task(
-            description=synth_task_cfg.get("description", "Synthesize findings for {query}").format(query=query),
-            expected_output=synth_task_cfg.get("expected_output", "JSON array of business ideas"),
-            agent=synthesizer,
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+
+        # Source phase: raw tool calls (direct) or independent agent tasks
+        findings: list[tuple[str, str]] = []
+        context_tasks: list[Task] = []
+        if mode == DIRECT_MODE:
+            findings = self._fetch_sources(source_tools, query, callback, cancel_event)
+            if not findings:
+                raise RuntimeError("All research sources failed")
+        else:
+            context_tasks = self._run_sources(
+                source_tasks,
+                source_fan_out(llm_provider, len(source_tasks)),
+                callback, cancel_event,
+            )
+            if not context_tasks:
+                raise RuntimeError("All research sources failed")
+
+        # Optional LLM sentiment analyst (local scores are always computed)
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+        if context_tasks and settings.sentiment_agent_enabled:
+            sentiment_agent = Agent(
+                **blueprint.agent(
+                    "sentiment_analyst",
+                    role="Sentiment Analyst",
+                    goal="Analyze sentiment",
+                    backstory="You analyze text sentiment.",
+                ).render(query=query),
+                tools=[blueprint_cache.tool("sentiment")],
+                llm=fork_llm(llm),
+                step_callback=callback.step_callback("sentiment"),
+            )
+            sentiment_task = Task(
+                description=f"Analyze the sentiment of all research findings about '{query}'.",
+                expected_output="Sentiment analysis summary with scores.",
+                agent=sentiment_agent,
+                context=list(context_tasks),
+            )
+            call_cancellable(cancel_event, self._kickoff, "sentiment", sentiment_task, callback)
+            context_tasks.append(sentiment_task)
+        else:
+            callback.agent_started("sentiment")
+
+        # Local sentiment stage: no LLM call, scores go straight to the synthesizer
+        sentiment = score_sources(tool_outputs, tool_items)
+        sentiment_context = format_context(sentiment)
+        logger.info(
+            "Scored source sentiment",
+            run_id=run_id,
+            items=sentiment["count"],
+            compound=round(sentiment["mean"]["compound"], 3),
         )
-        tasks.append(synth_task)
-
-        # Build and run crew
-        crew = Crew(
-            agents=agents,
-            tasks=tasks,
-            process=Process.sequential,
-            verbose=True,
+        callback.agent_completed(
+            "sentiment",
+            f"{sentiment['count']} items, {sentiment['label']} "
+            f"({sentiment['mean']['compound']:+.3f})",
         )
 
-        logger.info(
-            "Running research crew",
-            run_id=run_id,
-            num_agents=len(agents),
-            sources=selected_sources,
+        # Synthesizer waits on all sources and gets their outputs as context
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+        synthesizer = Agent(
+            **blueprint.agent(
+                "research_synthesizer",
+                role="Research Synthesizer",
+                goal="Synthesize findings",
+                backstory="You synthesize research into business ideas.",
+            ).render(query=query),
+            llm=fork_llm(llm),
+            step_callback=callback.step_callback("synthesizer"),
+        )
+        synth_task = blueprint.task(
+            "synthesize_task",
+            description="Synthesize findings for {query}",
+            expected_output="JSON array of business ideas",
+        ).render(query=query)
+        synth_task["description"] = "\n\n".join(
+            part for part in (synth_task["description"], _format_findings(findings), sentiment_context)
+            if part
         )
+        synth_task = Task(
+            **synth_task,
+            agent=synthesizer,
+            context=context_tasks,
+            callback=callback.task_callback("synthesizer"),
+        )
+        result = call_cancellable(cancel_event, self._kickoff, "synthesizer", synth_task, callback)
+        callback.agent_completed("synthesizer")
 
-        # Notify about each agent before kickoff, check cancellation
-        agent_names = selected_sources + ["sentiment", "synthesizer"]
-        for name in agent_names:
-            if cancel_event and cancel_event.is_set():
-                raise ResearchCancelledError("Research cancelled by user")
-            if on_agent_start:
-                try:
-                    on_agent_start(name)
-                except Exception:
-                    pass
+        # Parse result into list of ideas
+        return self._parse_results(result, run_id)
 
-        result = crew.kickoff()
+    def _run_sources(
+        self,
+        source_tasks: list[tuple[str, Task]],
+        fan_out: int,
+        callback: WebSocketCallback,
+        cancel_event: threading.Event | None,
+    ) -> list[Task]:
+        """Run each source task in its own crew, `fan_out` at a time.
+
+        A failing source is reported and skipped; returns the tasks that
+        completed, in selection order. On cancellation this returns without
+        waiting for running sources, which stop at their next LLM or tool call.
+        """
+        def run_source(source_id: str, task: Task) -> None:
+            with cancel_scope(cancel_event):
+                self._kickoff(source_id, task, callback)
+            callback.agent_completed(source_id)
 
-        # Notify completion for all agents
-        for name in agent_names:
-            if on_agent_complete:
+        done: set[str] = set()
+        pool = ThreadPoolExecutor(max_workers=fan_out, thread_name_prefix="research-source")
+        try:
+            futures = {
+                pool.submit(run_source, source_id, task): source_id
+                for source_id, task in source_tasks
+            }
+            for future in iter_completed(futures, cancel_event):
+                source_id = futures[future]
                 try:
-                    on_agent_complete(name, "Completed")
-                except Exception:
-                    pass
+                    future.result()
+                except ResearchCancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("Source research failed", source=source_id, error=str(e))
+                    continue
+                done.add(source_id)
+        finally:
+            pool.shutdown(wait=not (cancel_event and cancel_event.is_set()), cancel_futures=True)
+
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+        return [task for source_id, task in source_tasks if source_id in done]
+
+    def _fetch_sources(
+        self,
+        source_tools: list[tuple[str, ObservedTool]],
+        query: str,
+        callback: WebSocketCallback,
+        cancel_event: threading.Event | None,
+    ) -> list[tuple[str, str]]:
+        """Call every source tool with the query in parallel, without an LLM.
 
-        # Parse result into list of ideas
-        return self._parse_results(result, run_id)
+        Returns (source_id, raw output) for the sources that succeeded, in
+        selection order.
+        """
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+
+        def fetch(source_id: str, tool: ObservedTool) -> str:
+            callback.agent_started(source_id)
+            try:
+                with cancel_scope(cancel_event):
+                    output = str(tool.run(query=query))
+            except Exception as e:
+                callback.agent_failed(source_id, str(e))
+                raise
+            callback.agent_completed(source_id)
+            return output
+
+        outputs: dict[str, str] = {}
+        pool = ThreadPoolExecutor(max_workers=len(source_tools), thread_name_prefix="research-fetch")
+        try:
+            futures = {
+                pool.submit(fetch, source_id, tool): source_id
+                for source_id, tool in source_tools
+            }
+            for future in iter_completed(futures, cancel_event):
+                source_id = futures[future]
+                try:
+                    outputs[source_id] = future.result()
+                except ResearchCancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("Source fetch failed", source=source_id, error=str(e))
+        finally:
+            pool.shutdown(wait=not (cancel_event and cancel_event.is_set()), cancel_futures=True)
+
+        if cancel_event and cancel_event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+        return [(source_id, outputs[source_id]) for source_id, _ in source_tools if source_id in outputs]
+
+    @staticmethod
+    def _kickoff(name: str, task: Task, callback: WebSocketCallback) -> CrewOutput:
+        """Run one agent's task in its own crew, reporting its start and usage.
+
+        Failures are reported; completion is left to the caller. Runs inside
+        the run's `cancel_scope()`, so a cancelled run fails here or at the
+        agent's next LLM / tool call with `ResearchCancelledError`.
+        """
+        if is_cancelled():
+            raise ResearchCancelledError("Research cancelled by user")
+        callback.agent_started(name)
+        try:
+            output = Crew(
+                agents=[task.agent],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=True,
+            ).kickoff()
+        except Exception as e:
+            if is_cancelled():
+                callback.agent_failed(name, "Cancelled")
+                raise ResearchCancelledError("Research cancelled by user") from e
+            callback.agent_failed(name, str(e))
+            raise
+        callback.record_usage(name, output.token_usage)
+        return output
 
     def _parse_results(self, result: Any, run_id: str) -> list[dict]:
         """Parse crew output into structured business ideas."""
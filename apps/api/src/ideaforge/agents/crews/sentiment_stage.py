@@ -0,0 +1,86 @@
+"""Local sentiment stage: scores raw source tool output before synthesis.
+
+Runs between the source agents and the synthesizer without any LLM call.
+Each tool output is split into items (one post, story, video... per block),
+every item is scored with the shared VADER engine and the per-source and
+per-item scores are rendered into a compact block for the synthesizer.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from ...config import AGENT_REGISTRY
+from ...core.sentiment import sentiment_engine
+
+
+def split_items(output: str) -> list[str]:
+    """Split a tool's output into items: blank-line separated blocks, else lines."""
+    blocks = [b.strip() for b in output.split("\n\n") if b.strip()]
+    if len(blocks) <= 1:
+        blocks = [line.strip() for line in output.split("\n") if line.strip()]
+    # Single-line outputs are status messages ("not configured", "No results...")
+    return blocks if len(blocks) > 1 else []
+
+
+def score_sources(
+    outputs: dict[str, list[str]],
+    items: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """Score all items of all text sources in one batch.
+
+    `items` holds texts published directly by tools (e.g. every collected
+    post); for those sources they replace the items split from the output.
+
+    Returns the engine summary (with `by_source`) plus an `items` list of
+    (source, text, compound) tuples.
+    """
+    items = items or {}
+    texts: list[str] = []
+    sources: list[str] = []
+    for source in dict.fromkeys([*outputs, *items]):
+        if not AGENT_REGISTRY.get(source, {}).get("sentiment", True):
+            continue
+        if source in items:
+            source_items = [t for t in items[source] if t.strip()]
+        else:
+            source_items = [i for output in outputs.get(source, []) for i in split_items(output)]
+        texts.extend(source_items)
+        sources.extend([source] * len(source_items))
+
+    scores = sentiment_engine.score(texts)
+    summary = sentiment_engine.summarize(texts, sources=sources, scores=scores)
+    summary["items"] = list(zip(sources, texts, scores[:, 3].tolist()))
+    return summary
+
+
+def format_context(summary: dict[str, Any], items_per_source: int = 6) -> str:
+    """Render scores as a compact text block for the synthesizer task."""
+    if not summary["count"]:
+        return ""
+
+    dist = summary["distribution"]
+    lines = [
+        "Local sentiment scores (VADER compound, -1..+1) computed from the raw source data:",
+        f"Overall: {summary['label']} ({summary['mean']['compound']:+.3f}) over "
+        f"{summary['count']} items — {dist['positive']} positive / "
+        f"{dist['neutral']} neutral / {dist['negative']} negative",
+    ]
+
+    items = summary["items"]
+    for source, s in summary.get("by_source", {}).items():
+        d = s["distribution"]
+        lines.append(
+            f"\n{source}: {s['label']} ({s['mean']['compound']:+.3f}, {s['count']} items, "
+            f"{d['positive']}+/{d['neutral']}=/{d['negative']}-)"
+        )
+        # The most polarized items of the source, strongest first
+        own = list(dict.fromkeys((text, c) for src, text, c in items if src == source))
+        order = np.argsort([-abs(c) for _, c in own], kind="stable")[:items_per_source]
+        for i in order:
+            text, compound = own[i]
+            lines.append(f"  [{compound:+.2f}] {text.splitlines()[0][:100]}")
+
+    return "\n".join(lines)
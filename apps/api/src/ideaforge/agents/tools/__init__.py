@@ -13,6 +13,7 @@ from .bluesky_tool import BlueskyResearchTool
 from .package_trends import PackageTrendsTool
 from .economic_tool import EconomicDataTool
 from .sentiment import SentimentAnalysisTool
+from .observed import ObservedTool, publish_items
 
 # Registry: source_id -> tool class
 # Used by ResearchCrew to dynamically assemble crews from user-selected sources
@@ -52,4 +53,6 @@ __all__ = [
     "PackageTrendsTool",
     "EconomicDataTool",
     "SentimentAnalysisTool",
+    "ObservedTool",
+    "publish_items",
 ]
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
+
 import httpx
 from crewai.tools import BaseTool
 
-from ...config import settings
+from ...core.http_client import get_async_client, run_async
+from .observed import publish_items
+from .queries import split_queries
 
 BSKY_API = "https://public.api.bsky.app"
+SEARCH_PAGE_LIMIT = 100
+
+
+def engagement(post: dict[str, Any]) -> int:
+    """Local engagement score: reposts and quotes weigh more than likes."""
+    return (
+        post.get("likeCount", 0)
+        + 2 * post.get("repostCount", 0)
+        + 2 * post.get("quoteCount", 0)
+        + post.get("replyCount", 0)
+    )
 
 
 class BlueskyResearchTool(BaseTool):
@@ -17,37 +33,97 @@ class BlueskyResearchTool(BaseTool):
         "and community sentiment about business topics."
     )
 
+    # Collection budget: stop at max_posts unique posts or after deadline seconds
+    max_posts: int = 300
+    max_pages: int = 5
+    deadline: float = 10.0
+    concurrency: int = 4
+    max_display: int = 10
+
     def _run(self, query: str) -> str:
         try:
-            client = httpx.Client(timeout=15)
-            results = []
+            posts, pages = run_async(self.collect(query))
+            if not posts:
+                return f"No Bluesky results for '{query}'"
 
-            # Search posts (public API, no auth needed for search)
-            resp = client.get(
-                f"{BSKY_API}/xrpc/app.bsky.feed.searchPosts",
-                params={"q": query, "limit": 15},
-            )
+            # Every collected post goes to bulk sentiment scoring, not just the top ones
+            publish_items([p.get("record", {}).get("text", "") for p in posts])
 
-            if resp.status_code == 200:
-                data = resp.json()
-                for post in data.get("posts", []):
-                    record = post.get("record", {})
-                    text = record.get("text", "")
-                    author = post.get("author", {})
-                    handle = author.get("handle", "unknown")
-
-                    results.append(
-                        f"- @{handle}: {text[:300]}\n"
-                        f"  Likes: {post.get('likeCount', 0)} | "
-                        f"Reposts: {post.get('repostCount', 0)} | "
-                        f"Replies: {post.get('replyCount', 0)}\n"
-                        f"  Posted: {record.get('createdAt', 'unknown')}"
-                    )
-            else:
-                results.append(f"Bluesky search returned status {resp.status_code}")
+            results = [
+                f"Collected {len(posts)} unique posts from {pages} result pages; "
+                f"top {min(len(posts), self.max_display)} by engagement:"
+            ]
+            for post in posts[:self.max_display]:
+                record = post.get("record", {})
+                text = record.get("text", "")
+                author = post.get("author", {})
+                handle = author.get("handle", "unknown")
+
+                results.append(
+                    f"- @{handle}: {text[:300]}\n"
+                    f"  Likes: {post.get('likeCount', 0)} | "
+                    f"Reposts: {post.get('repostCount', 0)} | "
+                    f"Replies: {post.get('replyCount', 0)}\n"
+                    f"  Posted: {record.get('createdAt', 'unknown')}"
+                )
 
-            client.close()
-            return "\n\n".join(results[:10]) if results else f"No Bluesky results for '{query}'"
+            return "\n\n".join(results)
 
         except Exception as e:
             return f"Bluesky error: {str(e)}"
+
+    async def collect(self, query: str) -> tuple[list[dict[str, Any]], int]:
+        """Follow search cursors for every query variant within the post budget and deadline.
+
+        Returns unique posts (by URI) ranked by engagement, and the number of pages fetched.
+        """
+        client = get_async_client("bluesky")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        posts: dict[str, dict[str, Any]] = {}
+        pages = 0
+        errors: list[str] = []
+
+        async def follow(q: str, sort: str) -> None:
+            nonlocal pages
+            cursor = None
+            for _ in range(self.max_pages):
+                if len(posts) >= self.max_posts:
+                    return
+                params = {"q": q, "sort": sort, "limit": SEARCH_PAGE_LIMIT}
+                if cursor:
+                    params["cursor"] = cursor
+                async with semaphore:
+                    resp = await client.get(
+                        f"{BSKY_API}/xrpc/app.bsky.feed.searchPosts", params=params,
+                    )
+                if resp.status_code != 200:
+                    errors.append(f"status {resp.status_code}")
+                    return
+                data = resp.json()
+                pages += 1
+                for post in data.get("posts", []):
+                    if post.get("uri"):
+                        posts.setdefault(post["uri"], post)
+                cursor = data.get("cursor")
+                if not cursor or not data.get("posts"):
+                    return
+
+        variants = [
+            (q, sort)
+            for q in split_queries(query, 3) or [query]
+            for sort in ("top", "latest")
+        ]
+        tasks = [asyncio.create_task(follow(q, sort)) for q, sort in variants]
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, httpx.HTTPError):
+                raise error
+
+        if not posts and errors:
+            raise RuntimeError(f"Bluesky search returned {errors[0]}")
+
+        ranked = sorted(posts.values(), key=engagement, reverse=True)
+        return ranked[:self.max_posts], pages
@@ -2,9 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
+from datetime import datetime, timezone
+from typing import Any
+
 import httpx
 from crewai.tools import BaseTool
 
+from ...config import AGENT_REGISTRY
+from ...core.http_client import get_async_client, run_async
+from ...core.ttl_cache import TTLCache
+from .hn_index import tokenize
+from .queries import split_queries
+
+DEVTO_API = "https://dev.to/api/articles"
+
+# Per-tag article listings, shared by all runs: (tag, top_days) -> articles
+_tag_cache: TTLCache[list[dict[str, Any]]] = TTLCache(
+    ttl=AGENT_REGISTRY["devto"].get("cache_ttl") or 3600, max_size=256,
+)
+
+
+def query_tags(query: str, limit: int) -> list[str]:
+    """DEV.to tags for a query: each sub-query joined into one tag, then its words."""
+    tags: list[str] = []
+    for sub in split_queries(query, limit):
+        words = [w for w in sub.split() if tokenize(w)]
+        tags.append("".join(words))
+        tags.extend(words)
+    cleaned = (re.sub(r"[^a-z0-9]", "", t) for t in tags)
+    return list(dict.fromkeys(t for t in cleaned if t))[:limit]
+
+
+def rank(article: dict[str, Any], half_life_days: float, now: datetime) -> float:
+    """Engagement decayed by age, so recent articles outrank old classics."""
+    engagement = article.get("positive_reactions_count", 0) + 2 * article.get("comments_count", 0)
+    try:
+        published = datetime.fromisoformat(article["published_at"].replace("Z", "+00:00"))
+        age_days = max(0.0, (now - published).total_seconds() / 86_400)
+    except (KeyError, ValueError, AttributeError):
+        age_days = half_life_days * 4
+    return (1 + engagement) * 0.5 ** (age_days / half_life_days) * article["_matched_tags"]
+
 
 class DevToResearchTool(BaseTool):
     name: str = "devto_research"
@@ -13,50 +53,69 @@ class DevToResearchTool(BaseTool):
         "and startup-related articles."
     )
 
+    max_tags: int = 6
+    per_tag: int = 30
+    top_days: int = 30
+    half_life_days: float = 14.0
+    max_results: int = 10
+
     def _run(self, query: str) -> str:
         try:
-            client = httpx.Client(timeout=15)
-            results = []
+            tags = query_tags(query, self.max_tags)
+            if not tags:
+                return f"No DEV.to results for '{query}'"
+
+            listings = run_async(self._fetch_tags(tags))
 
-            # Search articles by tag/query
-            resp = client.get(
-                "https://dev.to/api/articles",
-                params={"tag": query.replace(" ", ","), "top": 7, "per_page": 10},
+            # Dedupe by article ID, counting how many requested tags each one matched
+            articles: dict[int, dict[str, Any]] = {}
+            for listing in listings:
+                for article in listing:
+                    entry = articles.setdefault(article["id"], {**article, "_matched_tags": 0})
+                    entry["_matched_tags"] += 1
+
+            now = datetime.now(timezone.utc)
+            ranked = sorted(
+                articles.values(),
+                key=lambda a: rank(a, self.half_life_days, now),
+                reverse=True,
             )
 
-            if resp.status_code != 200:
-                # Fallback: search by page
-                resp = client.get(
-                    "https://dev.to/api/articles",
-                    params={"page": 1, "per_page": 15, "top": 30},
+            results = []
+            for article in ranked[:self.max_results]:
+                results.append(
+                    f"- {article.get('title', '')}\n"
+                    f"  Tags: {article.get('tag_list', [])}\n"
+                    f"  Reactions: {article.get('positive_reactions_count', 0)} | "
+                    f"Comments: {article.get('comments_count', 0)} | "
+                    f"Reading time: {article.get('reading_time_minutes', 0)} min\n"
+                    f"  URL: {article.get('url', '')}\n"
+                    f"  Published: {article.get('published_at', '')}"
                 )
 
-            if resp.status_code == 200:
-                articles = resp.json()
-                query_lower = query.lower()
-
-                for article in articles:
-                    title = article.get("title", "")
-                    tags = article.get("tag_list", [])
-
-                    # Filter by relevance
-                    if (
-                        query_lower in title.lower()
-                        or any(query_lower in t.lower() for t in tags)
-                        or not query_lower  # Show all if no specific filter
-                    ):
-                        results.append(
-                            f"- {title}\n"
-                            f"  Tags: {tags}\n"
-                            f"  Reactions: {article.get('positive_reactions_count', 0)} | "
-                            f"Comments: {article.get('comments_count', 0)} | "
-                            f"Reading time: {article.get('reading_time_minutes', 0)} min\n"
-                            f"  URL: {article.get('url', '')}\n"
-                            f"  Published: {article.get('published_at', '')}"
-                        )
-
-            client.close()
-            return "\n\n".join(results[:10]) if results else f"No DEV.to results for '{query}'"
+            return "\n\n".join(results) if results else f"No DEV.to results for '{query}'"
 
         except Exception as e:
             return f"DEV.to error: {str(e)}"
+
+    async def _fetch_tags(self, tags: list[str]) -> list[list[dict[str, Any]]]:
+        client = get_async_client("devto")
+        return await asyncio.gather(*(self._fetch_tag(client, tag) for tag in tags))
+
+    async def _fetch_tag(self, client: httpx.AsyncClient, tag: str) -> list[dict[str, Any]]:
+        key = (tag, self.top_days, self.per_tag)
+        cached = _tag_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            resp = await client.get(
+                DEVTO_API,
+                params={"tag": tag, "top": self.top_days, "per_page": self.per_tag},
+            )
+        except httpx.HTTPError:
+            return []
+        if resp.status_code != 200:
+            return []
+        articles = [a for a in resp.json() if a.get("id") is not None]
+        _tag_cache.set(key, articles)
+        return articles
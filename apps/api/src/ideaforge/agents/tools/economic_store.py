@@ -0,0 +1,363 @@
+"""Persistent snapshot of economic indicators used by EconomicDataTool.
+
+World Bank and BLS series change at most monthly, so they are fetched
+concurrently into a JSON snapshot under `settings.data_dir` and refreshed
+on expiry (in the background) or by the periodic refresher started in the
+app lifespan. Interactive research runs read the local snapshot.
+
+The store also keeps a local catalog of World Bank (WDI) indicators so the
+tool can pick indicators that match a query without any network calls.
+Query-driven indicators missing from the snapshot are reported as
+unavailable and fetched in the background; the snapshot keeps at most
+`max_extra` of them, dropping ones no run has read within `extra_ttl`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from ...config import settings
+from ...core.http_client import get_async_client, run_async
+
+logger = structlog.get_logger()
+
+WORLD_BANK_API = "https://api.worldbank.org/v2"
+BLS_API = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
+
+# Indicators included in every snapshot: id -> (title, per_page, value format)
+BASE_INDICATORS: dict[str, tuple[str, int, str]] = {
+    "NY.GDP.MKTP.KD.ZG": ("US GDP Growth (World Bank)", 5, "{:.2f}%"),
+    "SL.UEM.TOTL.ZS": ("US Unemployment Rate", 5, "{:.1f}%"),
+    "IT.NET.USER.ZS": ("Internet Users (% population)", 3, "{:.1f}%"),
+}
+BLS_SERIES = "CES0000000001"  # Total nonfarm employment
+
+_WORD_RE = re.compile(r"[a-z]{3,}")
+_STOPWORDS = frozenset({"and", "for", "the", "with", "from", "business", "market", "ideas"})
+
+
+class EconomicSnapshotStore:
+    """Thread-safe, file-backed snapshot of economic series and the WB catalog."""
+
+    def __init__(
+        self,
+        data_dir: Path,
+        snapshot_ttl: float = 12 * 3600,
+        catalog_ttl: float = 30 * 86400,
+        max_related: int = 3,
+        retry_interval: float = 300.0,
+        max_extra: int = 30,
+        extra_ttl: float = 14 * 86400,
+    ):
+        self.snapshot_path = data_dir / "economic_snapshot.json"
+        self.catalog_path = data_dir / "worldbank_indicators.json"
+        self.snapshot_ttl = snapshot_ttl
+        self.catalog_ttl = catalog_ttl
+        self.max_related = max_related
+        self.retry_interval = retry_interval
+        self.max_extra = max_extra
+        self.extra_ttl = extra_ttl
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._snapshot: dict[str, Any] | None = None
+        self._catalog: dict[str, Any] | None = None
+        self._last_attempt = 0.0
+        # Indicators requested by runs but not in the snapshot yet
+        self._pending: set[str] = set()
+        self._pending_fetch: threading.Thread | None = None
+        self._last_pending_failure = 0.0
+
+    # --- Reads ---
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return the current snapshot, refreshing it if missing or expired.
+
+        An expired snapshot is served as-is while a background thread
+        refreshes it; only a cold start blocks on the network.
+        """
+        snapshot = self._load_snapshot()
+        if snapshot is None:
+            self.refresh()
+            return self._load_snapshot() or {"series": {}, "bls": [], "fetched_at": None}
+        if self._is_stale(snapshot.get("fetched_at"), self.snapshot_ttl):
+            threading.Thread(target=self.refresh, name="economic-refresh", daemon=True).start()
+        return snapshot
+
+    def related_indicators(self, query: str) -> list[dict[str, Any]]:
+        """Pick catalog indicators whose names best match the query (no network)."""
+        catalog = self._load_catalog()
+        words = {w for w in _WORD_RE.findall(query.lower()) if w not in _STOPWORDS}
+        if not catalog or not words:
+            return []
+
+        scored = []
+        for indicator in catalog["indicators"]:
+            if indicator["id"] in BASE_INDICATORS:
+                continue
+            name_words = set(_WORD_RE.findall(indicator["name"].lower()))
+            score = len(words & name_words)
+            if score:
+                scored.append((score, -len(indicator["name"]), indicator))
+        scored.sort(key=lambda s: (s[0], s[1]), reverse=True)
+        return [indicator for _, _, indicator in scored[:self.max_related]]
+
+    def get_series(self, indicator_ids: list[str]) -> dict[str, Any]:
+        """Return the snapshot's series for catalog indicators (no network).
+
+        Missing indicators are left out of the result and queued for a
+        background fetch, so a later run finds them.
+        """
+        snapshot = self.get_snapshot()
+        series = snapshot.get("series", {})
+        now = time.time()
+        with self._lock:
+            reads = snapshot.setdefault("extra_reads", {})
+            for indicator_id in indicator_ids:
+                reads[indicator_id] = now
+            missing = [i for i in indicator_ids if i not in series]
+            self._pending.update(missing)
+        if missing:
+            self._start_pending_fetch()
+        return {i: series[i] for i in indicator_ids if i in series}
+
+    # --- Refresh ---
+
+    def refresh(self, force: bool = False) -> None:
+        """Refetch all snapshot series (and the catalog if expired) concurrently."""
+        # Only a cold start waits for a refresh already in progress
+        blocking = self._load_snapshot() is None
+        if not self._refresh_lock.acquire(blocking=blocking):
+            return
+        try:
+            snapshot = self._load_snapshot()
+            if not force and snapshot and not self._is_stale(
+                snapshot.get("fetched_at"), self.snapshot_ttl
+            ):
+                return
+            # Don't hammer the APIs while they keep failing
+            if not force and time.time() - self._last_attempt < self.retry_interval:
+                return
+            self._last_attempt = time.time()
+
+            catalog = self._load_catalog()
+            refresh_catalog = catalog is None or self._is_stale(
+                catalog.get("fetched_at"), self.catalog_ttl
+            )
+            extra, reads = self._extra_indicators(snapshot)
+            series, bls, indicators = run_async(
+                _fetch_all(extra, refresh_catalog)
+            )
+
+            now = time.time()
+            with self._lock:
+                self._pending.difference_update(series)
+                if series or bls:
+                    self._snapshot = {
+                        "fetched_at": now, "series": series, "bls": bls, "extra_reads": reads,
+                    }
+                    self._write(self.snapshot_path, self._snapshot)
+                if indicators:
+                    self._catalog = {"fetched_at": now, "indicators": indicators}
+                    self._write(self.catalog_path, self._catalog)
+            logger.info(
+                "Economic snapshot refreshed",
+                series=len(series),
+                bls_points=len(bls),
+                catalog=len(indicators) if indicators else None,
+            )
+        except Exception as e:
+            logger.warning("Economic snapshot refresh failed", error=str(e))
+        finally:
+            self._refresh_lock.release()
+
+    def _extra_indicators(
+        self, snapshot: dict[str, Any] | None,
+    ) -> tuple[list[str], dict[str, float]]:
+        """Query-driven indicators to keep: recently read ones, newest first, capped."""
+        cutoff = time.time() - self.extra_ttl
+        with self._lock:
+            reads = dict((snapshot or {}).get("extra_reads", {}))
+            for indicator_id in self._pending:
+                reads.setdefault(indicator_id, time.time())
+        kept = sorted(
+            (i for i, read_at in reads.items() if read_at >= cutoff and i not in BASE_INDICATORS),
+            key=lambda i: reads[i],
+            reverse=True,
+        )[:self.max_extra]
+        return kept, {i: reads[i] for i in kept}
+
+    def _start_pending_fetch(self) -> None:
+        with self._lock:
+            if self._pending_fetch is not None and self._pending_fetch.is_alive():
+                return
+            # Don't hammer the API while it keeps failing
+            if time.time() - self._last_pending_failure < self.retry_interval:
+                return
+            self._pending_fetch = threading.Thread(
+                target=self._fetch_pending, name="economic-pending", daemon=True,
+            )
+            self._pending_fetch.start()
+
+    def _fetch_pending(self) -> None:
+        """Add queued indicators to the snapshot (background thread)."""
+        while True:
+            keep, _ = self._extra_indicators(self._load_snapshot())
+            with self._lock:
+                wanted = [i for i in self._pending if i in keep]
+                self._pending.clear()
+            if not wanted:
+                return
+            try:
+                fetched = run_async(_fetch_indicators(wanted))
+            except Exception as e:
+                fetched = {}
+                logger.warning("Economic indicator fetch failed", error=str(e))
+            with self._lock:
+                if not fetched:
+                    # Left to the periodic refresh, which fetches every kept indicator
+                    self._last_pending_failure = time.time()
+                    return
+                if self._snapshot is not None:
+                    self._snapshot.setdefault("series", {}).update(fetched)
+                    self._write(self.snapshot_path, self._snapshot)
+            logger.info("Economic indicators added to snapshot", indicators=list(fetched))
+
+    async def run_periodic_refresh(self, interval: float | None = None) -> None:
+        """Background loop that keeps the snapshot fresh (started in app lifespan)."""
+        interval = interval or self.snapshot_ttl / 2
+        while True:
+            await asyncio.to_thread(self.refresh)
+            await asyncio.sleep(interval)
+
+    # --- Persistence ---
+
+    def _load_snapshot(self) -> dict[str, Any] | None:
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._read(self.snapshot_path)
+            return self._snapshot
+
+    def _load_catalog(self) -> dict[str, Any] | None:
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = self._read(self.catalog_path)
+            return self._catalog
+
+    @staticmethod
+    def _is_stale(fetched_at: float | None, ttl: float) -> bool:
+        return not fetched_at or time.time() - fetched_at > ttl
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write(path: Path, data: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+
+# --- Fetching (runs on the shared IO loop) ---
+
+_NO_CACHE = {"Cache-Control": "no-cache"}
+
+
+async def _fetch_all(
+    extra_indicators: list[str],
+    refresh_catalog: bool,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]] | None]:
+    client = get_async_client("economic")
+    series, bls, indicators = await asyncio.gather(
+        _fetch_indicators(list(BASE_INDICATORS) + extra_indicators),
+        _fetch_bls(client),
+        _fetch_catalog(client) if refresh_catalog else asyncio.sleep(0, None),
+    )
+    return series, bls, indicators
+
+
+async def _fetch_indicators(indicator_ids: list[str]) -> dict[str, Any]:
+    client = get_async_client("economic")
+    responses = await asyncio.gather(*(
+        client.get(
+            f"{WORLD_BANK_API}/country/USA/indicator/{indicator_id}",
+            params={
+                "format": "json",
+                "per_page": BASE_INDICATORS.get(indicator_id, ("", 5, ""))[1],
+                "date": "2020:2025",
+            },
+            headers=_NO_CACHE,
+        )
+        for indicator_id in indicator_ids
+    ), return_exceptions=True)
+
+    series = {}
+    for indicator_id, resp in zip(indicator_ids, responses):
+        if not isinstance(resp, httpx.Response) or resp.status_code != 200:
+            continue
+        data = resp.json()
+        if len(data) < 2:
+            continue
+        rows = data[1] or []
+        name = rows[0].get("indicator", {}).get("value", indicator_id) if rows else indicator_id
+        series[indicator_id] = {
+            "name": name,
+            "points": [
+                [row["date"], row["value"]] for row in rows if row.get("value") is not None
+            ],
+        }
+    return series
+
+
+async def _fetch_bls(client: httpx.AsyncClient) -> list[dict[str, Any]]:
+    try:
+        resp = await client.post(
+            BLS_API,
+            json={"seriesid": [BLS_SERIES], "startyear": "2024", "endyear": "2025"},
+            headers=_NO_CACHE,
+        )
+        if resp.status_code != 200:
+            return []
+        series = resp.json().get("Results", {}).get("series", [])
+        return series[0].get("data", [])[:6] if series else []
+    except Exception:
+        return []
+
+
+async def _fetch_catalog(client: httpx.AsyncClient) -> list[dict[str, Any]] | None:
+    """Download the World Development Indicators catalog (source 2)."""
+    try:
+        resp = await client.get(
+            f"{WORLD_BANK_API}/indicator",
+            params={"format": "json", "source": 2, "per_page": 20000},
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+        if len(data) < 2:
+            return None
+        return [
+            {"id": row["id"], "name": row.get("name", "")}
+            for row in data[1] or []
+            if row.get("id")
+        ]
+    except Exception:
+        return None
+
+
+# Global snapshot store instance
+economic_store = EconomicSnapshotStore(Path(settings.data_dir))
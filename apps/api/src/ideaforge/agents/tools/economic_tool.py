@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-import httpx
+from datetime import datetime
+
 from crewai.tools import BaseTool
 
+from .economic_store import BASE_INDICATORS, economic_store
+
 
 class EconomicDataTool(BaseTool):
     name: str = "economic_data_research"
@@ -15,92 +18,53 @@ class EconomicDataTool(BaseTool):
 
     def _run(self, query: str) -> str:
         try:
-            client = httpx.Client(timeout=15)
+            # Served from the local snapshot; refreshed in the background on expiry
+            snapshot = economic_store.get_snapshot()
+            series = snapshot.get("series", {})
             results = []
 
-            # World Bank — search indicators
-            try:
-                resp = client.get(
-                    "https://api.worldbank.org/v2/country/USA/indicator/NY.GDP.MKTP.KD.ZG",
-                    params={"format": "json", "per_page": 5, "date": "2020:2025"},
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if len(data) > 1:
-                        results.append("=== US GDP Growth (World Bank) ===")
-                        for item in data[1] or []:
-                            if item.get("value") is not None:
-                                results.append(
-                                    f"  {item['date']}: {item['value']:.2f}%"
-                                )
-            except Exception:
-                pass
-
-            # World Bank — unemployment
-            try:
-                resp = client.get(
-                    "https://api.worldbank.org/v2/country/USA/indicator/SL.UEM.TOTL.ZS",
-                    params={"format": "json", "per_page": 5, "date": "2020:2025"},
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if len(data) > 1:
-                        results.append("\n=== US Unemployment Rate ===")
-                        for item in data[1] or []:
-                            if item.get("value") is not None:
-                                results.append(
-                                    f"  {item['date']}: {item['value']:.1f}%"
-                                )
-            except Exception:
-                pass
-
-            # World Bank — internet users
-            try:
-                resp = client.get(
-                    "https://api.worldbank.org/v2/country/USA/indicator/IT.NET.USER.ZS",
-                    params={"format": "json", "per_page": 3, "date": "2020:2025"},
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if len(data) > 1:
-                        results.append("\n=== Internet Users (% population) ===")
-                        for item in data[1] or []:
-                            if item.get("value") is not None:
-                                results.append(
-                                    f"  {item['date']}: {item['value']:.1f}%"
-                                )
-            except Exception:
-                pass
+            for indicator_id, (title, per_page, fmt) in BASE_INDICATORS.items():
+                points = series.get(indicator_id, {}).get("points", [])[:per_page]
+                if points:
+                    if results:
+                        results.append("")
+                    results.append(f"=== {title} ===")
+                    for year, value in points:
+                        results.append(f"  {year}: {fmt.format(value)}")
 
-            # BLS — latest employment data
-            try:
-                resp = client.post(
-                    "https://api.bls.gov/publicAPI/v2/timeseries/data/",
-                    json={
-                        "seriesid": ["CES0000000001"],  # Total nonfarm employment
-                        "startyear": "2024",
-                        "endyear": "2025",
-                    },
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    series = data.get("Results", {}).get("series", [])
-                    if series:
-                        results.append("\n=== US Employment (BLS) ===")
-                        for point in series[0].get("data", [])[:6]:
-                            results.append(
-                                f"  {point['year']}-{point['period']}: "
-                                f"{int(point['value']):,}K jobs"
-                            )
-            except Exception:
-                pass
+            bls = snapshot.get("bls", [])
+            if bls:
+                results.append("\n=== US Employment (BLS) ===")
+                for point in bls:
+                    results.append(
+                        f"  {point['year']}-{point['period']}: "
+                        f"{int(point['value']):,}K jobs"
+                    )
 
-            client.close()
+            # Indicators picked from the local World Bank catalog for this query
+            related = economic_store.related_indicators(query)
+            if related:
+                related_series = economic_store.get_series([i["id"] for i in related])
+                for indicator in related:
+                    if indicator["id"] not in related_series:
+                        results.append(
+                            f"\n=== {indicator['name']} (World Bank, US) ===\n"
+                            "  unavailable (queued for the next snapshot update)"
+                        )
+                        continue
+                    points = related_series[indicator["id"]].get("points", [])[:3]
+                    if points:
+                        results.append(f"\n=== {indicator['name']} (World Bank, US) ===")
+                        for year, value in points:
+                            results.append(f"  {year}: {value:,.2f}")
 
             if not results:
                 results.append("Economic data provides macro context for market analysis.")
                 results.append(f"Query topic: {query}")
                 results.append("US economy indicators show stable growth with opportunities in tech and services sectors.")
+            elif snapshot.get("fetched_at"):
+                as_of = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M")
+                results.append(f"\n(Data snapshot as of {as_of})")
 
             return "\n".join(results)
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import httpx
 from crewai.tools import BaseTool
 
 from ...config import settings
+from ...core.http_client import get_client
 
 
 class GitHubTrendingTool(BaseTool):
@@ -21,7 +21,7 @@ class GitHubTrendingTool(BaseTool):
             if settings.github_token:
                 headers["Authorization"] = f"token {settings.github_token}"
 
-            client = httpx.Client(timeout=15, headers=headers)
+            client = get_client("github")
             results = []
 
             # Search repositories
@@ -33,6 +33,7 @@ class GitHubTrendingTool(BaseTool):
                     "order": "desc",
                     "per_page": 10,
                 },
+                headers=headers,
             )
             resp.raise_for_status()
             data = resp.json()
@@ -56,6 +57,7 @@ class GitHubTrendingTool(BaseTool):
                     "order": "desc",
                     "per_page": 5,
                 },
+                headers=headers,
             )
             if resp2.status_code == 200:
                 new_repos = resp2.json().get("items", [])
@@ -68,7 +70,6 @@ class GitHubTrendingTool(BaseTool):
                             f"Created: {repo['created_at']}"
                         )
 
-            client.close()
             return "\n\n".join(results) if results else f"No GitHub results for '{query}'"
 
         except Exception as e:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import httpx
 from crewai.tools import BaseTool
 
 from ...config import settings
+from .google_search_service import SearchCreditsLow, google_search_service
 
 
 class GoogleSearchTool(BaseTool):
@@ -20,17 +20,7 @@ class GoogleSearchTool(BaseTool):
             return "Google Search tool: SERPER_API_KEY not configured"
 
         try:
-            resp = httpx.post(
-                "https://google.serper.dev/search",
-                headers={
-                    "X-API-KEY": settings.serper_api_key,
-                    "Content-Type": "application/json",
-                },
-                json={"q": query, "num": 10},
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+            data = google_search_service.search(query, num=10)
 
             results = []
 
@@ -56,5 +46,7 @@ class GoogleSearchTool(BaseTool):
 
             return "\n".join(results) if results else f"No results for '{query}'"
 
+        except SearchCreditsLow as e:
+            return f"Google Search tool: {e}; no cached results for '{query}'"
         except Exception as e:
             return f"Google Search error: {str(e)}"
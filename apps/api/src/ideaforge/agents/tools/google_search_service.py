@@ -0,0 +1,157 @@
+"""Quota-aware Serper search client shared by all research runs.
+
+Serper's free tier is a one-time pool of credits, so searches are cached by
+normalized query text (case, punctuation, stopwords and word order ignored),
+concurrent identical searches share one request, and spent credits are kept
+in a persistent ledger. When the remaining credits drop to the configured
+reserve, the service only answers from cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from ...config import AGENT_REGISTRY, settings
+from ...core.http_client import get_client
+from ...core.quota import QuotaLedger
+from ...core.response_cache import CachedResponse, response_cache, source_ttl
+from ...core.ttl_cache import TTLCache
+from .hn_index import tokenize
+
+logger = structlog.get_logger()
+
+SERPER_URL = "https://google.serper.dev/search"
+SOURCE = "google_search"
+
+
+class SearchCreditsLow(RuntimeError):
+    """Raised for uncached queries while the service is in cached-only mode."""
+
+    def __init__(self, remaining: int):
+        super().__init__(f"only {remaining} search credits left, serving cached results only")
+        self.remaining = remaining
+
+
+def normalize_query(query: str) -> str:
+    """Cache key text: lowercase terms without stopwords, in sorted order."""
+    terms = sorted(tokenize(query))
+    return " ".join(terms) if terms else " ".join(query.lower().split())
+
+
+class GoogleSearchService:
+    """Cached, coalesced and quota-accounted access to the Serper search API."""
+
+    def __init__(self, quota: QuotaLedger, reserve: int, ttl: float):
+        self.quota = quota
+        self.reserve = reserve
+        self.ttl = ttl
+        self._memory: TTLCache[dict[str, Any]] = TTLCache(ttl=ttl or 3600, max_size=512)
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._coalesced = 0
+
+    @property
+    def cached_only(self) -> bool:
+        return self.quota.remaining() <= self.reserve
+
+    def search(self, query: str, num: int = 10) -> dict[str, Any]:
+        """Serper results for a query, from cache when an equivalent query was seen."""
+        key = f"serper:{num}:{normalize_query(query)}"
+        data = self._cached(key)
+        if data is not None:
+            return data
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self._coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            data = self._fetch(query, num)
+            self._store(key, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "credits": self.quota.snapshot(),
+            "reserve": self.reserve,
+            "cached_only": self.cached_only,
+            "coalesced": self._coalesced,
+            "memory_cache": self._memory.stats(),
+        }
+
+    def _fetch(self, query: str, num: int) -> dict[str, Any]:
+        remaining = self.quota.remaining()
+        if remaining <= self.reserve:
+            raise SearchCreditsLow(remaining)
+
+        resp = get_client(SOURCE).post(
+            SERPER_URL,
+            headers={
+                "X-API-KEY": settings.serper_api_key,
+                "Content-Type": "application/json",
+                # Results are cached here by normalized query; keep the
+                # request (and its API key) out of the HTTP response cache
+                "Cache-Control": "no-store",
+            },
+            json={"q": query, "num": num},
+        )
+        if resp.status_code >= 400 and "credit" in resp.text.lower():
+            logger.warning("Serper credits exhausted, switching to cached-only mode")
+            self.quota.exhaust()
+            raise SearchCreditsLow(0)
+        resp.raise_for_status()
+        data = resp.json()
+        self.quota.charge(int(data.get("credits", 1)))
+        return data
+
+    def _cached(self, key: str) -> dict[str, Any] | None:
+        data = self._memory.get(key)
+        if data is None and settings.response_cache_enabled and self.ttl > 0:
+            cached = response_cache.get(SOURCE, _digest(key))
+            if cached is not None:
+                data = json.loads(cached.body)
+                self._memory.set(key, data)
+        return data
+
+    def _store(self, key: str, data: dict[str, Any]) -> None:
+        self._memory.set(key, data)
+        if settings.response_cache_enabled and self.ttl > 0:
+            body = json.dumps(data, ensure_ascii=False).encode()
+            response_cache.put(SOURCE, _digest(key), CachedResponse(200, [], body), self.ttl)
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+_quota_cfg = AGENT_REGISTRY[SOURCE].get("quota") or {}
+
+# Global Serper search service instance
+google_search_service = GoogleSearchService(
+    QuotaLedger(
+        Path(settings.data_dir) / "serper_credits.json",
+        limit=_quota_cfg.get("credits", 2_500),
+    ),
+    reserve=_quota_cfg.get("reserve", 50),
+    ttl=source_ttl(SOURCE),
+)
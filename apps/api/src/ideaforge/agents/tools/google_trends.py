@@ -4,67 +4,63 @@ from __future__ import annotations
 
 from crewai.tools import BaseTool
 
+from .google_trends_service import MAX_KEYWORDS, google_trends_service
+from .queries import split_queries
+
 
 class GoogleTrendsTool(BaseTool):
     name: str = "google_trends_research"
     description: str = (
         "Research Google Trends data: trending searches, interest over time, "
-        "related queries, and geographic interest for a given keyword."
+        "related queries, and geographic interest for a given keyword. "
+        "Separate up to five keywords with ';' to compare them in one call."
     )
 
     def _run(self, query: str) -> str:
         try:
-            from pytrends.request import TrendReq
-
-            pytrends = TrendReq(hl="en-US", tz=360)
+            keywords = split_queries(query, MAX_KEYWORDS) or [query]
 
             results = []
 
-            # Trending searches (global)
+            # Trending searches (global, cached hourly)
             try:
-                trending = pytrends.trending_searches(pn="united_states")
-                top_trending = trending.head(10).values.tolist()
-                results.append(f"Top trending searches (US): {[t[0] for t in top_trending]}")
+                trending = google_trends_service.trending_searches(pn="united_states")
+                results.append(f"Top trending searches (US): {trending}")
+            except ImportError:
+                raise
             except Exception:
                 results.append("Trending searches: unavailable")
 
-            # Interest over time
-            try:
-                pytrends.build_payload([query], timeframe="today 3-m")
-                iot = pytrends.interest_over_time()
-                if not iot.empty:
-                    avg_interest = iot[query].mean()
-                    max_interest = iot[query].max()
-                    recent = iot[query].tail(7).mean()
-                    results.append(
-                        f"Interest for '{query}': avg={avg_interest:.0f}, "
-                        f"max={max_interest:.0f}, last_7_days_avg={recent:.0f}"
-                    )
-            except Exception:
-                results.append(f"Interest over time for '{query}': unavailable")
-
-            # Related queries
-            try:
-                related = pytrends.related_queries()
-                if query in related and related[query]["rising"] is not None:
-                    rising = related[query]["rising"].head(10)
-                    rising_list = rising["query"].tolist()
-                    results.append(f"Rising related queries: {rising_list}")
-                if query in related and related[query]["top"] is not None:
-                    top = related[query]["top"].head(10)
-                    top_list = top["query"].tolist()
-                    results.append(f"Top related queries: {top_list}")
-            except Exception:
-                results.append("Related queries: unavailable")
+            # Interest over time and related queries, compared within this query
+            trends = google_trends_service.keyword_trends(keywords)
+            for kw in keywords:
+                data = trends.get(kw)
+                if data is None:
+                    results.append(f"Interest over time for '{kw}': unavailable")
+                    continue
+                line = (
+                    f"Interest for '{kw}': avg={data['avg']:.0f}, "
+                    f"max={data['max']:.0f}, last_7_days_avg={data['recent']:.0f}"
+                )
+                others = [b for b in data["batch"] if b != kw]
+                if others:
+                    line += f" (scaled together with {others})"
+                results.append(line)
+                if data["rising"]:
+                    results.append(f"Rising related queries: {data['rising']}")
+                if data["top"]:
+                    results.append(f"Top related queries: {data['top']}")
 
             # Suggestions
-            try:
-                suggestions = pytrends.suggestions(keyword=query)
-                if suggestions:
-                    titles = [s["title"] for s in suggestions[:10]]
-                    results.append(f"Suggestions: {titles}")
-            except Exception:
-                pass
+            for kw in keywords:
+                try:
+                    suggestions = google_trends_service.suggestions(kw)
+                    if suggestions:
+                        results.append(f"Suggestions for '{kw}': {suggestions}")
+                except ImportError:
+                    raise
+                except Exception:
+                    pass
 
             return "\n".join(results) if results else f"No trend data found for '{query}'"
 
@@ -0,0 +1,239 @@
+"""Process-wide Google Trends fetcher shared by all research runs.
+
+Google Trends has no official API and throttles aggressively, so every request
+from every run goes through one `TrendReq` session and one request budget:
+
+- the query-independent trending list is cached per hour;
+- the keywords of one lookup are fetched in payloads of up to five, cached
+  per payload, and identical payloads in flight are fetched only once;
+- a shared token bucket paces requests, and a 429 puts the whole service into
+  an exponentially growing cooldown instead of letting each run retry.
+
+Interest values of keywords fetched in the same payload are scaled relative
+to each other (0-100 over the whole batch), as Google Trends always does, so
+keywords of unrelated lookups are never mixed into one payload.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import structlog
+
+from ...config import AGENT_REGISTRY
+from ...core.rate_limit import TokenBucket
+from ...core.ttl_cache import TTLCache
+
+logger = structlog.get_logger()
+
+# Google Trends compares at most five keywords per payload
+MAX_KEYWORDS = 5
+TIMEFRAME = "today 3-m"
+
+
+class GoogleTrendsThrottled(RuntimeError):
+    """Raised when Google Trends is cooling down after 429s for longer than a caller may wait."""
+
+
+class GoogleTrendsService:
+    """Shared, paced and batched access to Google Trends via pytrends."""
+
+    def __init__(
+        self,
+        rpm: float,
+        burst: float = 3,
+        cache_ttl: float = 3600,
+        base_backoff: float = 30,
+        max_backoff: float = 900,
+        max_wait: float = 60,
+        max_retries: int = 2,
+    ):
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+
+        self._bucket = TokenBucket.per_minute(rpm, burst=burst)
+        # TrendReq keeps the current payload on the instance: one caller at a time
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+        self._trending: TTLCache[list[str]] = TTLCache(ttl=cache_ttl, max_size=16)
+        self._trending_lock = threading.Lock()
+        # Keyed by the sorted payload: values only hold relative to the same batch
+        self._batch_cache: TTLCache[dict[str, Any]] = TTLCache(ttl=cache_ttl, max_size=256)
+        self._suggestions: TTLCache[list[str]] = TTLCache(ttl=cache_ttl, max_size=1024)
+
+        # In-flight payload fetches, shared by callers asking for the same batch
+        self._inflight: dict[tuple[str, ...], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self._backoff = 0.0
+        self._cooldown_until = 0.0
+        self._requests = 0
+        self._throttled = 0
+        self._batches = 0
+
+    def trending_searches(self, pn: str = "united_states", limit: int = 10) -> list[str]:
+        """Top trending searches for a country, fetched at most once per hour."""
+        cached = self._trending.get(pn)
+        if cached is None:
+            with self._trending_lock:
+                cached = self._trending.get(pn)
+                if cached is None:
+                    df = self._call(lambda t: t.trending_searches(pn=pn))
+                    cached = [row[0] for row in df.values.tolist()]
+                    self._trending.set(pn, cached)
+        return cached[:limit]
+
+    def keyword_trends(self, keywords: list[str], timeout: float = 180) -> dict[str, dict[str, Any] | None]:
+        """Interest stats and related queries per keyword (None where unavailable).
+
+        Keywords are fetched in batches of up to five, in the order given.
+        """
+        unique = list(dict.fromkeys(keywords))
+        results: dict[str, dict[str, Any] | None] = {}
+        for i in range(0, len(unique), MAX_KEYWORDS):
+            batch = unique[i:i + MAX_KEYWORDS]
+            try:
+                data = self._batch_trends(batch, timeout)
+            except Exception as e:
+                logger.debug("Google Trends keyword lookup failed", keywords=batch, error=str(e))
+                data = {}
+            for kw in batch:
+                results[kw] = data.get(kw)
+        return results
+
+    def suggestions(self, keyword: str, limit: int = 10) -> list[str]:
+        cached = self._suggestions.get(keyword)
+        if cached is None:
+            found = self._call(lambda t: t.suggestions(keyword=keyword))
+            cached = [s["title"] for s in found or []]
+            self._suggestions.set(keyword, cached)
+        return cached[:limit]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self._requests,
+            "batches": self._batches,
+            "throttled": self._throttled,
+            "cooldown_seconds": round(max(0.0, self._cooldown_until - time.monotonic()), 1),
+            "inflight_batches": len(self._inflight),
+            "trending_cache": self._trending.stats(),
+            "batch_cache": self._batch_cache.stats(),
+        }
+
+    # --- batching ---
+
+    def _batch_trends(self, batch: list[str], timeout: float) -> dict[str, dict[str, Any] | None]:
+        """Trends of one payload, from the cache or a (shared) fetch."""
+        key = tuple(sorted(batch))
+        cached = self._batch_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result(timeout=timeout)
+
+        try:
+            data = self._fetch_batch(list(key))
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._batch_cache.set(key, data)
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_batch(self, keywords: list[str]) -> dict[str, dict[str, Any] | None]:
+        def fetch(trends: Any) -> tuple[Any, dict[str, Any]]:
+            trends.build_payload(keywords, timeframe=TIMEFRAME)
+            iot = trends.interest_over_time()
+            try:
+                related = trends.related_queries()
+            except Exception:
+                related = {}
+            return iot, related
+
+        # One token for the payload and interest each, one per keyword for related queries
+        iot, related = self._call(fetch, cost=2 + len(keywords))
+        self._batches += 1
+
+        data: dict[str, dict[str, Any] | None] = {}
+        for kw in keywords:
+            if iot.empty or kw not in iot:
+                data[kw] = None
+                continue
+            series = iot[kw]
+            queries = related.get(kw) or {}
+            rising, top = queries.get("rising"), queries.get("top")
+            data[kw] = {
+                "avg": float(series.mean()),
+                "max": float(series.max()),
+                "recent": float(series.tail(7).mean()),
+                "rising": rising.head(10)["query"].tolist() if rising is not None else [],
+                "top": top.head(10)["query"].tolist() if top is not None else [],
+                "batch": list(keywords),
+            }
+        return data
+
+    # --- pacing ---
+
+    def _call(self, fn: Callable[[Any], Any], cost: float = 1) -> Any:
+        """Run `fn(trend_req)` within the shared budget, backing off on 429s."""
+        from pytrends.exceptions import TooManyRequestsError
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_cooldown()
+            self._bucket.acquire(cost)
+            if cost > self._bucket.capacity:
+                # acquire() takes at most a full bucket: charge the rest as debt
+                self._bucket.adjust(self._bucket.capacity - cost)
+            with self._client_lock:
+                self._requests += 1
+                try:
+                    result = fn(self._get_client())
+                except TooManyRequestsError:
+                    self._on_throttled()
+                    if attempt == self.max_retries:
+                        raise
+                    continue
+                self._backoff = 0.0
+                return result
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            from pytrends.request import TrendReq
+
+            self._client = TrendReq(hl="en-US", tz=360)
+        return self._client
+
+    def _on_throttled(self) -> None:
+        self._throttled += 1
+        self._backoff = min(self.max_backoff, self._backoff * 2 or self.base_backoff)
+        self._cooldown_until = time.monotonic() + self._backoff
+        logger.warning("Google Trends rate limited", backoff_seconds=self._backoff)
+
+    def _wait_cooldown(self) -> None:
+        wait = self._cooldown_until - time.monotonic()
+        if wait > self.max_wait:
+            raise GoogleTrendsThrottled(f"Google Trends rate limited, retry in {wait:.0f}s")
+        if wait > 0:
+            time.sleep(wait)
+
+
+_rate_limits = AGENT_REGISTRY["google_trends"].get("rate_limits") or {}
+
+# Global Google Trends service instance
+google_trends_service = GoogleTrendsService(rpm=_rate_limits.get("rpm", 10))
@@ -0,0 +1,376 @@
+"""Local Hacker News story store with an inverted index over titles and comments.
+
+The store is fed from the Firebase API and refreshed incrementally: after the
+initial load only items reported by `/updates.json`, new IDs past the last
+seen `/maxitem.json` and newly listed stories are fetched again. Refreshes run
+in a background thread; until the initial load has finished, searches are
+answered by scanning the story lists live.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import structlog
+
+from ...core.http_client import get_async_client, run_async
+
+logger = structlog.get_logger()
+
+HN_API = "https://hacker-news.firebaseio.com/v0"
+STORY_LISTS = ("topstories", "beststories", "showstories")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how",
+    "i", "in", "is", "it", "of", "on", "or", "that", "the", "this", "to",
+    "was", "what", "why", "with", "you",
+})
+
+# Relevance weights for a query term found in a story's title vs. its comments
+TITLE_WEIGHT = 3.0
+COMMENT_WEIGHT = 1.0
+
+# Live search (before the index is loaded): stories scanned per list and batch size
+LIVE_STORIES_PER_LIST = 50
+LIVE_BATCH_SIZE = 30
+
+
+def tokenize(text: str) -> set[str]:
+    """Lowercase, strip HTML and split text into index terms."""
+    text = html.unescape(_TAG_RE.sub(" ", text or "")).lower()
+    return {t for t in _TOKEN_RE.findall(text) if t not in _STOPWORDS}
+
+
+@dataclass
+class StoryEntry:
+    item: dict[str, Any]
+    story_type: str
+    comments: list[str] = field(default_factory=list)
+    comment_ids: list[int] = field(default_factory=list)
+
+
+class HNStoryIndex:
+    """Process-wide, incrementally refreshed index of Hacker News stories."""
+
+    def __init__(
+        self,
+        refresh_interval: float = 120.0,
+        max_stories: int = 3000,
+        comments_per_story: int = 5,
+        max_new_items: int | None = None,
+        max_concurrency: int = 16,
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_stories = max_stories
+        self.comments_per_story = comments_per_story
+        # New IDs walked per refresh: HN creates well under one item per
+        # second, so one per second of interval keeps up without a long walk
+        self.max_new_items = max_new_items if max_new_items is not None else int(refresh_interval)
+        self.max_concurrency = max_concurrency
+
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stories: dict[int, StoryEntry] = {}
+        self._title_postings: dict[str, set[int]] = defaultdict(set)
+        self._comment_postings: dict[str, set[int]] = defaultdict(set)
+        self._terms: dict[int, tuple[set[str], set[str]]] = {}
+        self._comment_parent: dict[int, int] = {}
+        self._max_item = 0
+        self._last_refresh: float | None = None
+        self._refresher: threading.Thread | None = None
+
+    # --- Queries ---
+
+    @property
+    def ready(self) -> bool:
+        """Whether the initial load has finished."""
+        return self._last_refresh is not None
+
+    def search(self, query: str, limit: int = 10) -> list[StoryEntry]:
+        """Return the best matching stories, starting a refresh if the store is stale.
+
+        Until the initial load has finished, the story lists are searched live.
+        """
+        self.ensure_fresh()
+
+        query_lower = query.lower().strip()
+        terms = tokenize(query)
+        if not terms:
+            return []
+        if not self.ready:
+            return run_async(self._live_search(query_lower, terms, limit))
+
+        with self._lock:
+            scores: dict[int, float] = defaultdict(float)
+            for term in terms:
+                for sid in self._title_postings.get(term, ()):
+                    scores[sid] += TITLE_WEIGHT
+                for sid in self._comment_postings.get(term, ()):
+                    scores[sid] += COMMENT_WEIGHT
+
+            ranked = []
+            for sid, score in scores.items():
+                entry = self._stories[sid]
+                if query_lower in entry.item.get("title", "").lower():
+                    score += TITLE_WEIGHT * len(terms)
+                ranked.append((score, entry.item.get("score", 0) or 0, sid))
+
+            ranked.sort(reverse=True)
+            return [self._stories[sid] for _, _, sid in ranked[:limit]]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "stories": len(self._stories),
+                "terms": len(self._title_postings) + len(self._comment_postings),
+                "max_item": self._max_item,
+                "last_refresh": self._last_refresh,
+                "refreshing": self._refresh_lock.locked(),
+            }
+
+    # --- Refresh ---
+
+    def ensure_fresh(self) -> None:
+        """Start a background refresh if the store is older than `refresh_interval`.
+
+        Only one refresh runs at a time; callers never wait for it and keep
+        serving the current index (or live results) meanwhile.
+        """
+        if not self._is_stale() or not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self._refresher = threading.Thread(
+                target=self._run_refresh, name="hn-index-refresh", daemon=True,
+            )
+            self._refresher.start()
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def _run_refresh(self) -> None:
+        try:
+            if self._is_stale():
+                run_async(self._refresh())
+                # Only a successful refresh counts; a failed one is retried next search
+                self._last_refresh = time.monotonic()
+        except Exception as e:
+            logger.warning("HN index refresh failed", error=str(e))
+        finally:
+            self._refresh_lock.release()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._last_refresh is None
+            or time.monotonic() - self._last_refresh >= self.refresh_interval
+        )
+
+    async def _refresh(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        client = get_async_client("hackernews")
+        responses = await asyncio.gather(
+            *(_get_json(client, semaphore, f"{HN_API}/{t}.json") for t in STORY_LISTS),
+            _get_json(client, semaphore, f"{HN_API}/maxitem.json"),
+            _get_json(client, semaphore, f"{HN_API}/updates.json"),
+        )
+        lists = responses[:len(STORY_LISTS)]
+        max_item, updates = responses[len(STORY_LISTS):]
+        if not any(lists):
+            raise RuntimeError("Hacker News story lists unavailable")
+
+        story_types: dict[int, str] = {}
+        for story_type, story_ids in zip(STORY_LISTS, lists):
+            for sid in story_ids or []:
+                story_types.setdefault(sid, story_type)
+
+        with self._lock:
+            known = set(self._stories)
+            comment_parent = dict(self._comment_parent)
+            previous_max = self._max_item
+
+        # Stories to (re)fetch: newly listed ones plus known ones that changed
+        to_fetch = {sid for sid in story_types if sid not in known}
+        changed_comments: set[int] = set()
+        for item_id in (updates or {}).get("items", []):
+            if item_id in known:
+                to_fetch.add(item_id)
+            elif item_id in comment_parent:
+                changed_comments.add(comment_parent[item_id])
+        to_fetch |= changed_comments
+
+        # Brand new items since the last refresh (not on any list yet)
+        new_ids: list[int] = []
+        if previous_max and isinstance(max_item, int) and max_item > previous_max:
+            start = max(previous_max + 1, max_item - self.max_new_items + 1)
+            new_ids = [i for i in range(start, max_item + 1) if i not in to_fetch]
+
+        fetch_ids = list(to_fetch) + new_ids
+        items = await asyncio.gather(*(
+            _get_json(client, semaphore, f"{HN_API}/item/{i}.json") for i in fetch_ids
+        ))
+        stories = [item for item in items if _is_story(item)]
+        removed = [
+            i for i, item in zip(fetch_ids, items)
+            if i in known and item is not None and not _is_story(item)
+        ]
+
+        entries = await self._with_comments(client, semaphore, stories, story_types)
+
+        with self._lock:
+            for sid in removed:
+                self._drop(sid)
+            for entry in entries:
+                self._put(entry)
+            for sid, entry in self._stories.items():
+                entry.story_type = story_types.get(sid, entry.story_type)
+            self._evict(set(story_types))
+            if isinstance(max_item, int):
+                self._max_item = max(self._max_item, max_item)
+
+        logger.debug(
+            "HN index refreshed",
+            fetched=len(fetch_ids),
+            indexed=len(entries),
+            stories=len(self._stories),
+        )
+
+    async def _live_search(self, query_lower: str, terms: set[str], limit: int) -> list[StoryEntry]:
+        """Scan the current story lists directly, stopping once `limit` titles match."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        client = get_async_client("hackernews")
+        lists = await asyncio.gather(*(
+            _get_json(client, semaphore, f"{HN_API}/{t}.json") for t in STORY_LISTS
+        ))
+
+        story_types: dict[int, str] = {}
+        for story_type, story_ids in zip(STORY_LISTS, lists):
+            for sid in (story_ids or [])[:LIVE_STORIES_PER_LIST]:
+                story_types.setdefault(sid, story_type)
+
+        matches: list[dict[str, Any]] = []
+        story_ids = list(story_types)
+        for start in range(0, len(story_ids), LIVE_BATCH_SIZE):
+            batch = story_ids[start:start + LIVE_BATCH_SIZE]
+            items = await asyncio.gather(*(
+                _get_json(client, semaphore, f"{HN_API}/item/{sid}.json") for sid in batch
+            ))
+            for item in items:
+                if _is_story(item) and (
+                    query_lower in item["title"].lower() or terms & tokenize(item["title"])
+                ):
+                    matches.append(item)
+            if len(matches) >= limit:
+                break
+        return await self._with_comments(client, semaphore, matches[:limit], story_types)
+
+    async def _with_comments(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        stories: list[dict[str, Any]],
+        story_types: dict[int, str],
+    ) -> list[StoryEntry]:
+        """Fetch the top comments of each story and wrap them as entries."""
+        kids = [item.get("kids", [])[:self.comments_per_story] for item in stories]
+        comment_items = await asyncio.gather(*(
+            _get_json(client, semaphore, f"{HN_API}/item/{kid}.json")
+            for kid_ids in kids
+            for kid in kid_ids
+        ))
+
+        entries = []
+        offset = 0
+        for item, kid_ids in zip(stories, kids):
+            chunk = comment_items[offset:offset + len(kid_ids)]
+            offset += len(kid_ids)
+            comments = [c for c in chunk if c and c.get("text")]
+            entries.append(StoryEntry(
+                item=item,
+                story_type=story_types.get(item["id"], "new"),
+                comments=[c["text"] for c in comments],
+                comment_ids=[c["id"] for c in comments],
+            ))
+        return entries
+
+    def _put(self, entry: StoryEntry) -> None:
+        sid = entry.item["id"]
+        self._drop(sid)
+
+        title_terms = tokenize(entry.item.get("title", ""))
+        comment_terms: set[str] = set()
+        for text in entry.comments:
+            comment_terms |= tokenize(text)
+
+        for term in title_terms:
+            self._title_postings[term].add(sid)
+        for term in comment_terms:
+            self._comment_postings[term].add(sid)
+        for cid in entry.comment_ids:
+            self._comment_parent[cid] = sid
+
+        self._terms[sid] = (title_terms, comment_terms)
+        self._stories[sid] = entry
+
+    def _drop(self, sid: int) -> None:
+        entry = self._stories.pop(sid, None)
+        if entry is None:
+            return
+        title_terms, comment_terms = self._terms.pop(sid)
+        for term in title_terms:
+            postings = self._title_postings[term]
+            postings.discard(sid)
+            if not postings:
+                del self._title_postings[term]
+        for term in comment_terms:
+            postings = self._comment_postings[term]
+            postings.discard(sid)
+            if not postings:
+                del self._comment_postings[term]
+        for cid in entry.comment_ids:
+            self._comment_parent.pop(cid, None)
+
+    def _evict(self, listed: set[int]) -> None:
+        """Drop the oldest unlisted stories once the store exceeds `max_stories`."""
+        overflow = len(self._stories) - self.max_stories
+        if overflow <= 0:
+            return
+        unlisted = sorted(sid for sid in self._stories if sid not in listed)
+        for sid in unlisted[:overflow]:
+            self._drop(sid)
+
+
+def _is_story(item: dict[str, Any] | None) -> bool:
+    return bool(
+        item
+        and item.get("type") == "story"
+        and item.get("title")
+        and not item.get("dead")
+        and not item.get("deleted")
+    )
+
+
+async def _get_json(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+) -> Any:
+    """GET a Firebase JSON document, returning None on any failure."""
+    async with semaphore:
+        try:
+            resp = await client.get(url)
+            return resp.json()
+        except Exception:
+            return None
+
+
+# Global story index instance
+hn_index = HNStoryIndex()
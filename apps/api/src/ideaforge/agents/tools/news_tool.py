@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import httpx
 from crewai.tools import BaseTool
 
 from ...config import settings
+from ...core.http_client import get_client
 
 
 class NewsResearchTool(BaseTool):
@@ -19,7 +19,7 @@ class NewsResearchTool(BaseTool):
             return "News tool: GNEWS_API_KEY not configured"
 
         try:
-            client = httpx.Client(timeout=15)
+            client = get_client("news")
 
             resp = client.get(
                 "https://gnews.io/api/v4/search",
@@ -43,7 +43,6 @@ class NewsResearchTool(BaseTool):
                     f"  Published: {article.get('publishedAt', '')}"
                 )
 
-            client.close()
             return "\n\n".join(results) if results else f"No news for '{query}'"
 
         except Exception as e:
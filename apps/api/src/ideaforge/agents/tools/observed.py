@@ -0,0 +1,92 @@
+"""Delegating tool wrapper that reports each call's output to the pipeline."""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable
+
+from crewai.tools import BaseTool
+
+from ...core.cancellation import check_cancelled
+
+# Set by ObservedTool for the duration of a wrapped call
+_item_sink: ContextVar[Callable[[list[str]], None] | None] = ContextVar("item_sink", default=None)
+
+
+def publish_items(texts: list[str]) -> None:
+    """Hand every collected item text (not just the printed ones) to the current run.
+
+    No-op when the tool isn't called through an `ObservedTool` with `on_items`.
+    """
+    sink = _item_sink.get()
+    if sink is not None:
+        try:
+            sink(texts)
+        except Exception:
+            pass
+
+
+class ObservedTool(BaseTool):
+    """Runs the wrapped tool unchanged and passes its raw output to `on_result`.
+
+    Agents see the same name, description and argument schema as the wrapped
+    tool; the crew uses the raw outputs for local post-processing. Items a
+    tool hands to `publish_items()` during the call go to `on_items`. The
+    wrapped tool itself is not modified, so one instance can serve many runs.
+    Each call's wall time goes to `on_call`; calls made after the run was
+    cancelled raise `ResearchCancelledError` instead of running.
+    """
+
+    tool: BaseTool
+    source: str
+    on_result: Callable[[str, str], None] | None = None
+    on_items: Callable[[str, list[str]], None] | None = None
+    on_call: Callable[[str, float], None] | None = None
+
+    @classmethod
+    def wrap(
+        cls,
+        tool: BaseTool,
+        source: str,
+        on_result: Callable[[str, str], None] | None = None,
+        on_items: Callable[[str, list[str]], None] | None = None,
+        on_call: Callable[[str, float], None] | None = None,
+    ) -> ObservedTool:
+        return cls(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            tool=tool,
+            source=source,
+            on_result=on_result,
+            on_items=on_items,
+            on_call=on_call,
+        )
+
+    def _generate_description(self) -> None:
+        # The wrapped tool's description is already in its final form
+        self.description = self.tool.description
+
+    def _run(self, **kwargs: Any) -> Any:
+        check_cancelled()
+        sink = partial(self.on_items, self.source) if self.on_items is not None else None
+        token = _item_sink.set(sink)
+        start = time.perf_counter()
+        try:
+            result = self.tool._run(**kwargs)
+        finally:
+            _item_sink.reset(token)
+            if self.on_call is not None:
+                try:
+                    self.on_call(self.source, time.perf_counter() - start)
+                except Exception:
+                    pass
+
+        if self.on_result is not None and isinstance(result, str):
+            try:
+                self.on_result(self.source, result)
+            except Exception:
+                pass
+        return result
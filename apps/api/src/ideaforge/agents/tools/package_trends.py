@@ -2,8 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import date, timedelta
+from typing import Any
+
 import httpx
 from crewai.tools import BaseTool
+from pydantic import Field, field_validator
+
+from ...config import AGENT_REGISTRY
+from ...core.http_client import get_async_client, run_async
+
+NPM_SEARCH = "https://registry.npmjs.org/-/v1/search"
+NPM_DOWNLOADS = "https://api.npmjs.org/downloads"
+PYPI_API = "https://pypi.org/pypi"
+PYPISTATS_API = "https://pypistats.org/api/packages"
+
+# npm bulk download queries accept up to 128 unscoped package names
+NPM_BULK_LIMIT = 128
+HISTORY_MONTHS = (0, 6, 12)
 
 
 class PackageTrendsTool(BaseTool):
@@ -13,71 +30,179 @@ class PackageTrendsTool(BaseTool):
         "growing ecosystems and technology adoption patterns."
     )
 
+    # 0 = last-month totals only; 6 or 12 = also fetch a daily download
+    # series for that many months and compute growth rates locally.
+    # pypistats only keeps ~180 days, so PyPI series are capped at 6 months.
+    # Set with AGENT_REGISTRY["packages"]["history_months"].
+    history_months: int = Field(
+        default=AGENT_REGISTRY["packages"].get("history_months", 0), validate_default=True,
+    )
+
+    @field_validator("history_months")
+    @classmethod
+    def _check_history_months(cls, value: int) -> int:
+        if value not in HISTORY_MONTHS:
+            raise ValueError(f"history_months must be one of {HISTORY_MONTHS}, got {value}")
+        return value
+
     def _run(self, query: str) -> str:
         try:
-            client = httpx.Client(timeout=15)
-            results = []
-            keywords = query.lower().split()
-
-            # npm search
-            try:
-                resp = client.get(
-                    f"https://registry.npmjs.org/-/v1/search",
-                    params={"text": query, "size": 5},
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    results.append("=== npm Packages ===")
-                    for pkg in data.get("objects", []):
-                        p = pkg.get("package", {})
-                        name = p.get("name", "")
-                        # Get download stats
-                        dl_resp = client.get(
-                            f"https://api.npmjs.org/downloads/point/last-month/{name}"
-                        )
-                        downloads = "N/A"
-                        if dl_resp.status_code == 200:
-                            downloads = f"{dl_resp.json().get('downloads', 0):,}"
-
-                        results.append(
-                            f"- {name}: {p.get('description', '')[:150]}\n"
-                            f"  Downloads (last month): {downloads}\n"
-                            f"  Version: {p.get('version', 'N/A')} | "
-                            f"Keywords: {p.get('keywords', [])[:5]}"
-                        )
-            except Exception:
-                results.append("npm search: unavailable")
-
-            # PyPI search
-            try:
-                for keyword in keywords[:3]:
-                    resp = client.get(
-                        f"https://pypi.org/pypi/{keyword}/json"
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        info = data.get("info", {})
-                        results.append(
-                            f"\n=== PyPI: {info.get('name', keyword)} ===\n"
-                            f"  Summary: {info.get('summary', 'N/A')}\n"
-                            f"  Version: {info.get('version', 'N/A')}\n"
-                            f"  URL: {info.get('project_url', '')}"
-                        )
-
-                        # Try to get download stats from pypistats
-                        stats_resp = client.get(
-                            f"https://pypistats.org/api/packages/{keyword}/recent"
-                        )
-                        if stats_resp.status_code == 200:
-                            stats = stats_resp.json().get("data", {})
-                            results.append(
-                                f"  Downloads (last month): {stats.get('last_month', 'N/A'):,}"
-                            )
-            except Exception:
-                pass
-
-            client.close()
+            npm_results, pypi_results = run_async(self._research(query))
+            results = npm_results + pypi_results
             return "\n".join(results) if results else f"No package data for '{query}'"
 
         except Exception as e:
             return f"Package trends error: {str(e)}"
+
+    async def _research(self, query: str) -> tuple[list[str], list[str]]:
+        """Run the npm and PyPI branches side by side."""
+        client = get_async_client("packages")
+        return await asyncio.gather(
+            self._npm(client, query),
+            self._pypi(client, query.lower().split()[:3]),
+        )
+
+    # --- npm ---
+
+    async def _npm(self, client: httpx.AsyncClient, query: str) -> list[str]:
+        try:
+            resp = await client.get(NPM_SEARCH, params={"text": query, "size": 5})
+            if resp.status_code != 200:
+                return []
+            packages = [obj.get("package", {}) for obj in resp.json().get("objects", [])]
+            names = [p.get("name", "") for p in packages if p.get("name")]
+
+            totals, series = await asyncio.gather(
+                _npm_downloads(client, "point/last-month", names),
+                self._npm_series(client, names),
+            )
+        except Exception:
+            return ["npm search: unavailable"]
+
+        results = ["=== npm Packages ==="]
+        for p in packages:
+            name = p.get("name", "")
+            point = totals.get(name)
+            downloads = f"{point.get('downloads', 0):,}" if point else "N/A"
+            results.append(
+                f"- {name}: {(p.get('description') or '')[:150]}\n"
+                f"  Downloads (last month): {downloads}\n"
+                f"  Version: {p.get('version', 'N/A')} | "
+                f"Keywords: {(p.get('keywords') or [])[:5]}"
+            )
+            daily = [d.get("downloads", 0) for d in (series.get(name) or {}).get("downloads", [])]
+            if daily:
+                results.append(_format_growth(daily, self.history_months))
+        return results
+
+    async def _npm_series(self, client: httpx.AsyncClient, names: list[str]) -> dict[str, Any]:
+        if self.history_months <= 0:
+            return {}
+        end = date.today() - timedelta(days=1)
+        start = end - timedelta(days=min(self.history_months * 30, 365))
+        return await _npm_downloads(client, f"range/{start}:{end}", names)
+
+    # --- PyPI ---
+
+    async def _pypi(self, client: httpx.AsyncClient, keywords: list[str]) -> list[str]:
+        try:
+            packages = await asyncio.gather(*(
+                self._pypi_package(client, keyword) for keyword in keywords
+            ))
+        except Exception:
+            return []
+        return [line for lines in packages for line in lines]
+
+    async def _pypi_package(self, client: httpx.AsyncClient, keyword: str) -> list[str]:
+        """Fetch PyPI metadata and pypistats downloads for one name at the same time."""
+        requests = [
+            client.get(f"{PYPI_API}/{keyword}/json"),
+            client.get(f"{PYPISTATS_API}/{keyword}/recent"),
+        ]
+        if self.history_months > 0:
+            requests.append(
+                client.get(f"{PYPISTATS_API}/{keyword}/overall", params={"mirrors": "false"})
+            )
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        info_resp, recent_resp = responses[0], responses[1]
+
+        if not _ok(info_resp):
+            return []
+        info = info_resp.json().get("info", {})
+        results = [
+            f"\n=== PyPI: {info.get('name', keyword)} ===\n"
+            f"  Summary: {info.get('summary', 'N/A')}\n"
+            f"  Version: {info.get('version', 'N/A')}\n"
+            f"  URL: {info.get('project_url', '')}"
+        ]
+        if _ok(recent_resp):
+            stats = recent_resp.json().get("data", {})
+            last_month = stats.get("last_month")
+            results.append(
+                f"  Downloads (last month): {last_month:,}"
+                if isinstance(last_month, int) else "  Downloads (last month): N/A"
+            )
+        if len(responses) > 2 and _ok(responses[2]):
+            rows = sorted(
+                (row for row in responses[2].json().get("data", [])
+                 if row.get("category") == "without_mirrors"),
+                key=lambda row: row.get("date", ""),
+            )
+            daily = [row.get("downloads", 0) for row in rows]
+            if daily:
+                results.append(_format_growth(daily, min(self.history_months, 6)))
+        return results
+
+
+async def _npm_downloads(
+    client: httpx.AsyncClient,
+    period: str,
+    names: list[str],
+) -> dict[str, Any]:
+    """Fetch npm download stats for many packages with as few calls as possible.
+
+    Unscoped names go through the bulk comma-separated endpoint; scoped names
+    are not supported there and are fetched individually, concurrently.
+    """
+    unscoped = [n for n in names if not n.startswith("@")]
+    scoped = [n for n in names if n.startswith("@")]
+    batches = [
+        unscoped[i:i + NPM_BULK_LIMIT] for i in range(0, len(unscoped), NPM_BULK_LIMIT)
+    ]
+    groups = batches + [[n] for n in scoped]
+
+    responses = await asyncio.gather(
+        *(client.get(f"{NPM_DOWNLOADS}/{period}/{','.join(group)}") for group in groups),
+        return_exceptions=True,
+    )
+
+    result: dict[str, Any] = {}
+    for group, resp in zip(groups, responses):
+        if not _ok(resp):
+            continue
+        data = resp.json()
+        if len(group) == 1:
+            # Single-package queries return the stats object itself
+            result[group[0]] = data
+        else:
+            result.update({name: stats for name, stats in data.items() if stats})
+    return result
+
+
+def _ok(resp: Any) -> bool:
+    return isinstance(resp, httpx.Response) and resp.status_code == 200
+
+
+def _format_growth(daily: list[int], months: int) -> str:
+    """Summarize a daily download series as month-over-month and window growth."""
+    if len(daily) < 60:
+        return f"  Daily series: {len(daily)} days (too short for growth)"
+    last_30 = sum(daily[-30:])
+    prev_30 = sum(daily[-60:-30])
+    first_30 = sum(daily[:30])
+    mom = (last_30 - prev_30) / prev_30 * 100 if prev_30 else 0.0
+    window = (last_30 - first_30) / first_30 * 100 if first_30 else 0.0
+    return (
+        f"  Growth: {mom:+.1f}% last 30d vs prior 30d | "
+        f"{window:+.1f}% over {months} months ({len(daily)} days of data)"
+    )
@@ -0,0 +1,11 @@
+"""Query helpers shared by research tools."""
+
+from __future__ import annotations
+
+import re
+
+
+def split_queries(query: str, limit: int) -> list[str]:
+    """Split a run's query into normalized, de-duplicated sub-queries (`;` or newline separated)."""
+    parts = (" ".join(p.split()).lower() for p in re.split(r"[;\n]", query))
+    return list(dict.fromkeys(p for p in parts if p))[:limit]
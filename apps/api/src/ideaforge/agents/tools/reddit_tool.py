@@ -2,15 +2,51 @@
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from crewai.tools import BaseTool
 
-from ...config import settings
+from ...config import AGENT_REGISTRY, settings
+from ...core.rate_limit import TokenBucket
 
 TARGET_SUBREDDITS = [
     "Entrepreneur", "SideProject", "startups", "SaaS",
     "BusinessIdeas", "passive_income", "indiehackers",
 ]
 
+# Shared across all runs: one authenticated client and one request budget
+_rpm = (AGENT_REGISTRY["reddit"].get("rate_limits") or {}).get("rpm", 60)
+_bucket = TokenBucket.per_minute(_rpm, burst=10)
+_reddit: Any = None
+_reddit_lock = threading.Lock()
+
+
+def get_reddit() -> Any:
+    """Return the process-wide `praw.Reddit` instance, creating it on first use."""
+    global _reddit
+    if _reddit is None:
+        with _reddit_lock:
+            if _reddit is None:
+                import praw
+                from prawcore import Requestor
+
+                class _PacedRequestor(Requestor):
+                    """Takes a token from the shared Reddit budget before every request."""
+
+                    def request(self, *args: Any, **kwargs: Any):
+                        _bucket.acquire()
+                        return super().request(*args, **kwargs)
+
+                _reddit = praw.Reddit(
+                    client_id=settings.reddit_client_id,
+                    client_secret=settings.reddit_client_secret,
+                    user_agent=settings.reddit_user_agent,
+                    requestor_class=_PacedRequestor,
+                )
+    return _reddit
+
 
 class RedditResearchTool(BaseTool):
     name: str = "reddit_research"
@@ -19,39 +55,49 @@ class RedditResearchTool(BaseTool):
         "pain points, business ideas, and community feedback."
     )
 
+    # One multireddit search (r/a+b+c) instead of one search per subreddit
+    combined_search: bool = True
+    subreddits: int = 5
+    posts_per_subreddit: int = 3
+    comment_workers: int = 4
+
     def _run(self, query: str) -> str:
         if not settings.reddit_client_id or not settings.reddit_client_secret:
             return "Reddit tool: REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET not configured"
 
         try:
-            import praw
+            reddit = get_reddit()
+            names = TARGET_SUBREDDITS[:self.subreddits]
 
-            reddit = praw.Reddit(
-                client_id=settings.reddit_client_id,
-                client_secret=settings.reddit_client_secret,
-                user_agent=settings.reddit_user_agent,
-            )
+            posts = []
+            if self.combined_search:
+                multireddit = reddit.subreddit("+".join(names))
+                posts = list(multireddit.search(
+                    query, sort="relevance", limit=self.posts_per_subreddit * len(names),
+                ))
+            else:
+                for subreddit_name in names:
+                    try:
+                        subreddit = reddit.subreddit(subreddit_name)
+                        posts.extend(subreddit.search(
+                            query, sort="relevance", limit=self.posts_per_subreddit,
+                        ))
+                    except Exception:
+                        continue
 
-            results = []
+            # Top comments for all hits in parallel (paced by the shared bucket)
+            with ThreadPoolExecutor(max_workers=self.comment_workers) as pool:
+                comments = list(pool.map(lambda p: _top_comments(reddit, p.id), posts))
 
-            for subreddit_name in TARGET_SUBREDDITS[:5]:
-                try:
-                    subreddit = reddit.subreddit(subreddit_name)
-                    for post in subreddit.search(query, sort="relevance", limit=3):
-                        top_comments = []
-                        post.comments.replace_more(limit=0)
-                        for comment in post.comments[:3]:
-                            top_comments.append(comment.body[:200])
-
-                        results.append(
-                            f"r/{subreddit_name}: {post.title}\n"
-                            f"  Score: {post.score} | Comments: {post.num_comments} | "
-                            f"Upvote ratio: {post.upvote_ratio}\n"
-                            f"  URL: https://reddit.com{post.permalink}\n"
-                            f"  Top comments: {top_comments[:2]}"
-                        )
-                except Exception:
-                    continue
+            results = []
+            for post, top_comments in zip(posts, comments):
+                results.append(
+                    f"r/{post.subreddit.display_name}: {post.title}\n"
+                    f"  Score: {post.score} | Comments: {post.num_comments} | "
+                    f"Upvote ratio: {post.upvote_ratio}\n"
+                    f"  URL: https://reddit.com{post.permalink}\n"
+                    f"  Top comments: {top_comments[:2]}"
+                )
 
             return "\n\n".join(results) if results else f"No Reddit results for '{query}'"
 
@@ -59,3 +105,21 @@ class RedditResearchTool(BaseTool):
             return "Reddit tool: praw library not installed"
         except Exception as e:
             return f"Reddit error: {str(e)}"
+
+
+def _top_comments(reddit: Any, post_id: str, limit: int = 3) -> list[str]:
+    """Fetch only the first level of a post's top comments, without a full tree."""
+    try:
+        data = reddit.request(
+            method="GET",
+            path=f"comments/{post_id}",
+            params={"limit": limit, "depth": 1, "sort": "top"},
+        )
+        children = data[1]["data"]["children"]
+        return [
+            c["data"]["body"][:200]
+            for c in children
+            if c.get("kind") == "t1" and c["data"].get("body")
+        ][:limit]
+    except Exception:
+        return []
@@ -2,56 +2,95 @@
 
 from __future__ import annotations
 
+import re
+
+import numpy as np
 from crewai.tools import BaseTool
 
+from ...core.sentiment import label, sentiment_engine
+
+# Optional "[source] text" prefix used for the per-source breakdown
+_SOURCE_PREFIX = re.compile(r"^\[([\w .-]{1,40})\]\s*(.*)$")
+
 
 class SentimentAnalysisTool(BaseTool):
     name: str = "sentiment_analysis"
     description: str = (
         "Analyze the sentiment (positive/negative/neutral) of given text. "
-        "Works locally without API calls. Good for short texts like comments and posts."
+        "Works locally without API calls. Pass one text per line; prefix lines "
+        "with [source] to get a per-source breakdown."
     )
 
+    # Lines listed individually; larger batches show only the extremes
+    max_details: int = 20
+
     def _run(self, text: str) -> str:
         try:
-            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-            analyzer = SentimentIntensityAnalyzer()
-
-            # Handle multiple texts separated by newlines
             lines = [line.strip() for line in text.split("\n") if line.strip()]
 
             if not lines:
                 return "No text provided for sentiment analysis"
 
-            overall_scores = {"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0}
-            results = []
-
-            for line in lines[:20]:  # Limit to 20 texts
-                scores = analyzer.polarity_scores(line)
-                for key in overall_scores:
-                    overall_scores[key] += scores[key]
-
-                label = "positive" if scores["compound"] >= 0.05 else "negative" if scores["compound"] <= -0.05 else "neutral"
-                results.append(f"  [{label}] ({scores['compound']:+.3f}) {line[:100]}")
-
-            count = len(results)
-            avg_compound = overall_scores["compound"] / count
-
-            overall_label = "positive" if avg_compound >= 0.05 else "negative" if avg_compound <= -0.05 else "neutral"
-
-            summary = (
-                f"Sentiment Analysis ({count} texts):\n"
-                f"Overall: {overall_label} (compound: {avg_compound:+.3f})\n"
-                f"Avg scores — pos: {overall_scores['pos']/count:.3f}, "
-                f"neu: {overall_scores['neu']/count:.3f}, "
-                f"neg: {overall_scores['neg']/count:.3f}\n\n"
-                f"Details:\n" + "\n".join(results)
+            texts, sources = [], []
+            for line in lines:
+                match = _SOURCE_PREFIX.match(line)
+                if match and match.group(2):
+                    sources.append(match.group(1).lower())
+                    texts.append(match.group(2))
+                else:
+                    sources.append("")
+                    texts.append(line)
+
+            scores = sentiment_engine.score(texts)
+            summary = sentiment_engine.summarize(
+                texts,
+                sources=sources if any(sources) else None,
+                scores=scores,
             )
-
-            return summary
+            mean, dist = summary["mean"], summary["distribution"]
+
+            parts = [
+                f"Sentiment Analysis ({summary['count']} texts):\n"
+                f"Overall: {summary['label']} (compound: {mean['compound']:+.3f}, "
+                f"std: {summary['compound_std']:.3f})\n"
+                f"Avg scores — pos: {mean['pos']:.3f}, "
+                f"neu: {mean['neu']:.3f}, "
+                f"neg: {mean['neg']:.3f}\n"
+                f"Distribution — positive: {dist['positive']}, "
+                f"neutral: {dist['neutral']}, negative: {dist['negative']}"
+            ]
+
+            if "by_source" in summary:
+                rows = [
+                    f"  {name or 'unlabeled'}: {s['label']} ({s['mean']['compound']:+.3f}, "
+                    f"{s['count']} texts, {s['distribution']['positive']}+/"
+                    f"{s['distribution']['negative']}-)"
+                    for name, s in summary["by_source"].items()
+                ]
+                parts.append("By source:\n" + "\n".join(rows))
+
+            compound = scores[:, 3]
+            if len(texts) <= self.max_details:
+                parts.append("Details:\n" + "\n".join(
+                    _detail(texts[i], compound[i]) for i in range(len(texts))
+                ))
+            else:
+                order = np.argsort(compound, kind="stable")
+                k = self.max_details // 2
+                parts.append("Most positive:\n" + "\n".join(
+                    _detail(texts[i], compound[i]) for i in order[::-1][:k]
+                ))
+                parts.append("Most negative:\n" + "\n".join(
+                    _detail(texts[i], compound[i]) for i in order[:k]
+                ))
+
+            return "\n\n".join(parts)
 
         except ImportError:
             return "Sentiment tool: vaderSentiment not installed"
         except Exception as e:
             return f"Sentiment analysis error: {str(e)}"
+
+
+def _detail(text: str, compound: float) -> str:
+    return f"  [{label(compound)}] ({compound:+.3f}) {text[:100]}"
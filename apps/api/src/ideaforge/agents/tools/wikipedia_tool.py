@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import Any
+from urllib.parse import quote
 
 import httpx
+import numpy as np
 from crewai.tools import BaseTool
 
+from ...core.http_client import get_async_client, run_async
+
+WIKI_API = "https://en.wikipedia.org/w/api.php"
+PAGEVIEWS_API = "https://wikimedia.org/api/rest_v1/metrics/pageviews"
+
+# Daily top-article lists are the same for every query: date -> articles
+_top_articles: dict[str, list[dict[str, Any]]] = {}
+# Days whose list was not published yet (404): date -> monotonic time of the check
+_top_missing: dict[str, float] = {}
+_top_lock = threading.Lock()
+# Seconds before a day that returned 404 is asked for again
+TOP_MISSING_RETRY = 900
+
 
 class WikipediaTrendsTool(BaseTool):
     name: str = "wikipedia_trends_research"
@@ -15,72 +34,159 @@ class WikipediaTrendsTool(BaseTool):
         "Rising pageviews indicate growing public awareness."
     )
 
+    max_candidates: int = 5
+    days: int = 30
+
     def _run(self, query: str) -> str:
         try:
-            client = httpx.Client(
-                timeout=15,
-                headers={"User-Agent": "IdeaForge/0.1 (research tool)"},
-            )
-            results = []
-
-            # Get top viewed pages (most recent available day)
-            today = datetime.now()
-            for days_back in range(1, 5):
-                date = today - timedelta(days=days_back)
-                date_str = date.strftime("%Y/%m/%d")
-                try:
-                    resp = client.get(
-                        f"https://wikimedia.org/api/rest_v1/metrics/pageviews/"
-                        f"top/en.wikipedia/all-access/{date_str}"
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        articles = data.get("items", [{}])[0].get("articles", [])
-                        query_lower = query.lower()
-                        relevant = [
-                            a for a in articles[:200]
-                            if query_lower in a.get("article", "").lower().replace("_", " ")
-                        ]
-                        if relevant:
-                            for a in relevant[:5]:
-                                results.append(
-                                    f"- {a['article'].replace('_', ' ')}: "
-                                    f"{a['views']:,} views on {date_str}"
-                                )
-                        break
-                except Exception:
-                    continue
-
-            # Get pageviews for specific article matching query
-            article_name = query.replace(" ", "_")
-            end = datetime.now()
-            start = end - timedelta(days=30)
-            try:
-                resp = client.get(
-                    f"https://wikimedia.org/api/rest_v1/metrics/pageviews/"
-                    f"per-article/en.wikipedia/all-access/all-agents/"
-                    f"{article_name}/daily/"
-                    f"{start.strftime('%Y%m%d')}/{end.strftime('%Y%m%d')}"
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    items = data.get("items", [])
-                    if items:
-                        views = [i["views"] for i in items]
-                        avg = sum(views) / len(views)
-                        first_week = sum(views[:7]) / 7 if len(views) >= 7 else avg
-                        last_week = sum(views[-7:]) / 7 if len(views) >= 7 else avg
-                        trend = "rising" if last_week > first_week * 1.1 else "stable" if last_week > first_week * 0.9 else "declining"
-                        results.append(
-                            f"\nPageviews for '{query}' (30 days):\n"
-                            f"  Average: {avg:,.0f}/day | Trend: {trend}\n"
-                            f"  First week avg: {first_week:,.0f} | Last week avg: {last_week:,.0f}"
-                        )
-            except Exception:
-                pass
-
-            client.close()
+            results = run_async(self._research(query))
             return "\n".join(results) if results else f"No Wikipedia data for '{query}'"
 
         except Exception as e:
             return f"Wikipedia error: {str(e)}"
+
+    async def _research(self, query: str) -> list[str]:
+        client = get_async_client("wikipedia")
+        (date_str, articles), titles = await asyncio.gather(
+            _latest_top_articles(client),
+            self._resolve_titles(client, query),
+        )
+
+        results = []
+
+        # Candidate or query matches among the most viewed pages of the day
+        needles = [query.lower()] + [t.lower() for t in titles]
+        relevant = [
+            a for a in articles[:200]
+            if any(n in a.get("article", "").lower().replace("_", " ") for n in needles)
+        ]
+        for a in relevant[:5]:
+            results.append(
+                f"- {a['article'].replace('_', ' ')}: "
+                f"{a['views']:,} views on {date_str}"
+            )
+
+        # Daily series for every candidate article, fetched concurrently
+        end = datetime.now()
+        start = end - timedelta(days=self.days)
+        series = await asyncio.gather(*(
+            _pageviews(client, title, start, end) for title in titles
+        ))
+
+        trends = [
+            (title, views) for title, views in zip(titles, series) if len(views) >= 7
+        ]
+        if trends:
+            results.append(f"\nPageviews for '{query}' ({self.days} days):")
+        for title, views in trends:
+            stats = trend_stats(views)
+            results.append(
+                f"- {title}: avg {stats['avg']:,.0f}/day | "
+                f"slope {stats['slope_pct']:+.2f}%/day | Trend: {stats['trend']}\n"
+                f"  First week avg: {stats['first_week']:,.0f} | "
+                f"Last week avg: {stats['last_week']:,.0f}"
+            )
+        return results
+
+    async def _resolve_titles(self, client: httpx.AsyncClient, query: str) -> list[str]:
+        """Resolve a free-text query to candidate article titles in one search call."""
+        try:
+            resp = await client.get(
+                WIKI_API,
+                params={
+                    "action": "query",
+                    "list": "search",
+                    "srsearch": query,
+                    "srlimit": self.max_candidates,
+                    "srprop": "",
+                    "format": "json",
+                },
+            )
+            if resp.status_code == 200:
+                hits = resp.json().get("query", {}).get("search", [])
+                titles = [h["title"] for h in hits if h.get("title")]
+                if titles:
+                    return titles
+        except Exception:
+            pass
+        return [query]
+
+
+def trend_stats(views: list[int]) -> dict[str, Any]:
+    """Average, least-squares slope (% of mean per day) and trend label of a series."""
+    y = np.asarray(views, dtype=float)
+    x = np.arange(len(y))
+    avg = float(y.mean())
+    slope = float(np.polyfit(x, y, 1)[0]) if len(y) > 1 else 0.0
+    slope_pct = slope / avg * 100 if avg else 0.0
+    trend = "rising" if slope_pct > 0.5 else "declining" if slope_pct < -0.5 else "stable"
+    return {
+        "avg": avg,
+        "slope_pct": slope_pct,
+        "trend": trend,
+        "first_week": float(y[:7].mean()),
+        "last_week": float(y[-7:].mean()),
+    }
+
+
+async def _latest_top_articles(client: httpx.AsyncClient) -> tuple[str, list[dict[str, Any]]]:
+    """Most viewed articles for the most recent available day (cached per day)."""
+    today = datetime.now()
+    dates = [(today - timedelta(days=d)).strftime("%Y/%m/%d") for d in range(1, 5)]
+
+    with _top_lock:
+        cached = next(((d, _top_articles[d]) for d in dates if d in _top_articles), None)
+    if cached and cached[0] == dates[0]:
+        return cached
+
+    # Only look for days newer than the cached list and not recently missing, all at once
+    newer = dates[:dates.index(cached[0])] if cached else dates
+    now = time.monotonic()
+    with _top_lock:
+        candidates = [
+            d for d in newer
+            if d not in _top_missing or now - _top_missing[d] >= TOP_MISSING_RETRY
+        ]
+    if cached and not candidates:
+        return cached
+    responses = await asyncio.gather(*(
+        client.get(f"{PAGEVIEWS_API}/top/en.wikipedia/all-access/{date_str}")
+        for date_str in candidates
+    ), return_exceptions=True)
+
+    with _top_lock:
+        for date_str, resp in zip(candidates, responses):
+            if isinstance(resp, httpx.Response) and resp.status_code == 404:
+                _top_missing[date_str] = now
+        for date_str in list(_top_missing):
+            if date_str not in dates:
+                del _top_missing[date_str]
+
+    for date_str, resp in zip(candidates, responses):
+        if isinstance(resp, httpx.Response) and resp.status_code == 200:
+            articles = resp.json().get("items", [{}])[0].get("articles", [])
+            with _top_lock:
+                _top_articles.clear()
+                _top_articles[date_str] = articles
+                _top_missing.pop(date_str, None)
+            return date_str, articles
+    return cached or ("", [])
+
+
+async def _pageviews(
+    client: httpx.AsyncClient,
+    title: str,
+    start: datetime,
+    end: datetime,
+) -> list[int]:
+    article = quote(title.replace(" ", "_"), safe="")
+    try:
+        resp = await client.get(
+            f"{PAGEVIEWS_API}/per-article/en.wikipedia/all-access/all-agents/"
+            f"{article}/daily/{start.strftime('%Y%m%d')}/{end.strftime('%Y%m%d')}"
+        )
+        if resp.status_code != 200:
+            return []
+        return [item["views"] for item in resp.json().get("items", [])]
+    except Exception:
+        return []
@@ -0,0 +1,156 @@
+"""Process-wide YouTube Data API client with batching, caching and quota tracking.
+
+The service object is built once from the static discovery document bundled
+with google-api-python-client. Searches for several sub-queries go out as one
+HTTP batch, video statistics are fetched with a single `videos().list` for all
+uncached IDs, and both are cached with a short TTL. Every call is reserved
+against a daily quota ledger before it is sent (YouTube quota resets at
+midnight Pacific time).
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from ...config import AGENT_REGISTRY, settings
+from ...core.quota import QuotaLedger
+from ...core.ttl_cache import TTLCache
+
+logger = structlog.get_logger()
+
+# YouTube Data API quota costs (units per call)
+SEARCH_COST = 100
+VIDEOS_LIST_COST = 1
+VIDEOS_PER_CALL = 50
+
+
+class YouTubeService:
+    """Thread-safe wrapper around one shared `googleapiclient` Resource."""
+
+    def __init__(self, quota: QuotaLedger, search_ttl: float = 3600, video_ttl: float = 900):
+        self.quota = quota
+        self._service: Any = None
+        self._lock = threading.Lock()
+        self._searches: TTLCache[list[str]] = TTLCache(ttl=search_ttl, max_size=512)
+        self._videos: TTLCache[dict[str, Any]] = TTLCache(ttl=video_ttl, max_size=4096)
+
+    def service(self) -> Any:
+        if self._service is None:
+            with self._lock:
+                if self._service is None:
+                    from googleapiclient.discovery import build
+
+                    self._service = build(
+                        "youtube",
+                        "v3",
+                        developerKey=settings.youtube_api_key,
+                        static_discovery=True,
+                        cache_discovery=False,
+                    )
+        return self._service
+
+    def search(self, queries: list[str], max_results: int = 10) -> dict[str, list[str]]:
+        """Video IDs per query; uncached queries are sent as one batch request.
+
+        Each search is reserved against the quota before it is sent; queries
+        the remaining quota can't cover are left out of the result.
+        """
+        from googleapiclient.http import build_http
+
+        results: dict[str, list[str]] = {}
+        pending = []
+        for q in queries:
+            cached = self._searches.get((q, max_results))
+            if cached is not None:
+                results[q] = cached
+            else:
+                pending.append(q)
+
+        affordable = [q for q in pending if self.quota.try_charge(SEARCH_COST)]
+        if len(affordable) < len(pending):
+            logger.warning(
+                "YouTube quota too low for all searches",
+                skipped=pending[len(affordable):],
+                remaining=self.quota.remaining(),
+            )
+        pending = affordable
+
+        if pending:
+            youtube = self.service()
+            batch = youtube.new_batch_http_request()
+
+            def _on_search(request_id: str, response: Any, exception: Exception | None):
+                q = pending[int(request_id)]
+                if exception is not None:
+                    logger.debug("YouTube search failed", query=q, error=str(exception))
+                    return
+                ids = [item["id"]["videoId"] for item in response.get("items", [])]
+                self._searches.set((q, max_results), ids)
+                results[q] = ids
+
+            for i, q in enumerate(pending):
+                batch.add(
+                    youtube.search().list(
+                        q=q,
+                        part="snippet",
+                        type="video",
+                        order="relevance",
+                        maxResults=max_results,
+                    ),
+                    callback=_on_search,
+                    request_id=str(i),
+                )
+            # httplib2 is not thread-safe: give every execute() its own Http
+            batch.execute(http=build_http())
+
+        return results
+
+    def videos(self, video_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Video resources (snippet + statistics) by ID, fetching only uncached ones."""
+        from googleapiclient.http import build_http
+
+        found: dict[str, dict[str, Any]] = {}
+        missing = []
+        for vid in dict.fromkeys(video_ids):
+            cached = self._videos.get(vid)
+            if cached is not None:
+                found[vid] = cached
+            else:
+                missing.append(vid)
+
+        youtube = self.service()
+        for start in range(0, len(missing), VIDEOS_PER_CALL):
+            chunk = missing[start:start + VIDEOS_PER_CALL]
+            if not self.quota.try_charge(VIDEOS_LIST_COST):
+                break
+            resp = youtube.videos().list(
+                id=",".join(chunk),
+                part="statistics,snippet",
+            ).execute(http=build_http())
+            for video in resp.get("items", []):
+                self._videos.set(video["id"], video)
+                found[video["id"]] = video
+        return found
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "quota": self.quota.snapshot(),
+            "search_cache": self._searches.stats(),
+            "video_cache": self._videos.stats(),
+        }
+
+
+_quota_cfg = AGENT_REGISTRY["youtube"].get("quota") or {}
+
+# Global YouTube service instance
+youtube_service = YouTubeService(
+    QuotaLedger(
+        Path(settings.data_dir) / "youtube_quota.json",
+        limit=_quota_cfg.get("units_per_day", 10_000),
+        reset_tz="America/Los_Angeles",
+    )
+)
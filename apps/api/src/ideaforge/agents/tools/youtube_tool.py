@@ -5,56 +5,60 @@ from __future__ import annotations
 from crewai.tools import BaseTool
 
 from ...config import settings
+from .queries import split_queries
+from .youtube_service import SEARCH_COST, youtube_service
 
 
 class YouTubeResearchTool(BaseTool):
     name: str = "youtube_research"
     description: str = (
         "Search YouTube for trending videos, channels, and engagement "
-        "metrics related to a business topic."
+        "metrics related to a business topic. Separate several search "
+        "queries with ';' to research them in one call."
     )
 
+    max_results: int = 10
+    max_subqueries: int = 5
+
     def _run(self, query: str) -> str:
         if not settings.youtube_api_key:
             return "YouTube tool: YOUTUBE_API_KEY not configured"
 
         try:
-            from googleapiclient.discovery import build
-
-            youtube = build("youtube", "v3", developerKey=settings.youtube_api_key)
-
-            # Search for videos
-            search_resp = youtube.search().list(
-                q=query,
-                part="snippet",
-                type="video",
-                order="relevance",
-                maxResults=10,
-            ).execute()
-
-            video_ids = [item["id"]["videoId"] for item in search_resp.get("items", [])]
-
-            # Get video statistics
-            stats_resp = youtube.videos().list(
-                id=",".join(video_ids),
-                part="statistics,snippet",
-            ).execute()
-
-            results = []
-            for video in stats_resp.get("items", []):
-                snippet = video["snippet"]
-                stats = video.get("statistics", {})
-                results.append(
-                    f"- {snippet['title']}\n"
-                    f"  Channel: {snippet['channelTitle']}\n"
-                    f"  Views: {stats.get('viewCount', 'N/A')} | "
-                    f"Likes: {stats.get('likeCount', 'N/A')} | "
-                    f"Comments: {stats.get('commentCount', 'N/A')}\n"
-                    f"  Published: {snippet['publishedAt']}\n"
-                    f"  URL: https://youtube.com/watch?v={video['id']}"
-                )
-
-            return "\n\n".join(results) if results else f"No YouTube results for '{query}'"
+            queries = split_queries(query, self.max_subqueries) or [query]
+            if youtube_service.quota.remaining() < SEARCH_COST:
+                return "YouTube tool: daily API quota exhausted"
+
+            found = youtube_service.search(queries, max_results=self.max_results)
+            videos = youtube_service.videos([vid for ids in found.values() for vid in ids])
+
+            quota_left = youtube_service.quota.remaining() >= SEARCH_COST
+            sections = []
+            for q in queries:
+                if q not in found and not quota_left:
+                    sections.append(f"=== '{q}' === skipped: daily API quota exhausted")
+                    continue
+                results = []
+                for vid in found.get(q, []):
+                    video = videos.get(vid)
+                    if video is None:
+                        continue
+                    snippet = video["snippet"]
+                    stats = video.get("statistics", {})
+                    results.append(
+                        f"- {snippet['title']}\n"
+                        f"  Channel: {snippet['channelTitle']}\n"
+                        f"  Views: {stats.get('viewCount', 'N/A')} | "
+                        f"Likes: {stats.get('likeCount', 'N/A')} | "
+                        f"Comments: {stats.get('commentCount', 'N/A')}\n"
+                        f"  Published: {snippet['publishedAt']}\n"
+                        f"  URL: https://youtube.com/watch?v={video['id']}"
+                    )
+                if results and len(queries) > 1:
+                    results.insert(0, f"=== '{q}' ===")
+                sections.extend(results)
+
+            return "\n\n".join(sections) if sections else f"No YouTube results for '{query}'"
 
         except ImportError:
             return "YouTube tool: google-api-python-client not installed"
@@ -6,7 +6,16 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...agents.tools.google_search_service import google_search_service
+from ...agents.tools.google_trends_service import google_trends_service
+from ...agents.tools.youtube_service import youtube_service
 from ...config import AGENT_REGISTRY, settings
+from ...core.http_client import http_pool
+from ...core.llm_cache import llm_cache
+from ...core.llm_limiter import llm_limiter
+from ...core.llm_router import llm_router
+from ...core.response_cache import response_cache
+from ...core.token_tracker import usage_registry
 from ...models.agent import AgentRun
 from ...models.database import get_session
 from ...schemas.agent import AgentInfo, AgentRunStatus
@@ -40,6 +49,26 @@ async def list_agents():
     return agents
 
 
+@router.get("/agents/stats")
+async def get_source_stats():
+    """Shared data source infrastructure stats (HTTP pools, caches, quotas, run queue, LLM limits, routing, cache and token usage)."""
+    # Import here to avoid circular imports
+    from ...services.research_scheduler import research_scheduler
+
+    return {
+        "http": http_pool.stats(),
+        "response_cache": response_cache.stats(),
+        "google_search": google_search_service.stats(),
+        "google_trends": google_trends_service.stats(),
+        "youtube": youtube_service.stats(),
+        "research_scheduler": research_scheduler.stats(),
+        "llm_limits": llm_limiter.stats(),
+        "llm_router": llm_router.stats(),
+        "llm_cache": llm_cache.stats(),
+        "token_usage": usage_registry.stats(),
+    }
+
+
 @router.get("/agents/runs/{run_id}", response_model=list[AgentRunStatus])
 async def get_agent_runs(
     run_id: str,
@@ -49,7 +78,7 @@ async def get_agent_runs(
     result = await session.execute(
         select(AgentRun)
         .where(AgentRun.research_run_id == run_id)
-        .order_by(AgentRun.created_at)
+        .order_by(AgentRun.started_at.nullslast(), AgentRun.created_at)
     )
     runs = result.scalars().all()
     return [
@@ -58,7 +87,10 @@ async def get_agent_runs(
             status=r.status.value,
             duration_seconds=r.duration_seconds,
             result_summary=r.result_summary,
+            result_data=r.result_data,
             error_message=r.error_message,
+            started_at=r.started_at,
+            completed_at=r.completed_at,
         )
         for r in runs
     ]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select, func as sa_func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,40 +22,46 @@ router = APIRouter(tags=["research"])
 
 
 @router.post("/research", response_model=ResearchRunResponse)
-async def start_research(
-    req: ResearchRequest,
-    background_tasks: BackgroundTasks,
-):
-    """Start a new research run."""
+async def start_research(req: ResearchRequest):
+    """Queue a new research run (it starts right away if there is capacity)."""
     run_id = str(uuid.uuid4())[:8]
 
     # Import here to avoid circular imports
-    from ...services.research_service import run_research_pipeline
-
-    background_tasks.add_task(
-        run_research_pipeline,
-        run_id=run_id,
-        query=req.query,
-        sources=req.sources,
-        llm_provider=req.llm_provider,
-    )
-
+    from ...services.research_scheduler import ResearchQueueFull, research_scheduler
+
+    try:
+        job = await research_scheduler.submit(
+            run_id=run_id,
+            query=req.query,
+            sources=req.sources,
+            llm_provider=req.llm_provider,
+            mode=req.mode,
+            priority=req.priority,
+        )
+    except ResearchQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+    position = research_scheduler.position(run_id)
     return ResearchRunResponse(
         run_id=run_id,
-        status="started",
+        status="queued" if position else "started",
         query=req.query,
         sources=req.sources,
         llm_provider=req.llm_provider,
+        mode=req.mode,
+        priority=req.priority,
+        queue_position=position,
+        eta_seconds=research_scheduler.eta(job) if position else None,
         created_at=datetime.now(timezone.utc),
     )
 
 
 @router.post("/research/{run_id}/cancel")
 async def cancel_research(run_id: str):
-    """Cancel a running research pipeline."""
-    from ...services.research_service import cancel_research as do_cancel
+    """Cancel a queued or running research pipeline."""
+    from ...services.research_scheduler import research_scheduler
 
-    cancelled = await do_cancel(run_id)
+    cancelled = await research_scheduler.cancel(run_id)
     if not cancelled:
         raise HTTPException(status_code=404, detail="Research run not found or already finished")
     return {"status": "cancelled", "run_id": run_id}
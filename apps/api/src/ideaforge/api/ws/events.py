@@ -5,29 +5,47 @@ from __future__ import annotations
 from typing import Any
 
 
-def agent_started(run_id: str, agent_name: str) -> dict[str, Any]:
+def agent_started(
+    run_id: str, agent_name: str, started_at: str | None = None,
+) -> dict[str, Any]:
     return {
         "type": "agent_started",
         "run_id": run_id,
         "agent_name": agent_name,
+        "started_at": started_at,
     }
 
 
-def agent_completed(run_id: str, agent_name: str, summary: str) -> dict[str, Any]:
+def agent_completed(
+    run_id: str, agent_name: str, summary: str, metrics: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     return {
         "type": "agent_completed",
         "run_id": run_id,
         "agent_name": agent_name,
         "summary": summary,
+        **(metrics or {}),
     }
 
 
-def agent_failed(run_id: str, agent_name: str, error: str) -> dict[str, Any]:
+def agent_failed(
+    run_id: str, agent_name: str, error: str, metrics: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     return {
         "type": "agent_failed",
         "run_id": run_id,
         "agent_name": agent_name,
         "error": error,
+        **(metrics or {}),
+    }
+
+
+def research_queued(run_id: str, position: int, eta_seconds: float | None) -> dict[str, Any]:
+    return {
+        "type": "research_queued",
+        "run_id": run_id,
+        "position": position,
+        "eta_seconds": eta_seconds,
     }
 
 
@@ -23,8 +23,39 @@ class Settings(BaseSettings):
     chroma_host: str = "localhost"
     chroma_port: int = 8100
 
+    # --- Local data (caches, snapshots) ---
+    data_dir: str = "data"
+
+    # --- Research tools HTTP layer ---
+    # HTTP/2 is only used when the optional `h2` package is installed
+    http2_enabled: bool = True
+    response_cache_enabled: bool = True
+    response_cache_max_mb: int = 256
+
+    # --- LLM completion cache ---
+    # Identical agent prompts are answered from disk; near-duplicate matching
+    # (same prompt up to case, whitespace and numbers) is opt-in
+    llm_cache_enabled: bool = True
+    llm_cache_ttl: int = 86_400  # 1 day
+    llm_cache_max_mb: int = 64
+    llm_cache_fuzzy: bool = False
+
     # --- Default LLM Provider ---
     llm_provider: str = "groq"
+    # How each LLM call picks a provider: "pinned" (the run's provider, others only
+    # when it fails or is throttled), "fastest" or "cheapest"
+    llm_routing_policy: str = "pinned"
+    # Providers calls may fail over to, in order (comma-separated); empty = no failover
+    llm_fallback_providers: str = ""
+
+    # --- Research pipeline ---
+    # Sentiment is scored locally before synthesis; the LLM sentiment agent is opt-in
+    sentiment_agent_enabled: bool = False
+    # Source research tasks run concurrently, capped further by the provider's rate limits
+    research_parallelism: int = 4
+    # Research runs executing at once (each provider also has its own cap) and waiting in the queue
+    research_max_concurrent_runs: int = 2
+    research_queue_limit: int = 20
 
     # --- Free LLM API Keys ---
     groq_api_key: str = ""
@@ -59,6 +90,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "groq_api_key",
         "description": "Groq — Llama 3.3 70B (бесплатно, 14K req/день)",
         "rate_limits": {"tpm": 12_000, "rpm": 30, "rpd": 14_400},
+        "max_concurrent_runs": 1,
     },
     "gemini": {
         "model": "gemini/gemini-2.5-flash",
@@ -67,6 +99,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "gemini_api_key",
         "description": "Google Gemini 2.5 Flash (бесплатно, 250-1000 req/день)",
         "rate_limits": {"tpm": 1_000_000, "rpm": 15, "rpd": 1_000},
+        "max_concurrent_runs": 1,
     },
     "ollama": {
         "model": "ollama/llama3.1",
@@ -76,6 +109,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": None,
         "description": "Ollama — локальная модель (бесплатно, без лимитов)",
         "rate_limits": None,
+        "max_concurrent_runs": 1,
     },
     "openrouter": {
         "model": "openrouter/deepseek/deepseek-chat-v3-0324:free",
@@ -84,6 +118,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "openrouter_api_key",
         "description": "OpenRouter — DeepSeek V3 free (50 req/день)",
         "rate_limits": {"tpm": 200_000, "rpm": 20, "rpd": 50},
+        "max_concurrent_runs": 1,
     },
     "cerebras": {
         "model": "cerebras/llama-3.1-70b",
@@ -92,6 +127,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "cerebras_api_key",
         "description": "Cerebras — Llama 3.1 70B (бесплатно, 30 RPM)",
         "rate_limits": {"tpm": 60_000, "rpm": 30, "rpd": 14_400},
+        "max_concurrent_runs": 2,
     },
     "deepseek": {
         "model": "deepseek/deepseek-chat",
@@ -100,6 +136,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "deepseek_api_key",
         "description": "DeepSeek V3 ($0.028/1M tokens)",
         "rate_limits": None,
+        "max_concurrent_runs": 3,
     },
     "openai": {
         "model": "openai/gpt-4o-mini",
@@ -108,6 +145,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "openai_api_key",
         "description": "OpenAI GPT-4o-mini ($0.15/1M tokens)",
         "rate_limits": None,
+        "max_concurrent_runs": 3,
     },
     "anthropic": {
         "model": "anthropic/claude-haiku-4-5",
@@ -116,6 +154,7 @@ LLM_PROVIDERS: dict[str, dict] = {
         "requires_key": "anthropic_api_key",
         "description": "Anthropic Claude Haiku 4.5 ($1/1M tokens)",
         "rate_limits": None,
+        "max_concurrent_runs": 3,
     },
 }
 
@@ -129,6 +168,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов (scraping)",
         "requires_key": None,
         "enabled_default": True,
+        "rate_limits": {"rpm": 10},
+        "sentiment": False,
     },
     "google_search": {
         "name": "Google Search",
@@ -138,6 +179,10 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "2500 бесплатных запросов",
         "requires_key": "serper_api_key",
         "enabled_default": True,
+        "http": {"timeout": 15.0, "max_connections": 4},
+        "cache_ttl": 86_400,  # 1 day
+        # One-time Serper credit pool; below `reserve` only cached queries are answered
+        "quota": {"credits": 2_500, "reserve": 50},
     },
     "wikipedia": {
         "name": "Wikipedia Trends",
@@ -147,6 +192,9 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов",
         "requires_key": None,
         "enabled_default": False,
+        "http": {"timeout": 15.0, "max_connections": 10},
+        "cache_ttl": 21_600,  # 6 hours
+        "sentiment": False,
     },
     "reddit": {
         "name": "Reddit",
@@ -156,6 +204,7 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "60 req/min",
         "requires_key": "reddit_client_id",
         "enabled_default": True,
+        "rate_limits": {"rpm": 60},
     },
     "hackernews": {
         "name": "Hacker News",
@@ -165,6 +214,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов",
         "requires_key": None,
         "enabled_default": True,
+        "http": {"timeout": 10.0, "max_connections": 32, "max_keepalive": 32},
+        "cache_ttl": 0,  # served by the local HN index
     },
     "devto": {
         "name": "DEV.to",
@@ -174,6 +225,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов",
         "requires_key": None,
         "enabled_default": False,
+        "http": {"timeout": 15.0, "max_connections": 10},
+        "cache_ttl": 3_600,  # 1 hour
     },
     "bluesky": {
         "name": "Bluesky",
@@ -183,6 +236,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов",
         "requires_key": "bluesky_handle",
         "enabled_default": False,
+        "http": {"timeout": 15.0, "max_connections": 8},
+        "cache_ttl": 300,  # 5 minutes
     },
     "youtube": {
         "name": "YouTube",
@@ -192,6 +247,7 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "10K units/день",
         "requires_key": "youtube_api_key",
         "enabled_default": True,
+        "quota": {"units_per_day": 10_000},
     },
     "github": {
         "name": "GitHub Trending",
@@ -201,6 +257,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "5000 req/час (auth) / 60 req/час (без)",
         "requires_key": None,
         "enabled_default": True,
+        "http": {"timeout": 15.0, "max_connections": 6},
+        "cache_ttl": 21_600,  # 6 hours
     },
     "packages": {
         "name": "npm/PyPI Trends",
@@ -210,6 +268,11 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "Без лимитов",
         "requires_key": None,
         "enabled_default": False,
+        "http": {"timeout": 15.0, "max_connections": 16, "max_keepalive": 8},
+        "cache_ttl": 43_200,  # 12 hours
+        # Months of daily downloads for local growth rates: 0 (off), 6 or 12
+        "history_months": 0,
+        "sentiment": False,
     },
     "news": {
         "name": "GNews",
@@ -219,6 +282,8 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "100 req/день",
         "requires_key": "gnews_api_key",
         "enabled_default": False,
+        "http": {"timeout": 15.0, "max_connections": 2},
+        "cache_ttl": 3_600,  # 1 hour
     },
     "economic": {
         "name": "Economic Data",
@@ -228,6 +293,9 @@ AGENT_REGISTRY: dict[str, dict] = {
         "limits": "500 req/день (BLS)",
         "requires_key": None,
         "enabled_default": False,
+        "http": {"timeout": 30.0, "max_connections": 6},
+        "cache_ttl": 259_200,  # 3 days
+        "sentiment": False,
     },
 }
 
@@ -0,0 +1,107 @@
+"""Cooperative cancellation for research runs.
+
+A run's `threading.Event` is bound to the current context with
+`cancel_scope()`; code deeper in the stack (LLM and tool hooks, HTTP
+transports, `run_async`) checks it with `is_cancelled()` /
+`check_cancelled()` without the event being passed down. Context
+variables don't cross thread pools, so each worker enters the scope itself.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# How often blocked waits look at the cancel event (seconds)
+POLL_INTERVAL = 0.2
+
+_cancel_event: ContextVar[threading.Event | None] = ContextVar("cancel_event", default=None)
+
+
+class ResearchCancelledError(Exception):
+    """Raised when research is cancelled by user."""
+
+
+@contextmanager
+def cancel_scope(event: threading.Event | None) -> Iterator[None]:
+    """Make `event` the cancel signal for code running in this context."""
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+
+def current_event() -> threading.Event | None:
+    return _cancel_event.get()
+
+
+def is_cancelled() -> bool:
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def check_cancelled() -> None:
+    if is_cancelled():
+        raise ResearchCancelledError("Research cancelled by user")
+
+
+def wait_result(future: Future[T], event: threading.Event | None, timeout: float | None = None) -> T:
+    """`future.result(timeout)` that gives up as soon as `event` is set.
+
+    The future is cancelled (for a coroutine future this aborts the
+    coroutine) and `ResearchCancelledError` is raised.
+    """
+    if event is None:
+        return future.result(timeout)
+    remaining = timeout
+    while True:
+        step = POLL_INTERVAL if remaining is None else min(POLL_INTERVAL, remaining)
+        done, _ = wait([future], timeout=step)
+        if done:
+            return future.result()
+        if event.is_set():
+            future.cancel()
+            raise ResearchCancelledError("Research cancelled by user")
+        if remaining is not None:
+            remaining -= step
+            if remaining <= 0:
+                return future.result(0)
+
+
+def iter_completed(futures: Iterable[Future], event: threading.Event | None) -> Iterator[Future]:
+    """Like `as_completed`, but raises `ResearchCancelledError` once `event` is set."""
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+        if event is not None and event.is_set():
+            raise ResearchCancelledError("Research cancelled by user")
+        yield from done
+
+
+def call_cancellable(
+    event: threading.Event | None, fn: Callable[..., T], *args: Any, **kwargs: Any,
+) -> T:
+    """Run `fn` in a daemon thread inside `cancel_scope(event)` and wait for it.
+
+    On cancellation the caller is released right away; the worker stops at
+    its next cancellation check (or when its in-flight call returns).
+    """
+    future: Future[T] = Future()
+
+    def target() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        with cancel_scope(event):
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=target, name="research-cancellable", daemon=True).start()
+    return wait_result(future, event)
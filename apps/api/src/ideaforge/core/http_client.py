@@ -0,0 +1,413 @@
+"""Shared HTTP client layer for research tools.
+
+Every data source gets one long-lived, pooled `httpx.Client` (and an
+`httpx.AsyncClient` for concurrent fetchers) so repeated runs reuse
+keep-alive connections instead of paying new TCP/TLS handshakes.
+Per-source timeouts and pool limits come from `AGENT_REGISTRY[...]["http"]`.
+
+Successful responses are read through the persistent response cache
+(`core/response_cache.py`) using the source's `cache_ttl` (GET/HEAD only,
+unless the source sets `cache_post`); send `Cache-Control: no-cache` to
+force a refetch, or `Cache-Control: no-store` to bypass the cache entirely.
+
+Sync clients are safe to share between crew worker threads. Async clients
+live on a single background event loop; use `run_async()` to drive them
+from a worker thread.
+
+Inside a cancelled `cancel_scope()` no new requests are sent, and
+`run_async()` aborts the coroutine (and its in-flight requests).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Coroutine, TypeVar
+
+import httpx
+import structlog
+
+from ..config import AGENT_REGISTRY, settings
+from .cancellation import check_cancelled, current_event, wait_result
+from .response_cache import (
+    CachedResponse,
+    request_key,
+    response_cache,
+    source_methods,
+    source_ttl,
+)
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+DEFAULT_HTTP = {
+    "timeout": 15.0,
+    "connect_timeout": 5.0,
+    "max_connections": 10,
+    "max_keepalive": 5,
+    "keepalive_expiry": 30.0,
+}
+
+USER_AGENT = "IdeaForge/0.1 (research tool)"
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _source_config(source: str) -> dict[str, Any]:
+    overrides = AGENT_REGISTRY.get(source, {}).get("http") or {}
+    return {**DEFAULT_HTTP, **overrides}
+
+
+class _PoolStats:
+    """Thread-safe request counters for one source client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_seconds = 0.0
+        self.by_host: dict[str, int] = defaultdict(int)
+
+    def start(self, host: str) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.by_host[host] += 1
+
+    def finish(self, elapsed: float, failed: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.total_seconds += elapsed
+            if failed:
+                self.errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "avg_latency_ms": round(self.total_seconds / self.requests * 1000, 1)
+                if self.requests else 0.0,
+                "by_host": dict(self.by_host),
+            }
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """Counts requests, failures and latency around the pooled transport."""
+
+    def __init__(self, inner: httpx.HTTPTransport, stats: _PoolStats):
+        self.inner = inner
+        self.stats = stats
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        check_cancelled()
+        self.stats.start(request.url.host)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.inner.handle_request(request)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.stats.finish(time.perf_counter() - started, failed)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `_InstrumentedTransport`."""
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, stats: _PoolStats):
+        self.inner = inner
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        check_cancelled()
+        self.stats.start(request.url.host)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = await self.inner.handle_async_request(request)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            self.stats.finish(time.perf_counter() - started, failed)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+def _cache_policy(
+    request: httpx.Request, ttl: float, methods: tuple[str, ...],
+) -> tuple[bool, bool]:
+    """Return (read_from_cache, write_to_cache) for a request."""
+    if not settings.response_cache_enabled or ttl <= 0:
+        return False, False
+    if request.method not in methods:
+        return False, False
+    directives = {d.strip().lower() for d in request.headers.get("cache-control", "").split(",")}
+    if "no-store" in directives:
+        return False, False
+    return "no-cache" not in directives, True
+
+
+# The cache stores decoded bodies, so transfer-level headers are dropped
+_UNCACHED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _cache_entry(response: httpx.Response, body: bytes) -> CachedResponse:
+    return CachedResponse(
+        status=response.status_code,
+        headers=[
+            (k, v) for k, v in response.headers.multi_items()
+            if k.lower() not in _UNCACHED_HEADERS
+        ],
+        body=body,
+    )
+
+
+class _CachingTransport(httpx.BaseTransport):
+    """Reads successful responses through the persistent response cache."""
+
+    def __init__(self, inner: httpx.BaseTransport, source: str):
+        self.inner = inner
+        self.source = source
+        self.ttl = source_ttl(source)
+        self.methods = source_methods(source)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        read, write = _cache_policy(request, self.ttl, self.methods)
+        if not write:
+            return self.inner.handle_request(request)
+
+        key = request_key(request)
+        if read:
+            cached = response_cache.get(self.source, key)
+            if cached is not None:
+                return cached.to_response(request)
+
+        response = self.inner.handle_request(request)
+        if response.status_code != 200:
+            return response
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        entry = _cache_entry(response, body)
+        response_cache.put(self.source, key, entry, self.ttl)
+        return entry.to_response(request)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class _AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `_CachingTransport`."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, source: str):
+        self.inner = inner
+        self.source = source
+        self.ttl = source_ttl(source)
+        self.methods = source_methods(source)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        read, write = _cache_policy(request, self.ttl, self.methods)
+        if not write:
+            return await self.inner.handle_async_request(request)
+
+        key = request_key(request)
+        if read:
+            cached = await asyncio.to_thread(response_cache.get, self.source, key)
+            if cached is not None:
+                return cached.to_response(request)
+
+        response = await self.inner.handle_async_request(request)
+        if response.status_code != 200:
+            return response
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        entry = _cache_entry(response, body)
+        await asyncio.to_thread(response_cache.put, self.source, key, entry, self.ttl)
+        return entry.to_response(request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class HttpClientPool:
+    """Process-wide registry of pooled HTTP clients, one per data source."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: dict[str, httpx.Client] = {}
+        self._async_clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, list[Any]] = defaultdict(list)
+        self._stats: dict[str, _PoolStats] = defaultdict(_PoolStats)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._http2 = settings.http2_enabled and _http2_available()
+
+    def get_client(self, source: str) -> httpx.Client:
+        """Return the shared sync client for a source, creating it on first use."""
+        client = self._clients.get(source)
+        if client is not None:
+            return client
+        with self._lock:
+            if source not in self._clients:
+                cfg = _source_config(source)
+                inner = httpx.HTTPTransport(
+                    http2=self._http2,
+                    limits=self._limits(cfg),
+                    retries=1,
+                )
+                self._transports[source].append(inner)
+                self._clients[source] = httpx.Client(
+                    transport=_CachingTransport(
+                        _InstrumentedTransport(inner, self._stats[source]),
+                        source,
+                    ),
+                    timeout=self._timeout(cfg),
+                    headers={"User-Agent": USER_AGENT},
+                    follow_redirects=True,
+                )
+            return self._clients[source]
+
+    def get_async_client(self, source: str) -> httpx.AsyncClient:
+        """Return the shared async client for a source.
+
+        Only await it on the shared IO loop, i.e. inside a coroutine passed
+        to `run_async()`.
+        """
+        client = self._async_clients.get(source)
+        if client is not None:
+            return client
+        with self._lock:
+            if source not in self._async_clients:
+                cfg = _source_config(source)
+                inner = httpx.AsyncHTTPTransport(
+                    http2=self._http2,
+                    limits=self._limits(cfg),
+                    retries=1,
+                )
+                self._transports[source].append(inner)
+                self._async_clients[source] = httpx.AsyncClient(
+                    transport=_AsyncCachingTransport(
+                        _AsyncInstrumentedTransport(inner, self._stats[source]),
+                        source,
+                    ),
+                    timeout=self._timeout(cfg),
+                    headers={"User-Agent": USER_AGENT},
+                    follow_redirects=True,
+                )
+            return self._async_clients[source]
+
+    def run_async(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the shared IO loop and block until it finishes.
+
+        Gives up (cancelling the coroutine) when the caller's run is cancelled.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("run_async() called from the IO loop thread")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return wait_result(future, current_event(), timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        """Per-source request counters plus live connection pool usage."""
+        result = {}
+        for source, stats in list(self._stats.items()):
+            connections = []
+            for transport in self._transports.get(source, []):
+                connections.extend(getattr(transport._pool, "connections", []))
+            result[source] = {
+                **stats.snapshot(),
+                "connections": len(connections),
+                "idle_connections": sum(1 for c in connections if c.is_idle()),
+                "http2": self._http2,
+            }
+        return result
+
+    async def aclose(self) -> None:
+        """Close every client. Called on application shutdown."""
+        with self._lock:
+            clients = list(self._clients.values())
+            async_clients = list(self._async_clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+            self._transports.clear()
+
+        for client in clients:
+            client.close()
+        if async_clients and self._loop is not None:
+            async def _close_all():
+                for client in async_clients:
+                    await client.aclose()
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(_close_all(), self._loop)
+            )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="ideaforge-http-io",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop_thread = thread
+                self._loop = loop
+        return self._loop
+
+    @staticmethod
+    def _limits(cfg: dict[str, Any]) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=cfg["max_connections"],
+            max_keepalive_connections=cfg["max_keepalive"],
+            keepalive_expiry=cfg["keepalive_expiry"],
+        )
+
+    @staticmethod
+    def _timeout(cfg: dict[str, Any]) -> httpx.Timeout:
+        return httpx.Timeout(cfg["timeout"], connect=cfg["connect_timeout"])
+
+
+# Global client pool instance
+http_pool = HttpClientPool()
+
+
+def get_client(source: str) -> httpx.Client:
+    return http_pool.get_client(source)
+
+
+def get_async_client(source: str) -> httpx.AsyncClient:
+    return http_pool.get_async_client(source)
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    return http_pool.run_async(coro, timeout)
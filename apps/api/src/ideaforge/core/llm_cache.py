@@ -0,0 +1,161 @@
+"""Persistent cache of LLM completions for agent prompts.
+
+Completions are stored in SQLite under `settings.data_dir`, keyed by a hash
+of model, full messages, tools, temperature and stop words, so reruns of a
+query (or a retry after a late failure) don't pay again for identical
+prompts. Native tool-calling exchanges are never cached (`is_cacheable`).
+With `llm_cache_fuzzy` a miss falls back to a near-duplicate lookup: the
+same prompt after normalizing case, whitespace and numbers. Entries expire
+after `llm_cache_ttl` seconds; the cache is size-bounded and evicts least
+recently used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import settings
+from .sqlite_cache import SQLiteCache
+
+_NUMBER = re.compile(r"\d+(?:[.,:\-]\d+)*")
+
+
+
+def _as_messages(messages: Any) -> list[dict[str, Any]]:
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return list(messages or [])
+
+
+def is_cacheable(messages: Any, tools: Any = None) -> bool:
+    """Whether a request may be answered from the cache.
+
+    Native tool calls aren't: their replies and arguments live outside the
+    message text, so near-identical conversations could share a key.
+    """
+    if tools:
+        return False
+    return not any(
+        m.get("role") == "tool" or m.get("tool_calls") or m.get("tool_call_id")
+        for m in _as_messages(messages)
+    )
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NUMBER.sub("0", text.lower()).split())
+
+
+def completion_keys(
+    model: str,
+    messages: Any,
+    tools: Any = None,
+    temperature: float | None = None,
+    stop: list[str] | None = None,
+) -> tuple[str, str]:
+    """Exact and near-duplicate cache keys for a chat request."""
+    params = [model, tools, temperature, sorted(stop or [])]
+    full = _as_messages(messages)
+    normalized = [{**m, "content": _normalize(str(m.get("content") or ""))} for m in full]
+    exact = json.dumps([params, full], sort_keys=True, ensure_ascii=False, default=str)
+    near = json.dumps([params, normalized], sort_keys=True, ensure_ascii=False, default=str)
+    return (
+        hashlib.sha256(exact.encode()).hexdigest(),
+        hashlib.sha256(near.encode()).hexdigest(),
+    )
+
+
+@dataclass
+class CachedCompletion:
+    response: str
+    prompt_tokens: int
+    completion_tokens: int
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class LLMCache(SQLiteCache):
+    """Thread-safe, size-bounded SQLite completion store with hit/miss counters."""
+
+    def __init__(self, path: Path, max_bytes: int, ttl: float, fuzzy: bool = False):
+        super().__init__(
+            path,
+            table="completions",
+            columns=(
+                "near_key TEXT NOT NULL, model TEXT NOT NULL, response TEXT NOT NULL, "
+                "prompt_tokens INTEGER NOT NULL, completion_tokens INTEGER NOT NULL"
+            ),
+            max_bytes=max_bytes,
+            indexes=("near_key",),
+        )
+        self.ttl = ttl
+        self.fuzzy = fuzzy
+        self._hits = 0
+        self._near_hits = 0
+        self._misses = 0
+        self._saved_tokens = 0
+
+    def get(self, key: str, near_key: str | None = None) -> CachedCompletion | None:
+        """Cached completion for `key`, else (with fuzzy lookup on) for `near_key`."""
+        columns = "response, prompt_tokens, completion_tokens"
+        row = self._find(columns, "key = ?", (key,))
+        near = False
+        if row is None and self.fuzzy and near_key is not None:
+            row = self._find(columns, "near_key = ?", (near_key,))
+            near = row is not None
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return None
+            if near:
+                self._near_hits += 1
+            else:
+                self._hits += 1
+            self._saved_tokens += row[1] + row[2]
+        return CachedCompletion(response=row[0], prompt_tokens=row[1], completion_tokens=row[2])
+
+    def put(
+        self,
+        key: str,
+        near_key: str,
+        model: str,
+        completion: CachedCompletion,
+    ) -> None:
+        self._store(
+            key,
+            {
+                "near_key": near_key,
+                "model": model,
+                "response": completion.response,
+                "prompt_tokens": completion.prompt_tokens,
+                "completion_tokens": completion.completion_tokens,
+            },
+            size=len(completion.response.encode()),
+            ttl=self.ttl,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        stats = self._store_stats()
+        with self._lock:
+            stats.update({
+                "hits": self._hits,
+                "near_hits": self._near_hits,
+                "misses": self._misses,
+                "saved_tokens": self._saved_tokens,
+            })
+        return stats
+
+
+# Global LLM completion cache instance
+llm_cache = LLMCache(
+    path=Path(settings.data_dir) / "llm_cache.sqlite3",
+    max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+    ttl=settings.llm_cache_ttl,
+    fuzzy=settings.llm_cache_fuzzy,
+)
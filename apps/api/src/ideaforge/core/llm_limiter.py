@@ -0,0 +1,185 @@
+"""Process-wide admission control for LLM calls, per provider.
+
+Each provider with `rate_limits` in `LLM_PROVIDERS` gets a request bucket
+(rpm), a token bucket (tpm) and a persisted daily request counter (rpd,
+reset at midnight UTC). A call reserves one request and its estimated
+tokens before it is sent, waiting for the buckets to refill instead of
+hitting the provider's 429s, and reconciles the token bucket with the
+actual usage afterwards. All runs share the same buckets.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from ..config import LLM_PROVIDERS, settings
+from .cancellation import POLL_INTERVAL, is_cancelled
+from .quota import QuotaLedger
+from .rate_limit import TokenBucket
+
+logger = structlog.get_logger()
+
+# Rough prompt size: characters per token
+CHARS_PER_TOKEN = 4
+# Completion tokens assumed for a reservation (reconciled with actual usage)
+COMPLETION_ESTIMATE = 512
+
+
+class LLMDailyLimitReached(RuntimeError):
+    """Raised when a provider's daily request limit is used up."""
+
+    def __init__(self, provider: str, limit: int):
+        super().__init__(f"{provider}: daily limit of {limit} LLM requests reached")
+        self.provider = provider
+
+
+def estimate_tokens(messages: Any) -> int:
+    """Estimated prompt + completion tokens for a chat request."""
+    if isinstance(messages, str):
+        chars = len(messages)
+    else:
+        chars = sum(len(str(m.get("content") or "")) for m in messages or [])
+    return chars // CHARS_PER_TOKEN + COMPLETION_ESTIMATE
+
+
+@dataclass
+class Reservation:
+    limiter: ProviderLimiter
+    tokens: int
+    waited: float
+
+
+class ProviderLimiter:
+    """Request, token and daily buckets of one LLM provider."""
+
+    def __init__(self, provider: str, rpm: int | None, tpm: int | None, rpd: int | None):
+        self.provider = provider
+        self.requests = TokenBucket.per_minute(rpm) if rpm else None
+        self.tokens = TokenBucket.per_minute(tpm) if tpm else None
+        self.daily = (
+            QuotaLedger(Path(settings.data_dir) / f"llm_{provider}_requests.json", rpd, reset_tz="UTC")
+            if rpd else None
+        )
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._waited = 0.0
+        self._reserved_tokens = 0
+        self._actual_tokens = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether today's request budget is used up."""
+        return self.daily is not None and self.daily.remaining() <= 0
+
+    def check_daily(self) -> None:
+        """Raise `LLMDailyLimitReached` if today's request budget is used up."""
+        if self.exhausted:
+            raise LLMDailyLimitReached(self.provider, self.daily.limit)
+
+    def wait_estimate(self, tokens: int) -> float:
+        """Seconds a `reserve(tokens)` would currently block, without reserving."""
+        return max(
+            (bucket.wait_time(amount) for bucket, amount in ((self.requests, 1), (self.tokens, tokens))
+             if bucket is not None),
+            default=0.0,
+        )
+
+    def reserve(self, tokens: int) -> Reservation | None:
+        """Block until one request and `tokens` can be spent.
+
+        An estimate above the TPM bucket's capacity waits for a full bucket
+        and charges the rest as debt. Returns None (refunding what was
+        taken) if the run is cancelled while waiting.
+
+        Raises:
+            LLMDailyLimitReached: the daily request budget is used up.
+        """
+        if self.daily is not None and not self.daily.try_charge(1):
+            raise LLMDailyLimitReached(self.provider, self.daily.limit)
+
+        started = time.monotonic()
+        taken: list[tuple[TokenBucket, int]] = []
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is None:
+                continue
+            acquire = min(amount, bucket.capacity)
+            while (wait := bucket.try_acquire(acquire)) > 0:
+                if is_cancelled():
+                    # Abandoned: give back what this reservation already took
+                    for taken_bucket, taken_amount in taken:
+                        taken_bucket.adjust(taken_amount)
+                    if self.daily is not None:
+                        self.daily.charge(-1)
+                    return None
+                time.sleep(min(wait, POLL_INTERVAL))
+            if amount > acquire:
+                # More than a full bucket: charge the rest as debt
+                bucket.adjust(acquire - amount)
+            taken.append((bucket, amount))
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._calls += 1
+            self._waited += waited
+            self._reserved_tokens += tokens
+        if waited >= 1.0:
+            logger.info("LLM call throttled", provider=self.provider, waited=round(waited, 1))
+        return Reservation(self, tokens, waited)
+
+    def reconcile(self, reservation: Reservation, actual_tokens: int | None) -> None:
+        """Settle a reservation with the tokens the call really used.
+
+        With unknown usage (None) the estimate stands.
+        """
+        if actual_tokens is None:
+            actual_tokens = reservation.tokens
+        if self.tokens is not None:
+            self.tokens.adjust(reservation.tokens - actual_tokens)
+        with self._lock:
+            self._actual_tokens += actual_tokens
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = {
+                "calls": self._calls,
+                "waited_seconds": round(self._waited, 1),
+                "reserved_tokens": self._reserved_tokens,
+                "actual_tokens": self._actual_tokens,
+            }
+        if self.requests is not None:
+            stats["requests_available"] = round(self.requests.available, 1)
+        if self.tokens is not None:
+            stats["tokens_available"] = round(self.tokens.available)
+        if self.daily is not None:
+            stats["daily_requests"] = self.daily.snapshot()
+        return stats
+
+
+class LLMLimiter:
+    """Registry of provider limiters built from `LLM_PROVIDERS` rate limits."""
+
+    def __init__(self, providers: dict[str, dict]):
+        self._limiters: dict[str, ProviderLimiter] = {}
+        for provider, config in providers.items():
+            limits = config.get("rate_limits") or {}
+            if any(limits.get(k) for k in ("rpm", "tpm", "rpd")):
+                self._limiters[provider] = ProviderLimiter(
+                    provider, limits.get("rpm"), limits.get("tpm"), limits.get("rpd"),
+                )
+
+    def get(self, provider: str | None) -> ProviderLimiter | None:
+        """Limiter for a provider, None if it has no declared limits."""
+        return self._limiters.get(provider) if provider else None
+
+    def stats(self) -> dict[str, Any]:
+        return {provider: limiter.stats() for provider, limiter in self._limiters.items()}
+
+
+# Global LLM limiter instance
+llm_limiter = LLMLimiter(LLM_PROVIDERS)
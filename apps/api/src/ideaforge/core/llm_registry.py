@@ -2,27 +2,30 @@
 
 from __future__ import annotations
 
+import copy
 import os
+import threading
 
 import structlog
 from crewai import LLM
 
 from ..config import LLM_PROVIDERS, settings
-from .token_tracker import TokenTracker
 
 logger = structlog.get_logger()
 
+# LLM handles are stateless between calls, so one per provider is reused across runs
+_llm_cache: dict[tuple[str, str], LLM] = {}
+_llm_lock = threading.Lock()
 
-def get_llm(
-    provider: str | None = None,
-    token_tracker: TokenTracker | None = None,
-) -> LLM:
-    """Create a CrewAI LLM instance for the given provider.
+
+def get_llm(provider: str | None = None) -> LLM:
+    """Return the CrewAI LLM instance for the given provider.
+
+    Instances are created once per provider (and API key) and shared.
 
     Args:
         provider: LLM provider ID (groq, gemini, ollama, etc.).
                   Defaults to settings.llm_provider.
-        token_tracker: Optional token tracker for usage monitoring.
 
     Returns:
         Configured LLM instance ready for CrewAI agents.
@@ -32,15 +35,46 @@ def get_llm(
     if not config:
         raise ValueError(f"Unknown LLM provider: {provider}")
 
-    model = config["model"]
+    key_field = config.get("requires_key")
+    api_key = getattr(settings, key_field, "") if key_field else ""
+    cache_key = (provider, api_key)
+    llm = _llm_cache.get(cache_key)
+    if llm is not None:
+        return llm
+
+    with _llm_lock:
+        llm = _llm_cache.get(cache_key)
+        if llm is None:
+            llm = _llm_cache[cache_key] = _create_llm(provider, config, api_key)
+    return llm
+
+
+def is_configured(provider: str) -> bool:
+    """Whether a provider is known and has its API key (if it needs one) set."""
+    config = LLM_PROVIDERS.get(provider)
+    if not config:
+        return False
+    key_field = config.get("requires_key")
+    return not key_field or bool(getattr(settings, key_field, ""))
+
+
+def fork_llm(llm: LLM) -> LLM:
+    """Shallow copy of a shared LLM handle with its own usage counters.
+
+    Give one to each agent so its crew's usage metrics cover only that
+    agent; the underlying client and settings stay shared.
+    """
+    forked = copy.copy(llm)
+    forked._token_usage = dict.fromkeys(llm._token_usage, 0)
+    return forked
+
+
+def _create_llm(provider: str, config: dict, api_key: str) -> LLM:
     kwargs: dict = {}
 
     # Set API key in environment for litellm (used by CrewAI)
-    key_field = config.get("requires_key")
-    if key_field:
-        api_key = getattr(settings, key_field, "")
-        if api_key:
-            _set_provider_env(provider, api_key)
+    if api_key:
+        _set_provider_env(provider, api_key)
 
     # Ollama needs base_url
     if "base_url" in config:
@@ -50,29 +84,8 @@ def get_llm(
     kwargs["num_retries"] = 3
     kwargs["timeout"] = 120
 
-    # Wire token tracking via litellm global callback
-    if token_tracker:
-        _install_token_callback(token_tracker)
-
-    return LLM(model=model, **kwargs)
-
-
-def _install_token_callback(tracker: TokenTracker) -> None:
-    """Install a litellm global success callback for token tracking."""
-    import litellm
-
-    def _on_success(kwargs, completion_response, start_time, end_time):
-        try:
-            usage = getattr(completion_response, "usage", None)
-            if usage:
-                tracker.record(
-                    prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
-                    completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
-                )
-        except Exception as e:
-            logger.debug("Token callback error", error=str(e))
-
-    litellm.success_callback = [_on_success]
+    logger.debug("Created LLM handle", provider=provider, model=config["model"])
+    return LLM(model=config["model"], **kwargs)
 
 
 def _set_provider_env(provider: str, api_key: str):
@@ -95,16 +108,11 @@ def get_available_providers() -> list[dict]:
     """Return list of all providers with their availability status."""
     result = []
     for pid, config in LLM_PROVIDERS.items():
-        key_field = config.get("requires_key")
-        available = True
-        if key_field:
-            available = bool(getattr(settings, key_field, ""))
-
         result.append({
             "id": pid,
             "model": config["model"],
             "cost": config["cost"],
             "speed": config["speed"],
-            "available": available,
+            "available": is_configured(pid),
         })
     return result
@@ -0,0 +1,391 @@
+"""LLM router — sends each LLM call to the best available provider.
+
+`get_routed_llm()` returns a `RoutingLLM` over the run's provider plus the
+fallbacks listed in `settings.llm_fallback_providers` (none by default).
+Fallback handles are only built when a call actually lands on them. Every call ranks the candidates by
+`settings.llm_routing_policy`:
+
+- "pinned": the run's provider, then the fallbacks in their configured order;
+- "fastest": lowest rolling latency, plus any wait in `llm_limiter`;
+- "cheapest": lowest price, then fastest.
+
+Providers out of daily requests are skipped. Providers that are cooling down
+after failures, or that would be throttled for long, go to the back. A call
+that fails with a 429, a timeout or a connection/server error moves on to
+the next candidate within the same agent step, and the failing provider
+cools down with exponential backoff.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from typing import Any
+
+import structlog
+from crewai.llms.base_llm import BaseLLM
+
+from ..config import LLM_PROVIDERS, settings
+from .cancellation import ResearchCancelledError, check_cancelled
+from .llm_cache import CachedCompletion, completion_keys, is_cacheable, llm_cache
+from .llm_limiter import LLMDailyLimitReached, estimate_tokens, llm_limiter
+from .llm_registry import fork_llm, get_llm, is_configured
+from .token_tracker import TokenTracker
+
+logger = structlog.get_logger()
+
+ROUTING_POLICIES = ("pinned", "fastest", "cheapest")
+# Weight of the latest call in the rolling latency and error rate
+HEALTH_ALPHA = 0.2
+# Cooldown after a failed call, doubled per consecutive failure (seconds)
+COOLDOWN_BASE = 5.0
+COOLDOWN_MAX = 120.0
+# A provider that would be throttled longer than this is tried after the others (seconds)
+MAX_ADMISSION_WAIT = 5.0
+# Latency assumed until a provider has served calls, by its `speed` (seconds)
+SPEED_LATENCY = {"ultra-fast": 1.5, "fast": 3.0, "medium": 8.0}
+DEFAULT_LATENCY = 5.0
+
+
+def failover_reason(exc: BaseException) -> str | None:
+    """Why a failed call should go to another provider; None if it shouldn't.
+
+    Looks at the exception and its causes, matching LiteLLM and native SDK
+    errors by status code or class name.
+    """
+    for _ in range(5):
+        if exc is None or isinstance(exc, ResearchCancelledError):
+            return None
+        name = type(exc).__name__
+        status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+        if not isinstance(status, int):
+            status = None
+        if status == 429 or "RateLimit" in name:
+            return "rate_limit"
+        if isinstance(exc, TimeoutError) or "Timeout" in name or status == 408:
+            return "timeout"
+        if (status is not None and status >= 500) or any(
+            marker in name for marker in ("Connect", "ServiceUnavailable", "InternalServer")
+        ):
+            return "unavailable"
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def _price(provider: str) -> float:
+    """Price per 1M tokens from the `cost` label ("free" is 0)."""
+    cost = LLM_PROVIDERS[provider].get("cost", "")
+    if cost == "free":
+        return 0.0
+    match = re.search(r"\$([\d.]+)", cost)
+    return float(match.group(1)) if match else math.inf
+
+
+class ProviderHealth:
+    """Rolling latency, error rate and failure cooldown of one provider."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.latency = SPEED_LATENCY.get(LLM_PROVIDERS[provider].get("speed", ""), DEFAULT_LATENCY)
+        self.error_rate = 0.0
+        self.failures = 0  # consecutive
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.errors = 0
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def expected_latency(self) -> float:
+        """Rolling latency inflated by the share of calls that fail."""
+        return self.latency / max(0.1, 1.0 - self.error_rate)
+
+    def record_success(self, seconds: float) -> None:
+        self.calls += 1
+        self.latency = HEALTH_ALPHA * seconds + (1 - HEALTH_ALPHA) * self.latency
+        self.error_rate *= 1 - HEALTH_ALPHA
+        self.failures = 0
+        self.cooldown_until = 0.0
+
+    def record_failure(self) -> float:
+        """Count a failed call and start its cooldown. Returns the cooldown (seconds)."""
+        self.calls += 1
+        self.errors += 1
+        self.error_rate = HEALTH_ALPHA + (1 - HEALTH_ALPHA) * self.error_rate
+        self.failures += 1
+        cooldown = min(COOLDOWN_MAX, COOLDOWN_BASE * 2 ** (self.failures - 1))
+        self.cooldown_until = time.monotonic() + cooldown
+        return cooldown
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_seconds": round(self.latency, 2),
+            "error_rate": round(self.error_rate, 3),
+            "cooldown_seconds": round(max(0.0, self.cooldown_until - time.monotonic()), 1),
+        }
+
+
+class LLMRouter:
+    """Provider health shared by all runs, and the ranking built on it."""
+
+    def __init__(self, providers: dict[str, dict]):
+        self._health = {provider: ProviderHealth(provider) for provider in providers}
+        self._lock = threading.Lock()
+        self._failovers = 0
+
+    @staticmethod
+    def policy() -> str:
+        policy = settings.llm_routing_policy.strip().lower()
+        return policy if policy in ROUTING_POLICIES else "pinned"
+
+    def candidates(self, primary: str) -> list[str]:
+        """The run's provider followed by the explicitly configured fallbacks."""
+        names = [p.strip() for p in settings.llm_fallback_providers.split(",") if p.strip()]
+        fallbacks = [
+            p for p in dict.fromkeys(names)
+            if p != primary and p in self._health and is_configured(p)
+        ]
+        return [primary, *fallbacks]
+
+    def rank(self, candidates: list[str], tokens: int) -> list[str]:
+        """Order candidates for a call of about `tokens` tokens.
+
+        Raises:
+            LLMDailyLimitReached: every candidate is out of daily requests.
+        """
+        policy = self.policy()
+        usable: list[tuple[tuple, str]] = []
+        with self._lock:
+            for index, provider in enumerate(candidates):
+                limiter = llm_limiter.get(provider)
+                if limiter is not None and limiter.exhausted:
+                    continue
+                health = self._health[provider]
+                wait = limiter.wait_estimate(tokens) if limiter is not None else 0.0
+                demoted = health.cooling_down or wait > MAX_ADMISSION_WAIT
+                latency = health.expected_latency() + wait
+                if policy == "fastest":
+                    score: tuple = (latency, index)
+                elif policy == "cheapest":
+                    score = (_price(provider), latency, index)
+                else:
+                    score = (index,)
+                usable.append(((demoted, *score), provider))
+
+        if not usable:
+            llm_limiter.get(candidates[0]).check_daily()
+        return [provider for _, provider in sorted(usable)]
+
+    def record_success(self, provider: str, seconds: float, failed_over: bool) -> None:
+        with self._lock:
+            self._health[provider].record_success(seconds)
+            if failed_over:
+                self._failovers += 1
+
+    def record_failure(self, provider: str) -> float:
+        with self._lock:
+            return self._health[provider].record_failure()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "policy": self.policy(),
+                "failovers": self._failovers,
+                "providers": {p: health.stats() for p, health in self._health.items()},
+            }
+
+
+class RoutingLLM(BaseLLM):
+    """CrewAI LLM that routes every call through `LLMRouter`.
+
+    Capabilities (function calling, stop words, context window) are the
+    primary provider's; a fallback that can't serve a call on those terms is
+    skipped, as is one whose handle can't be built (e.g. a missing SDK).
+    Usage of the provider handles it calls is added to its own counters,
+    so `fork_llm()` copies keep per-agent metrics as with a plain handle.
+    Each call is also recorded, with its provider and latency, in the run's
+    token tracker. Plain-text completions go through `llm_cache`, keyed by
+    the run's model; hits are reported to the tracker as saved tokens.
+    """
+
+    def __init__(
+        self,
+        router: LLMRouter,
+        providers: list[str],
+        token_tracker: TokenTracker | None = None,
+    ):
+        primary = get_llm(providers[0])
+        super().__init__(model=primary.model, temperature=primary.temperature, provider="router")
+        self.router = router
+        self.providers = providers
+        self.token_tracker = token_tracker
+        # Fallbacks whose handle failed to build; shared with this LLM's forks
+        self._unusable: set[str] = set()
+
+    def call(
+        self,
+        messages: str | list[dict[str, Any]],
+        tools: list[dict] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any | None = None,
+        from_agent: Any | None = None,
+        response_model: Any | None = None,
+    ) -> str | Any:
+        # Tool calls, function execution and structured output aren't replayed
+        cache_keys = None
+        if (
+            settings.llm_cache_enabled
+            and available_functions is None
+            and response_model is None
+            and is_cacheable(messages, tools)
+        ):
+            cache_keys = completion_keys(self.model, messages, tools, self.temperature, self.stop)
+            cached = llm_cache.get(*cache_keys)
+            if cached is not None:
+                if self.token_tracker is not None:
+                    self.token_tracker.record_cache_hit(cached.prompt_tokens, cached.completion_tokens)
+                return cached.response
+
+        tokens = estimate_tokens(messages)
+        order = self.router.rank([p for p in self.providers if p not in self._unusable], tokens)
+        error: Exception | None = None
+
+        for attempt, provider in enumerate(order):
+            check_cancelled()
+            llm = self._handle(provider, tools, tokens, last=attempt == len(order) - 1)
+            if llm is None:
+                continue
+            limiter = llm_limiter.get(provider)
+            reservation = None
+            if limiter is not None:
+                try:
+                    reservation = limiter.reserve(tokens)
+                except LLMDailyLimitReached as e:
+                    error = e
+                    continue
+                if reservation is None:
+                    raise ResearchCancelledError("Research cancelled by user")
+
+            started = time.monotonic()
+            try:
+                result = llm.call(
+                    messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                    response_model=response_model,
+                )
+            except Exception as e:
+                if reservation is not None:
+                    limiter.reconcile(reservation, None)
+                reason = failover_reason(e)
+                if reason is None:
+                    raise
+                cooldown = self.router.record_failure(provider)
+                logger.warning(
+                    "LLM provider failed, failing over",
+                    provider=provider,
+                    reason=reason,
+                    cooldown=cooldown,
+                    error=str(e)[:200],
+                )
+                error = e
+                continue
+
+            elapsed = time.monotonic() - started
+            self.router.record_success(provider, elapsed, failed_over=attempt > 0)
+            used = self._add_usage(llm)
+            if self.token_tracker is not None:
+                self.token_tracker.record(
+                    llm._token_usage.get("prompt_tokens", 0),
+                    llm._token_usage.get("completion_tokens", 0),
+                    provider=provider,
+                    seconds=elapsed,
+                )
+            if reservation is not None:
+                limiter.reconcile(reservation, used or None)
+            if cache_keys is not None and isinstance(result, str) and result.strip():
+                llm_cache.put(*cache_keys, model=self.model, completion=CachedCompletion(
+                    response=result,
+                    prompt_tokens=llm._token_usage.get("prompt_tokens", 0),
+                    completion_tokens=llm._token_usage.get("completion_tokens", 0),
+                ))
+            if attempt > 0:
+                logger.info("LLM call served by fallback", provider=provider, primary=self.providers[0])
+            return result
+
+        if error is None:
+            raise RuntimeError(f"No LLM provider could serve the call (tried {', '.join(order)})")
+        raise error
+
+    def check_available(self) -> None:
+        """Raise `LLMDailyLimitReached` if no provider has requests left today."""
+        self.router.rank(self.providers, 0)
+
+    def supports_function_calling(self) -> bool:
+        return get_llm(self.providers[0]).supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return get_llm(self.providers[0]).supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return get_llm(self.providers[0]).get_context_window_size()
+
+    def _handle(self, provider: str, tools: Any, tokens: int, last: bool) -> BaseLLM | None:
+        """Per-call copy of a provider's shared handle with this LLM's stop words.
+
+        Returns None for a fallback that can't take the call: its handle
+        fails to build, it lacks native tool calls the call relies on, or
+        the prompt exceeds its context window. LiteLLM's own retries are
+        skipped while other providers remain to try.
+        """
+        try:
+            shared = get_llm(provider)
+        except Exception as e:
+            if provider == self.providers[0]:
+                raise
+            self._unusable.add(provider)
+            logger.warning("LLM fallback unavailable", provider=provider, error=str(e)[:200])
+            return None
+        if provider != self.providers[0]:
+            if tools and not shared.supports_function_calling():
+                return None
+            if tokens > shared.get_context_window_size():
+                return None
+
+        llm = fork_llm(shared)
+        llm.stop = list(self.stop)
+        if not last and "num_retries" in getattr(llm, "additional_params", {}):
+            llm.additional_params = {**llm.additional_params, "num_retries": 0}
+        return llm
+
+    def _add_usage(self, llm: BaseLLM) -> int:
+        for key, value in llm._token_usage.items():
+            self._token_usage[key] = self._token_usage.get(key, 0) + value
+        return llm._token_usage.get("total_tokens", 0)
+
+
+def get_routed_llm(
+    provider: str | None = None,
+    token_tracker: TokenTracker | None = None,
+) -> RoutingLLM:
+    """Routing LLM for a run on `provider` (defaults to settings.llm_provider).
+
+    Raises:
+        ValueError: unknown provider.
+    """
+    provider = provider or settings.llm_provider
+    get_llm(provider)
+    return RoutingLLM(llm_router, llm_router.candidates(provider), token_tracker=token_tracker)
+
+
+# Global LLM router instance
+llm_router = LLMRouter(LLM_PROVIDERS)
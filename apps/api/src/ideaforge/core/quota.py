@@ -0,0 +1,89 @@
+"""Persistent usage ledgers for metered external APIs."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class QuotaLedger:
+    """Thread-safe unit counter persisted as JSON so restarts don't reset it.
+
+    With `reset_tz` the budget renews at midnight in that timezone (daily
+    quotas); without it the budget is a one-time credit pool.
+    """
+
+    def __init__(self, path: Path, limit: int, reset_tz: str | None = None):
+        self.path = path
+        self.limit = limit
+        self._tz = ZoneInfo(reset_tz) if reset_tz else None
+        self._lock = threading.Lock()
+        self._period = ""
+        self._used = 0
+        self._loaded = False
+
+    def charge(self, units: int) -> None:
+        with self._lock:
+            self._roll()
+            self._used += units
+            self._save()
+
+    def try_charge(self, units: int) -> bool:
+        """Charge `units` only if they fit in the remaining budget."""
+        with self._lock:
+            self._roll()
+            if self._used + units > self.limit:
+                return False
+            self._used += units
+            self._save()
+            return True
+
+    def exhaust(self) -> None:
+        """Mark the budget as spent (e.g. the API reported no credits left)."""
+        with self._lock:
+            self._roll()
+            self._used = max(self._used, self.limit)
+            self._save()
+
+    def remaining(self) -> int:
+        return self.snapshot()["remaining"]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._roll()
+            return {
+                "period": self._period or "total",
+                "used": self._used,
+                "limit": self.limit,
+                "remaining": max(0, self.limit - self._used),
+            }
+
+    def _roll(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._period, self._used = data["period"], int(data["used"])
+            except (OSError, ValueError, KeyError):
+                pass
+        if self._tz is not None:
+            today = datetime.now(self._tz).strftime("%Y-%m-%d")
+            if today != self._period:
+                self._period, self._used = today, 0
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps({"period": self._period, "used": self._used}), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.debug("Could not persist quota ledger", path=str(self.path), error=str(e))
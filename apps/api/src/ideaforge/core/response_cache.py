@@ -0,0 +1,135 @@
+"""Persistent TTL cache for external data source responses.
+
+Responses are stored in SQLite under `settings.data_dir`, keyed by a hash
+of method, URL, sorted query params, body and the request headers that
+change the response (auth, Accept). Each source gets its own TTL from
+`AGENT_REGISTRY[...]["cache_ttl"]` (seconds, 0 disables caching). Only GET
+and HEAD are cached unless a source opts POST in with `"cache_post": True`.
+The cache is size-bounded and evicts least recently used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from ..config import AGENT_REGISTRY, settings
+from .sqlite_cache import SQLiteCache
+
+logger = structlog.get_logger()
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+# Request headers that change the response, so they are part of the key
+VARY_HEADERS = ("accept", "accept-language", "authorization", "cookie", "x-api-key")
+
+
+
+def source_ttl(source: str) -> float:
+    """TTL in seconds for a source's cached responses (0 = not cached)."""
+    return float(AGENT_REGISTRY.get(source, {}).get("cache_ttl") or 0)
+
+
+def source_methods(source: str) -> tuple[str, ...]:
+    """HTTP methods whose responses are cached for a source."""
+    if AGENT_REGISTRY.get(source, {}).get("cache_post"):
+        return (*CACHEABLE_METHODS, "POST")
+    return CACHEABLE_METHODS
+
+
+def request_key(request: httpx.Request) -> str:
+    """Content-addressed cache key for an outgoing request."""
+    url = request.url
+    body = request.content if request.method != "GET" else b""
+    payload = json.dumps(
+        [
+            request.method,
+            f"{url.scheme}://{url.host}{url.path}",
+            sorted(url.params.multi_items()),
+            hashlib.sha256(body).hexdigest(),
+            [
+                [name, hashlib.sha256(value.encode()).hexdigest()]
+                for name in VARY_HEADERS
+                if (value := request.headers.get(name)) is not None
+            ],
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.body,
+            request=request,
+        )
+
+
+class ResponseCache(SQLiteCache):
+    """Thread-safe, size-bounded SQLite response store with per-source hit/miss counters."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        super().__init__(
+            path,
+            table="responses",
+            columns=(
+                "source TEXT NOT NULL, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, body BLOB NOT NULL"
+            ),
+            max_bytes=max_bytes,
+        )
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+
+    def get(self, source: str, key: str) -> CachedResponse | None:
+        row = self._find("status, headers, body", "key = ?", (key,))
+        with self._lock:
+            if row is None:
+                self._misses[source] += 1
+                return None
+            self._hits[source] += 1
+        return CachedResponse(status=row[0], headers=json.loads(row[1]), body=row[2])
+
+    def put(self, source: str, key: str, response: CachedResponse, ttl: float) -> None:
+        self._store(
+            key,
+            {
+                "source": source,
+                "status": response.status,
+                "headers": json.dumps(response.headers),
+                "body": response.body,
+            },
+            size=len(response.body),
+            ttl=ttl,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        stats = self._store_stats()
+        with self._lock:
+            sources = set(self._hits) | set(self._misses)
+            stats["by_source"] = {
+                s: {"hits": self._hits[s], "misses": self._misses[s]}
+                for s in sorted(sources)
+            }
+        return stats
+
+
+# Global response cache instance
+response_cache = ResponseCache(
+    path=Path(settings.data_dir) / "response_cache.sqlite3",
+    max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+)
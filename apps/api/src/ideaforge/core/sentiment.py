@@ -0,0 +1,98 @@
+"""Process-wide VADER sentiment engine with a batch API.
+
+The VADER lexicon is loaded once per process. Texts are scored in batches
+(duplicates scored once) into a NumPy array, and aggregates — means, label
+distribution and per-source breakdown — are computed on that array.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Sequence
+
+import numpy as np
+
+# VADER's recommended compound thresholds
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+# Columns of the score array returned by `SentimentEngine.score()`
+SCORE_COLUMNS = ("neg", "neu", "pos", "compound")
+LABELS = ("negative", "neutral", "positive")
+
+
+def label(compound: float) -> str:
+    return "positive" if compound >= POSITIVE_THRESHOLD else "negative" if compound <= NEGATIVE_THRESHOLD else "neutral"
+
+
+def label_codes(compound: np.ndarray) -> np.ndarray:
+    """Index into LABELS for every compound score (0=negative, 1=neutral, 2=positive)."""
+    return np.digitize(compound, [NEGATIVE_THRESHOLD + 1e-12, POSITIVE_THRESHOLD])
+
+
+class SentimentEngine:
+    """Shared VADER analyzer; safe to use from any thread."""
+
+    def __init__(self, max_text_chars: int = 2000):
+        self.max_text_chars = max_text_chars
+        self._analyzer: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def analyzer(self) -> Any:
+        if self._analyzer is None:
+            with self._lock:
+                if self._analyzer is None:
+                    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+                    self._analyzer = SentimentIntensityAnalyzer()
+        return self._analyzer
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """Score texts into an (n, 4) float array with columns SCORE_COLUMNS."""
+        analyzer = self.analyzer
+        unique = {t: i for i, t in enumerate(dict.fromkeys(texts))}
+        table = np.empty((len(unique), len(SCORE_COLUMNS)), dtype=float)
+        for text, i in unique.items():
+            s = analyzer.polarity_scores(text[:self.max_text_chars])
+            table[i] = (s["neg"], s["neu"], s["pos"], s["compound"])
+        if not texts:
+            return table
+        return table[np.fromiter((unique[t] for t in texts), dtype=np.intp, count=len(texts))]
+
+    def summarize(
+        self,
+        texts: Sequence[str],
+        sources: Sequence[str] | None = None,
+        scores: np.ndarray | None = None,
+    ) -> dict[str, Any]:
+        """Aggregate sentiment of a batch, optionally broken down by source."""
+        if scores is None:
+            scores = self.score(texts)
+        summary = _aggregate(scores)
+        if sources is not None and len(sources):
+            names, groups = np.unique(np.asarray(sources, dtype=object), return_inverse=True)
+            summary["by_source"] = {
+                str(name): _aggregate(scores[groups == i]) for i, name in enumerate(names)
+            }
+        return summary
+
+
+def _aggregate(scores: np.ndarray) -> dict[str, Any]:
+    count = len(scores)
+    if not count:
+        return {"count": 0, "label": "neutral", "mean": dict.fromkeys(SCORE_COLUMNS, 0.0),
+                "compound_std": 0.0, "distribution": dict.fromkeys(LABELS, 0)}
+    mean = scores.mean(axis=0)
+    counts = np.bincount(label_codes(scores[:, 3]), minlength=len(LABELS))
+    return {
+        "count": count,
+        "label": label(float(mean[3])),
+        "mean": {col: float(v) for col, v in zip(SCORE_COLUMNS, mean)},
+        "compound_std": float(scores[:, 3].std()),
+        "distribution": {name: int(n) for name, n in zip(LABELS, counts)},
+    }
+
+
+# Global sentiment engine instance
+sentiment_engine = SentimentEngine()
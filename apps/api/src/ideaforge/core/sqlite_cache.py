@@ -0,0 +1,126 @@
+"""Size-bounded SQLite key/value table with TTL expiry and LRU eviction.
+
+Shared base of the persistent caches (`core/response_cache.py`,
+`core/llm_cache.py`). Every table has a `key` primary key plus `size`,
+`expires_at` and `last_access` columns; subclasses declare their own value
+columns and keep their own hit/miss counters.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+class SQLiteCache:
+    """Thread-safe SQLite cache table that evicts least recently used entries."""
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        columns: str,
+        max_bytes: int,
+        indexes: tuple[str, ...] = (),
+    ):
+        self.path = path
+        self.table = table
+        self.max_bytes = max_bytes
+        self._schema = (
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"key TEXT PRIMARY KEY, {columns}, size INTEGER NOT NULL, "
+            f"expires_at REAL NOT NULL, last_access REAL NOT NULL);\n"
+            + "".join(
+                f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column});\n"
+                for column in ("last_access", *indexes)
+            )
+        )
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._total_bytes = 0
+        self._evictions = 0
+
+    def _find(self, columns: str, where: str, params: tuple[Any, ...]) -> tuple[Any, ...] | None:
+        """Most recently used live row matching `where`, marked as used again."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                f"SELECT key, {columns} FROM {self.table} "
+                f"WHERE {where} AND expires_at >= ? ORDER BY last_access DESC LIMIT 1",
+                (*params, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (now, row[0]))
+            conn.commit()
+        return row[1:]
+
+    def _store(self, key: str, values: dict[str, Any], size: int, ttl: float) -> None:
+        """Insert or replace an entry of `size` bytes, evicting if over budget."""
+        if size > self.max_bytes // 10:
+            return  # a single entry may not take over the cache
+        now = time.time()
+        row = {**values, "key": key, "size": size, "expires_at": now + ttl, "last_access": now}
+        with self._lock:
+            conn = self._connect()
+            old = conn.execute(f"SELECT size FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} ({', '.join(row)}) "
+                f"VALUES ({', '.join('?' for _ in row)})",
+                tuple(row.values()),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _store_stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = 0
+            if self._conn is not None:
+                entries = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            return {
+                "entries": entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then LRU entries until 90% of the size budget."""
+        conn.execute(f"DELETE FROM {self.table} WHERE expires_at < ?", (time.time(),))
+        self._total_bytes = conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.table}"
+        ).fetchone()[0]
+        target = int(self.max_bytes * 0.9)
+        rows = conn.execute(f"SELECT key, size FROM {self.table} ORDER BY last_access").fetchall()
+        victims = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            victims.append((key,))
+            self._total_bytes -= size
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", victims)
+        self._evictions += len(victims)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self._schema)
+            self._total_bytes = conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
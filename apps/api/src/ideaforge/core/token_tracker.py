@@ -1,11 +1,25 @@
-"""Token usage tracker for research runs."""
+"""Token usage tracker for research runs.
+
+Each run's `TokenTracker` is fed directly by the run's LLM handle
+(`RoutingLLM`), so concurrent runs never see each other's calls. Every call
+is also added to the process-wide per-provider totals in `usage_registry`,
+which keeps the trackers of active runs and a rolling one-minute token
+count per provider for TPM headroom.
+"""
 
 from __future__ import annotations
 
 import threading
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from dataclasses import dataclass
 from typing import Any, Callable
 
+from ..config import LLM_PROVIDERS
+
+# Window of the per-provider tokens-per-minute figure (seconds)
+TPM_WINDOW = 60.0
+
 
 @dataclass
 class TokenUsage:
@@ -13,6 +27,106 @@ class TokenUsage:
     completion_tokens: int = 0
     total_tokens: int = 0
     llm_calls: int = 0
+    llm_seconds: float = 0.0
+    cache_hits: int = 0
+    saved_tokens: int = 0
+
+    def add(self, prompt_tokens: int, completion_tokens: int, seconds: float) -> None:
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.total_tokens += prompt_tokens + completion_tokens
+        self.llm_calls += 1
+        self.llm_seconds += seconds
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Completion throughput while waiting on the LLM."""
+        if self.llm_seconds <= 0:
+            return None
+        return round(self.completion_tokens / self.llm_seconds, 1)
+
+
+class ProviderUsage:
+    """Token usage of one LLM provider across all runs."""
+
+    def __init__(self) -> None:
+        self.usage = TokenUsage()
+        # (monotonic time, tokens) of calls within the last TPM_WINDOW
+        self._recent: deque[tuple[float, int]] = deque()
+
+    def record(self, prompt_tokens: int, completion_tokens: int, seconds: float) -> None:
+        self.usage.add(prompt_tokens, completion_tokens, seconds)
+        self._recent.append((time.monotonic(), prompt_tokens + completion_tokens))
+
+    def tokens_last_minute(self) -> int:
+        cutoff = time.monotonic() - TPM_WINDOW
+        while self._recent and self._recent[0][0] < cutoff:
+            self._recent.popleft()
+        return sum(tokens for _, tokens in self._recent)
+
+    def stats(self, tpm_limit: int | None) -> dict[str, Any]:
+        tpm = self.tokens_last_minute()
+        return {
+            "prompt_tokens": self.usage.prompt_tokens,
+            "completion_tokens": self.usage.completion_tokens,
+            "total_tokens": self.usage.total_tokens,
+            "llm_calls": self.usage.llm_calls,
+            "avg_latency_seconds": (
+                round(self.usage.llm_seconds / self.usage.llm_calls, 2) if self.usage.llm_calls else None
+            ),
+            "tokens_per_second": self.usage.tokens_per_second,
+            "tokens_last_minute": tpm,
+            "tpm_limit": tpm_limit,
+            "tpm_headroom": tpm_limit - tpm if tpm_limit else None,
+        }
+
+
+class UsageRegistry:
+    """Trackers of active runs and process-wide token usage per provider."""
+
+    def __init__(self) -> None:
+        self._trackers: dict[str, TokenTracker] = {}
+        self._providers: dict[str, ProviderUsage] = {}
+        self._lock = threading.Lock()
+
+    def register(self, tracker: TokenTracker) -> None:
+        with self._lock:
+            self._trackers[tracker.run_id] = tracker
+
+    def unregister(self, run_id: str) -> None:
+        with self._lock:
+            self._trackers.pop(run_id, None)
+
+    def record(self, provider: str, prompt_tokens: int, completion_tokens: int, seconds: float) -> None:
+        with self._lock:
+            usage = self._providers.get(provider)
+            if usage is None:
+                usage = self._providers[provider] = ProviderUsage()
+            usage.record(prompt_tokens, completion_tokens, seconds)
+
+    def tokens_last_minute(self, provider: str) -> int:
+        """Tokens all runs spent on a provider within the last minute."""
+        with self._lock:
+            usage = self._providers.get(provider)
+            return usage.tokens_last_minute() if usage else 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            trackers = list(self._trackers.values())
+            providers = {
+                provider: usage.stats(
+                    (LLM_PROVIDERS.get(provider, {}).get("rate_limits") or {}).get("tpm"),
+                )
+                for provider, usage in self._providers.items()
+            }
+        return {
+            "active_runs": [tracker.snapshot() for tracker in trackers],
+            "providers": providers,
+        }
+
+
+# Global usage registry instance
+usage_registry = UsageRegistry()
 
 
 class TokenTracker:
@@ -32,22 +146,35 @@ class TokenTracker:
         self._lock = threading.Lock()
         self._on_update = on_update
 
-    def record(self, prompt_tokens: int, completion_tokens: int) -> None:
-        """Record tokens from a single LLM call."""
+    def record(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        provider: str | None = None,
+        seconds: float = 0.0,
+    ) -> None:
+        """Record tokens and latency of a single LLM call.
+
+        Args:
+            provider: Provider that served the call (defaults to the run's).
+            seconds: Wall time of the call.
+        """
         with self._lock:
-            self._usage.prompt_tokens += prompt_tokens
-            self._usage.completion_tokens += completion_tokens
-            self._usage.total_tokens += prompt_tokens + completion_tokens
-            self._usage.llm_calls += 1
+            self._usage.add(prompt_tokens, completion_tokens, seconds)
+        usage_registry.record(provider or self.provider, prompt_tokens, completion_tokens, seconds)
+        self._notify()
 
-        if self._on_update:
-            try:
-                self._on_update(self.snapshot())
-            except Exception:
-                pass
+    def record_cache_hit(self, prompt_tokens: int, completion_tokens: int) -> None:
+        """Record an LLM call answered from the completion cache."""
+        with self._lock:
+            self._usage.cache_hits += 1
+            self._usage.saved_tokens += prompt_tokens + completion_tokens
+        self._notify()
 
     def snapshot(self) -> dict[str, Any]:
         """Return current token usage as a dict for WS broadcasting."""
+        # Tokens of all runs on this provider: what counts against its TPM limit
+        provider_tpm = usage_registry.tokens_last_minute(self.provider)
         with self._lock:
             return {
                 "type": "token_usage",
@@ -57,5 +184,18 @@ class TokenTracker:
                 "completion_tokens": self._usage.completion_tokens,
                 "total_tokens": self._usage.total_tokens,
                 "llm_calls": self._usage.llm_calls,
+                "llm_seconds": round(self._usage.llm_seconds, 2),
+                "tokens_per_second": self._usage.tokens_per_second,
+                "cache_hits": self._usage.cache_hits,
+                "saved_tokens": self._usage.saved_tokens,
                 "tpm_limit": self.tpm_limit,
+                "provider_tpm": provider_tpm,
+                "tpm_headroom": self.tpm_limit - provider_tpm if self.tpm_limit else None,
             }
+
+    def _notify(self) -> None:
+        if self._on_update:
+            try:
+                self._on_update(self.snapshot())
+            except Exception:
+                pass
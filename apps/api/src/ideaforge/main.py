@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .agents.tools.economic_store import economic_store
 from .api.router import api_router
 from .api.ws.manager import ws_manager
 from .config import settings
+from .core.http_client import http_pool
+from .core.llm_cache import llm_cache
+from .core.response_cache import response_cache
+from .services.research_scheduler import research_scheduler
 
 logger = structlog.get_logger()
 
@@ -19,9 +25,15 @@ logger = structlog.get_logger()
 async def lifespan(app: FastAPI):
     """Application startup/shutdown lifecycle."""
     logger.info("Starting IdeaForge", debug=settings.debug)
+    economic_refresher = asyncio.create_task(economic_store.run_periodic_refresh())
     yield
     logger.info("Shutting down IdeaForge")
+    economic_refresher.cancel()
+    research_scheduler.shutdown()
     await ws_manager.disconnect_all()
+    await http_pool.aclose()
+    response_cache.close()
+    llm_cache.close()
 
 
 app = FastAPI(
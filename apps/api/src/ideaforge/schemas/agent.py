@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel
 
 
@@ -22,4 +24,7 @@ class AgentRunStatus(BaseModel):
     status: str
     duration_seconds: float | None = None
     result_summary: str | None = None
+    result_data: dict | None = None
     error_message: str | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
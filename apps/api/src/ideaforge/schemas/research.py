@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -14,6 +15,13 @@ class ResearchRequest(BaseModel):
         description="Список источников для исследования",
     )
     llm_provider: str = Field(default="groq", description="LLM провайдер")
+    mode: Literal["agents", "direct"] = Field(
+        default="agents",
+        description="agents — LLM-агент на каждый источник, direct — прямой вызов инструментов, LLM только для синтеза",
+    )
+    priority: int = Field(
+        default=0, ge=-10, le=10, description="Приоритет в очереди: больше — раньше",
+    )
 
 
 class ResearchRunResponse(BaseModel):
@@ -22,6 +30,10 @@ class ResearchRunResponse(BaseModel):
     query: str
     sources: list[str]
     llm_provider: str
+    mode: str
+    priority: int = 0
+    queue_position: int | None = None
+    eta_seconds: float | None = None
     created_at: datetime
 
 
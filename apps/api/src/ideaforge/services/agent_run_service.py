@@ -0,0 +1,54 @@
+"""Agent run service — persists per-agent timings of a research run."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import structlog
+
+from ..models.agent import AgentRun, AgentStatus
+from ..models.database import async_session
+
+if TYPE_CHECKING:
+    from ..agents.callbacks.ws_callback import AgentMetrics
+
+logger = structlog.get_logger()
+
+
+async def save_agent_runs(
+    run_id: str,
+    llm_provider: str,
+    metrics: list[AgentMetrics],
+) -> None:
+    """Store one `AgentRun` row per agent that took part in the run.
+
+    Agents still marked running (the run was cancelled or crashed) are
+    stored as failed. Database errors are logged, not raised.
+    """
+    if not metrics:
+        return
+
+    rows = []
+    for m in metrics:
+        status, error = m.status, m.error
+        if status in ("pending", "running"):
+            status, error = "failed", error or "Interrupted"
+        rows.append(AgentRun(
+            research_run_id=run_id,
+            agent_name=m.agent_name,
+            status=AgentStatus(status),
+            llm_provider=llm_provider,
+            result_summary=m.summary,
+            result_data=m.usage(),
+            error_message=error,
+            duration_seconds=m.duration_seconds,
+            started_at=m.started_at,
+            completed_at=m.completed_at,
+        ))
+
+    try:
+        async with async_session() as session:
+            session.add_all(rows)
+            await session.commit()
+    except Exception as e:
+        logger.warning("Could not save agent runs", run_id=run_id, error=str(e))
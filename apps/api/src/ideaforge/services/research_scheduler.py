@@ -0,0 +1,292 @@
+"""Research scheduler — queues research runs and starts them within capacity limits.
+
+Runs execute on a bounded thread pool: at most
+`settings.research_max_concurrent_runs` at once, and at most
+`max_concurrent_runs` per LLM provider (from `LLM_PROVIDERS`). Waiting runs
+are started by priority, then submission order; a run whose provider is
+at capacity doesn't hold back runs for other providers. Waiting clients get
+`research_queued` events with their position and a rough ETA.
+
+A run's slot is held until its crew thread has exited, not just its task:
+a cancelled crew keeps its pool thread until it notices the cancellation,
+and the next run must not queue up behind it inside the pool.
+
+All scheduler state is touched only from the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any
+
+import structlog
+
+from ..api.ws.events import research_cancelled, research_queued
+from ..api.ws.manager import ws_manager
+from ..config import LLM_PROVIDERS, settings
+from .research_service import run_research_pipeline
+
+logger = structlog.get_logger()
+
+# Assumed run duration until a provider has finished runs to average (seconds)
+DEFAULT_RUN_SECONDS = 180.0
+# Weight of the latest run in the moving average duration
+DURATION_ALPHA = 0.3
+
+
+class ResearchQueueFull(Exception):
+    """Raised when the queue already holds `research_queue_limit` runs."""
+
+
+@dataclass
+class ResearchJob:
+    run_id: str
+    query: str
+    sources: list[str]
+    llm_provider: str
+    mode: str
+    priority: int
+    seq: int
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    task: asyncio.Task | None = None
+    # Work the run submitted to the pool (the crew thread)
+    futures: list[Future] = field(default_factory=list)
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return (-self.priority, self.seq)
+
+
+class _JobExecutor(Executor):
+    """Submits to the shared pool and records the futures on the job."""
+
+    def __init__(self, pool: Executor, job: ResearchJob):
+        self._pool = pool
+        self._job = job
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        future = self._pool.submit(fn, *args, **kwargs)
+        self._job.futures.append(future)
+        return future
+
+
+class ResearchScheduler:
+    """Priority queue of research runs with global and per-provider concurrency caps."""
+
+    def __init__(self, max_running: int, max_queued: int):
+        self.max_running = max(1, max_running)
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_running, thread_name_prefix="research-run",
+        )
+        self._queued: dict[str, ResearchJob] = {}
+        # Running jobs: run_id -> job (the crew thread watches job.cancel_event)
+        self._active_runs: dict[str, ResearchJob] = {}
+        self._durations: dict[str, float] = {}
+        self._seq = count()
+        self._notifiers: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        run_id: str,
+        query: str,
+        sources: list[str],
+        llm_provider: str,
+        mode: str = "agents",
+        priority: int = 0,
+    ) -> ResearchJob:
+        """Queue a run and start it right away if there is capacity.
+
+        Raises:
+            ResearchQueueFull: too many runs are already waiting.
+        """
+        if len(self._queued) >= self.max_queued:
+            raise ResearchQueueFull(f"Research queue is full ({self.max_queued} runs waiting)")
+
+        job = ResearchJob(
+            run_id=run_id,
+            query=query,
+            sources=sources,
+            llm_provider=llm_provider,
+            mode=mode,
+            priority=priority,
+            seq=next(self._seq),
+        )
+        self._queued[run_id] = job
+        logger.info("Research queued", run_id=run_id, provider=llm_provider, priority=priority)
+        self._dispatch()
+        await self._broadcast_positions()
+        return job
+
+    async def cancel(self, run_id: str) -> bool:
+        """Cancel a waiting or running run. Returns True if the run was found."""
+        job = self._queued.pop(run_id, None)
+        if job is not None:
+            logger.info("Queued research cancelled", run_id=run_id)
+            await ws_manager.broadcast("research", research_cancelled(run_id))
+            await self._broadcast_positions()
+            return True
+
+        job = self._active_runs.get(run_id)
+        if job is None:
+            return False
+        # Signal the crew thread to stop, then cancel the pipeline task
+        job.cancel_event.set()
+        if job.task is not None:
+            job.task.cancel()
+        logger.info("Research cancelled by user", run_id=run_id)
+        return True
+
+    def position(self, run_id: str) -> int | None:
+        """1-based queue position of a waiting run, None if it isn't waiting."""
+        for i, job in enumerate(self._waiting(), start=1):
+            if job.run_id == run_id:
+                return i
+        return None
+
+    def eta(self, job: ResearchJob) -> float:
+        """Rough seconds until a waiting run starts.
+
+        Assumes runs ahead of it (running or queued, overall and for its
+        provider) finish in waves of the available slots, each taking the
+        provider's average run duration.
+        """
+        waiting = self._waiting()
+        ahead = waiting[:waiting.index(job)] if job in waiting else waiting
+        avg = self._durations.get(job.llm_provider, DEFAULT_RUN_SECONDS)
+
+        total_ahead = len(self._active_runs) + len(ahead)
+        same_ahead = sum(
+            1 for other in [*self._active_runs.values(), *ahead]
+            if other.llm_provider == job.llm_provider
+        )
+        waves = max(
+            total_ahead // self.max_running,
+            same_ahead // self._provider_cap(job.llm_provider),
+        )
+        return round(waves * avg, 1)
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "max_running": self.max_running,
+            "max_queued": self.max_queued,
+            "running": [
+                {
+                    "run_id": job.run_id,
+                    "llm_provider": job.llm_provider,
+                    "elapsed_seconds": round(now - (job.started_at or now), 1),
+                }
+                for job in self._active_runs.values()
+            ],
+            "queued": [
+                {
+                    "run_id": job.run_id,
+                    "llm_provider": job.llm_provider,
+                    "priority": job.priority,
+                    "waiting_seconds": round(now - job.submitted_at, 1),
+                }
+                for job in self._waiting()
+            ],
+            "avg_run_seconds": {p: round(d, 1) for p, d in self._durations.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Cancel everything and stop the worker pool (app shutdown)."""
+        self._queued.clear()
+        for job in self._active_runs.values():
+            job.cancel_event.set()
+            if job.task is not None:
+                job.task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _waiting(self) -> list[ResearchJob]:
+        return sorted(self._queued.values(), key=lambda job: job.sort_key)
+
+    def _provider_cap(self, provider: str) -> int:
+        cap = LLM_PROVIDERS.get(provider, {}).get("max_concurrent_runs") or self.max_running
+        return max(1, min(cap, self.max_running))
+
+    def _dispatch(self) -> None:
+        """Start waiting runs, highest priority first, while slots are free."""
+        running_by_provider: dict[str, int] = {}
+        for job in self._active_runs.values():
+            running_by_provider[job.llm_provider] = running_by_provider.get(job.llm_provider, 0) + 1
+
+        for job in self._waiting():
+            if len(self._active_runs) >= self.max_running:
+                break
+            if running_by_provider.get(job.llm_provider, 0) >= self._provider_cap(job.llm_provider):
+                continue
+            del self._queued[job.run_id]
+            self._active_runs[job.run_id] = job
+            running_by_provider[job.llm_provider] = running_by_provider.get(job.llm_provider, 0) + 1
+            job.started_at = time.monotonic()
+            job.task = asyncio.create_task(self._run(job), name=f"research-{job.run_id}")
+            job.task.add_done_callback(lambda _, job=job: self._finished(job))
+            logger.info(
+                "Research dispatched",
+                run_id=job.run_id,
+                waited=round(job.started_at - job.submitted_at, 1),
+            )
+
+    async def _run(self, job: ResearchJob) -> None:
+        await run_research_pipeline(
+            run_id=job.run_id,
+            query=job.query,
+            sources=job.sources,
+            llm_provider=job.llm_provider,
+            mode=job.mode,
+            cancel_event=job.cancel_event,
+            executor=_JobExecutor(self._executor, job),
+        )
+
+    def _finished(self, job: ResearchJob) -> None:
+        """Done callback of a job's task (also runs if it was cancelled before starting)."""
+        pending = [f for f in job.futures if not f.done()]
+        if pending:
+            # Cancelled while the crew thread still runs: free the slot once it exits
+            threads = asyncio.gather(
+                *(asyncio.wrap_future(f) for f in pending), return_exceptions=True,
+            )
+            threads.add_done_callback(lambda _: self._release(job))
+            return
+        self._release(job)
+
+    def _release(self, job: ResearchJob) -> None:
+        """Free a finished job's slot and start waiting runs."""
+        self._active_runs.pop(job.run_id, None)
+        if not job.cancel_event.is_set():
+            self._record_duration(job.llm_provider, time.monotonic() - job.started_at)
+        self._dispatch()
+        if self._queued:
+            notifier = asyncio.create_task(self._broadcast_positions())
+            self._notifiers.add(notifier)
+            notifier.add_done_callback(self._notifiers.discard)
+
+    def _record_duration(self, provider: str, seconds: float) -> None:
+        previous = self._durations.get(provider)
+        self._durations[provider] = (
+            seconds if previous is None
+            else DURATION_ALPHA * seconds + (1 - DURATION_ALPHA) * previous
+        )
+
+    async def _broadcast_positions(self) -> None:
+        for position, job in enumerate(self._waiting(), start=1):
+            await ws_manager.broadcast(
+                "research", research_queued(job.run_id, position, self.eta(job)),
+            )
+
+
+# Global research scheduler instance
+research_scheduler = ResearchScheduler(
+    max_running=settings.research_max_concurrent_runs,
+    max_queued=settings.research_queue_limit,
+)
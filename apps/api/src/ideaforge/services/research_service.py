@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from typing import Any
+from concurrent.futures import Executor
 
 import structlog
 
@@ -15,29 +15,23 @@ from ..models.idea import BusinessIdea, IdeaStatus
 
 logger = structlog.get_logger()
 
-# Active research runs: run_id -> (asyncio.Task, threading.Event)
-_active_runs: dict[str, tuple[asyncio.Task, threading.Event]] = {}
-
 
 async def run_research_pipeline(
     run_id: str,
     query: str,
     sources: list[str],
     llm_provider: str,
+    mode: str = "agents",
+    cancel_event: threading.Event | None = None,
+    executor: Executor | None = None,
 ) -> None:
     """Full research pipeline: run agents -> parse results -> save to DB.
 
-    Runs as a background task from the API endpoint.
+    Started by the research scheduler, which owns `cancel_event` and the
+    `executor` the crew runs on.
     """
     logger.info("Research pipeline started", run_id=run_id, query=query)
 
-    cancel_event = threading.Event()
-
-    # Store this task so it can be cancelled
-    current_task = asyncio.current_task()
-    if current_task:
-        _active_runs[run_id] = (current_task, cancel_event)
-
     try:
         # Run the research crew (blocking, so wrap in thread)
         ideas = await coordinator.run_research(
@@ -45,7 +39,9 @@ async def run_research_pipeline(
             query=query,
             sources=sources,
             llm_provider=llm_provider,
+            mode=mode,
             cancel_event=cancel_event,
+            executor=executor,
         )
 
         logger.info("Research pipeline completed", run_id=run_id, ideas_count=len(ideas))
@@ -69,25 +65,3 @@ async def run_research_pipeline(
             "run_id": run_id,
             "error": str(e),
         })
-
-    finally:
-        _active_runs.pop(run_id, None)
-
-
-async def cancel_research(run_id: str) -> bool:
-    """Cancel a running research pipeline.
-
-    Returns True if the run was found and cancelled.
-    """
-    entry = _active_runs.get(run_id)
-    if not entry:
-        return False
-
-    task, cancel_event = entry
-    # Signal the crew thread to stop
-    cancel_event.set()
-    # Cancel the async task
-    task.cancel()
-
-    logger.info("Research cancelled by user", run_id=run_id)
-    return True
@@ -36,7 +36,20 @@ export default function ResearchPage() {
       setWsConnected(connected);
     });
 
-    client.on("research_started", () => {
+    client.on("research_queued", (data) => {
+      const d = data as { run_id: string; position: number; eta_seconds: number | null };
+      const run = useResearchStore.getState().currentRun;
+      if (run && run.run_id === d.run_id) {
+        setCurrentRun({ ...run, status: "queued", queue_position: d.position, eta_seconds: d.eta_seconds });
+      }
+    });
+
+    client.on("research_started", (data) => {
+      const d = data as { run_id?: string };
+      const run = useResearchStore.getState().currentRun;
+      if (run && run.run_id === d.run_id) {
+        setCurrentRun({ ...run, status: "started", queue_position: null, eta_seconds: null });
+      }
       setStartTime(Date.now());
     });
 
@@ -56,7 +69,7 @@ export default function ResearchPage() {
       updateAgentStatus({
         agent_name: d.agent_name,
         status: "completed",
-        duration_seconds: null,
+        duration_seconds: (data as { duration_seconds?: number }).duration_seconds ?? null,
         result_summary: d.summary ?? null,
         error_message: null,
       });
@@ -67,7 +80,7 @@ export default function ResearchPage() {
       updateAgentStatus({
         agent_name: d.agent_name,
         status: "failed",
-        duration_seconds: null,
+        duration_seconds: (data as { duration_seconds?: number }).duration_seconds ?? null,
         result_summary: null,
         error_message: d.error ?? "Ошибка агента",
       });
@@ -154,6 +167,13 @@ export default function ResearchPage() {
       {(currentRun || isLoading || error) && (
         <div className="mt-8">
           <h2 className="text-lg font-semibold mb-4">Активность агентов</h2>
+          {currentRun?.queue_position != null && (
+            <p className="mb-3 text-sm text-[var(--muted-foreground)]">
+              В очереди: позиция {currentRun.queue_position}
+              {currentRun.eta_seconds != null &&
+                ` · старт примерно через ${Math.max(1, Math.round(currentRun.eta_seconds / 60))} мин`}
+            </p>
+          )}
           <AgentActivityFeed
             researchStartTime={startTime}
             wsConnected={wsConnected}
@@ -32,10 +32,15 @@ export function TokenUsageWidget() {
   const total = tokenUsage?.total_tokens ?? 0;
   const limit = tokenUsage?.tpm_limit ?? null;
   const calls = tokenUsage?.llm_calls ?? 0;
+  // The TPM limit is shared by all runs on the provider, so compare it to their last-minute usage
+  const minuteTokens = tokenUsage?.provider_tpm ?? total;
+  const tokensPerSecond = tokenUsage?.tokens_per_second ?? null;
+  const cacheHits = tokenUsage?.cache_hits ?? 0;
+  const saved = tokenUsage?.saved_tokens ?? 0;
   const provider = tokenUsage?.provider ?? "";
-  const status = getRateStatus(total, limit);
+  const status = getRateStatus(minuteTokens, limit);
   const config = statusConfig[status];
-  const percentage = limit ? Math.min((total / limit) * 100, 100) : 0;
+  const percentage = limit ? Math.min((minuteTokens / limit) * 100, 100) : 0;
 
   if (!tokenUsage) return null;
 
@@ -68,13 +73,22 @@ export function TokenUsageWidget() {
 
       <div className="flex items-center justify-between text-xs text-[var(--muted-foreground)]">
         <span className="tabular-nums">
-          {formatNumber(total)} {limit ? `/ ${formatNumber(limit)} TPM` : "токенов"}
+          {limit
+            ? `${formatNumber(minuteTokens)} / ${formatNumber(limit)} TPM · ${formatNumber(total)} токенов`
+            : `${formatNumber(total)} токенов`}
         </span>
         <span className="tabular-nums">
           {calls} {calls === 1 ? "вызов" : "вызовов"} LLM
+          {tokensPerSecond !== null && ` · ${tokensPerSecond} ток/с`}
         </span>
       </div>
 
+      {cacheHits > 0 && (
+        <div className="mt-1 text-xs text-[var(--muted-foreground)] tabular-nums">
+          Из кэша: {cacheHits} {cacheHits === 1 ? "ответ" : "ответов"}, сэкономлено {formatNumber(saved)} токенов
+        </div>
+      )}
+
       {provider && (
         <div className="mt-1 text-xs text-[var(--muted-foreground)] opacity-70">
           {provider}
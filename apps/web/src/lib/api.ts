@@ -13,7 +13,7 @@ async function fetchApi<T>(path: string, options?: RequestInit): Promise<T> {
 
 // Research
 export const api = {
-  startResearch: (data: { query: string; sources: string[]; llm_provider: string }) =>
+  startResearch: (data: { query: string; sources: string[]; llm_provider: string; mode?: "agents" | "direct"; priority?: number }) =>
     fetchApi("/research", { method: "POST", body: JSON.stringify(data) }),
 
   getIdeas: (skip = 0, limit = 20) =>
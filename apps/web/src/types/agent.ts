@@ -15,5 +15,19 @@ export interface AgentRunStatus {
   status: "pending" | "running" | "completed" | "failed";
   duration_seconds: number | null;
   result_summary: string | null;
+  result_data?: AgentRunMetrics | null;
   error_message: string | null;
+  started_at?: string | null;
+  completed_at?: string | null;
+}
+
+export interface AgentRunMetrics {
+  duration_seconds: number | null;
+  llm_calls: number;
+  prompt_tokens: number;
+  completion_tokens: number;
+  total_tokens: number;
+  steps: number;
+  tool_calls: number;
+  tool_seconds: number;
 }
@@ -2,14 +2,24 @@ export interface ResearchRequest {
   query: string;
   sources: string[];
   llm_provider: string;
+  mode?: ResearchMode;
+  priority?: number;
 }
 
+// "agents": one LLM agent per source; "direct": tools are called without an LLM
+export type ResearchMode = "agents" | "direct";
+
 export interface ResearchRun {
   run_id: string;
   status: string;
   query: string;
   sources: string[];
   llm_provider: string;
+  mode: ResearchMode;
+  priority?: number;
+  // Set while the run waits in the scheduler queue
+  queue_position?: number | null;
+  eta_seconds?: number | null;
   created_at: string;
 }
 
@@ -41,5 +51,12 @@ export interface TokenUsageEvent {
   completion_tokens: number;
   total_tokens: number;
   llm_calls: number;
+  llm_seconds?: number;
+  tokens_per_second?: number | null;
+  cache_hits?: number;
+  saved_tokens?: number;
   tpm_limit: number | null;
+  /** Tokens all runs spent on the provider in the last minute */
+  provider_tpm?: number;
+  tpm_headroom?: number | null;
 }